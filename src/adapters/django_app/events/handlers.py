@@ -404,10 +404,9 @@ def check_overdue_tickets(self) -> int:
     
     try:
         # Importação tardia para evitar circular import
-        from src.config.container import get_container
+        from src.adapters.django_app.tickets._services import provider
         
-        container = get_container()
-        listar_service = container.services.listar_tickets_service()
+        listar_service = provider('listar_tickets_service')()
         
         # Buscar todos os tickets
         tickets = listar_service.execute()
@@ -452,10 +451,9 @@ def generate_daily_report(self) -> Dict[str, Any]:
     logger.info("[SCHEDULED] Gerando relatório diário...")
     
     try:
-        from src.config.container import get_container
+        from src.adapters.django_app.tickets._services import provider
         
-        container = get_container()
-        contar_service = container.services.contar_tickets_service()
+        contar_service = provider('contar_tickets_service')()
         
         estatisticas = contar_service.execute()
         
@@ -0,0 +1,52 @@
+"""
+Middleware de publicação de eventos em lote por request.
+
+Abre o buffer de RequestBufferedEventPublisher no início do request e,
+ao final, entrega todos os eventos acumulados em um publish_batch por
+publisher (um group no Celery): N commits no request viram uma única
+rajada ao broker, em vez de um round-trip por evento.
+
+Configuração (settings.MIDDLEWARE):
+    'src.adapters.django_app.events.middleware.EventBatchMiddleware'
+"""
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+
+from .publishers import begin_request_buffer, end_request_buffer, publish_buffered
+
+
+class EventBatchMiddleware:
+    """
+    Publica os eventos do request de uma vez, após a resposta.
+    
+    Funciona sob WSGI e ASGI; no caminho async a publicação roda em
+    thread (sync_to_async) para não bloquear o event loop.
+    """
+    
+    sync_capable = True
+    async_capable = True
+    
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self._is_async = iscoroutinefunction(get_response)
+        if self._is_async:
+            markcoroutinefunction(self)
+    
+    def __call__(self, request):
+        if self._is_async:
+            return self.__acall__(request)
+        
+        token = begin_request_buffer()
+        try:
+            return self.get_response(request)
+        finally:
+            publish_buffered(end_request_buffer(token))
+    
+    async def __acall__(self, request):
+        token = begin_request_buffer()
+        try:
+            return await self.get_response(request)
+        finally:
+            buffered = end_request_buffer(token)
+            if buffered:
+                await sync_to_async(publish_buffered)(buffered)
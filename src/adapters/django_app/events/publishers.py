@@ -6,20 +6,43 @@ Implementações:
 - LoggingEventPublisher: Apenas loga (desenvolvimento)
 - CeleryEventPublisher: Publica via Celery (produção)
 - InMemoryEventPublisher: Para testes
+- RequestBufferedEventPublisher: Acumula eventos do request e publica
+  em lote no fim (ver EventBatchMiddleware)
 
 Padrão Observer/Pub-Sub para desacoplamento.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Callable, Dict, Any, Optional
+from contextvars import ContextVar, Token
+from typing import List, Callable, Dict, Any, Optional, Tuple
 import logging
-import json
+
+import orjson
 
 from src.core.shared.events import DomainEvent
 
 logger = logging.getLogger(__name__)
 
 
+def _dispatch_batch_to_celery(events: List[DomainEvent]) -> None:
+    """
+    Envia eventos ao dispatcher do Celery em um único group.
+    
+    O group publica todas as mensagens pela mesma conexão/canal do
+    producer, em vez de um round-trip ao broker por evento.
+    
+    Args:
+        events: Eventos a despachar
+    """
+    from celery import group
+    from src.adapters.django_app.events.handlers import dispatch_domain_event
+    
+    group(
+        dispatch_domain_event.s(event.event_type, event.to_dict())
+        for event in events
+    ).apply_async()
+
+
 class EventPublisher(ABC):
     """
     Interface abstrata para publicadores de eventos.
@@ -42,6 +65,11 @@ class EventPublisher(ABC):
         """
         Publica múltiplos eventos.
         
+        Caminho usado pelo Unit of Work (uma chamada por commit).
+        Implementações com broker devem publicar o lote de uma vez (um
+        group do Celery, mesma conexão/canal), e não repetir publish()
+        com um round-trip por evento.
+        
         Args:
             events: Lista de eventos a publicar
         """
@@ -75,14 +103,7 @@ class LoggingEventPublisher(EventPublisher):
         Args:
             event: Evento a publicar
         """
-        event_data = event.to_dict()
-        
-        logger.log(
-            self._log_level,
-            f"[EVENT] {event.event_type} | "
-            f"aggregate={event.aggregate_id} | "
-            f"data={json.dumps(event_data, default=str)}"
-        )
+        self._log_event(event)
         
         # Despachar para Celery se configurado
         if self._dispatch_to_celery:
@@ -92,9 +113,29 @@ class LoggingEventPublisher(EventPublisher):
         self._dispatch_to_handlers(event)
     
     def publish_batch(self, events: List[DomainEvent]) -> None:
-        """Loga múltiplos eventos."""
+        """Loga múltiplos eventos; despacho ao Celery em um único group."""
         for event in events:
-            self.publish(event)
+            self._log_event(event)
+        
+        if self._dispatch_to_celery and events:
+            try:
+                _dispatch_batch_to_celery(events)
+            except Exception as e:
+                logger.warning(f"Falha ao despachar lote para Celery: {e}")
+        
+        for event in events:
+            self._dispatch_to_handlers(event)
+    
+    def _log_event(self, event: DomainEvent) -> None:
+        """Loga evento com seus dados (serializa só se o nível está ativo)."""
+        if not logger.isEnabledFor(self._log_level):
+            return
+        logger.log(
+            self._log_level,
+            f"[EVENT] {event.event_type} | "
+            f"aggregate={event.aggregate_id} | "
+            f"data={orjson.dumps(event.to_dict(), default=str).decode()}"
+        )
     
     def _dispatch_to_celery_handler(self, event: DomainEvent) -> None:
         """Despacha evento para Celery."""
@@ -163,9 +204,17 @@ class CeleryEventPublisher(EventPublisher):
             # Em caso de falha, não quebra o fluxo principal
     
     def publish_batch(self, events: List[DomainEvent]) -> None:
-        """Publica múltiplos eventos via Celery."""
-        for event in events:
-            self.publish(event)
+        """Publica múltiplos eventos via Celery em um único group."""
+        if not events:
+            return
+        
+        if self._also_log:
+            logger.info(f"[EVENT->CELERY] batch de {len(events)} eventos")
+        
+        try:
+            _dispatch_batch_to_celery(events)
+        except Exception as e:
+            logger.error(f"Falha ao publicar lote no Celery: {e}", exc_info=True)
 
 
 class InMemoryEventPublisher(EventPublisher):
@@ -223,6 +272,98 @@ class InMemoryEventPublisher(EventPublisher):
                 logger.error(f"Erro em handler de teste: {e}")
 
 
+# Buffer do request atual: pares (publisher de destino, evento). None
+# fora de um request com EventBatchMiddleware (publicação imediata).
+_request_buffer: ContextVar[Optional[List[Tuple[EventPublisher, DomainEvent]]]] = (
+    ContextVar('event_request_buffer', default=None)
+)
+
+
+def begin_request_buffer() -> Token:
+    """
+    Abre o buffer de eventos do request atual.
+    
+    Returns:
+        Token para end_request_buffer()
+    """
+    return _request_buffer.set([])
+
+
+def end_request_buffer(token: Token) -> List[Tuple[EventPublisher, DomainEvent]]:
+    """
+    Fecha o buffer do request.
+    
+    Deve rodar no mesmo contexto de begin_request_buffer(); a
+    publicação fica com publish_buffered() (que pode rodar em thread).
+    
+    Args:
+        token: Token retornado por begin_request_buffer()
+        
+    Returns:
+        Pares (publisher, evento) acumulados, na ordem de publicação
+    """
+    buffered = _request_buffer.get() or []
+    _request_buffer.reset(token)
+    return buffered
+
+
+def publish_buffered(buffered: List[Tuple[EventPublisher, DomainEvent]]) -> None:
+    """
+    Publica o que o request acumulou: um publish_batch por publisher.
+    
+    Args:
+        buffered: Retorno de end_request_buffer()
+    """
+    batches: Dict[int, Tuple[EventPublisher, List[DomainEvent]]] = {}
+    for publisher, event in buffered:
+        batches.setdefault(id(publisher), (publisher, []))[1].append(event)
+    
+    for publisher, events in batches.values():
+        try:
+            publisher.publish_batch(events)
+        except Exception as e:
+            logger.error(
+                f"Erro ao publicar lote do request em "
+                f"{publisher.__class__.__name__}: {e}"
+            )
+
+
+class RequestBufferedEventPublisher(EventPublisher):
+    """
+    Publisher que adia a publicação para o fim do request.
+    
+    Dentro de um request com EventBatchMiddleware, os eventos de todos
+    os commits do request são acumulados e entregues ao publisher
+    interno em um único publish_batch. Fora de request (tasks Celery,
+    management commands) publica imediatamente.
+    """
+    
+    def __init__(self, inner: EventPublisher):
+        """
+        Inicializa publisher.
+        
+        Args:
+            inner: Publisher que recebe os eventos de fato
+        """
+        self._inner = inner
+    
+    def publish(self, event: DomainEvent) -> None:
+        """Acumula no buffer do request ou publica direto."""
+        buffered = _request_buffer.get()
+        if buffered is None:
+            self._inner.publish(event)
+        else:
+            buffered.append((self._inner, event))
+    
+    def publish_batch(self, events: List[DomainEvent]) -> None:
+        """Acumula no buffer do request ou publica direto em lote."""
+        buffered = _request_buffer.get()
+        if buffered is None:
+            self._inner.publish_batch(events)
+        else:
+            buffered.extend((self._inner, event) for event in events)
+
+
 class CompositeEventPublisher(EventPublisher):
     """
     Publisher que delega para múltiplos publishers.
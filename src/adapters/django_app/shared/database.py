@@ -46,9 +46,14 @@ class DatabaseConfig:
     port: int = 5432
     
     # Opções de conexão
-    conn_max_age: int = 60  # Connection pooling (segundos)
+    conn_max_age: int = 600  # Conexões persistentes (segundos)
+    conn_health_checks: bool = True
     connect_timeout: int = 10
     
+    # psycopg3: PREPARE após N execuções (0 = na primeira; None desliga -
+    # PgBouncer transaction mode). Exige server_side_binding, ligado junto.
+    prepare_threshold: Optional[int] = 5
+    
     # Opções avançadas
     options: Dict[str, Any] = field(default_factory=dict)
     
@@ -157,8 +162,19 @@ class DatabaseConfig:
                 "HOST": self.host,
                 "PORT": str(self.port),
                 "CONN_MAX_AGE": self.conn_max_age,
+                "CONN_HEALTH_CHECKS": self.conn_health_checks,
                 "OPTIONS": {
                     "connect_timeout": self.connect_timeout,
+                    **(
+                        {
+                            # Sem server-side binding o Django usa
+                            # ClientCursor, que nunca prepara
+                            "server_side_binding": self.prepare_threshold is not None,
+                            "prepare_threshold": self.prepare_threshold,
+                        }
+                        if self.engine == "postgresql"
+                        else {}
+                    ),
                     **self.options,
                 },
             })
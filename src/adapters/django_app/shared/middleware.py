@@ -0,0 +1,58 @@
+"""
+Middlewares compartilhados entre os apps.
+
+- HealthCheckMiddleware: responde /health/ antes do resto da pilha
+
+Configuração (settings.MIDDLEWARE, primeira posição):
+    'src.adapters.django_app.shared.middleware.HealthCheckMiddleware'
+"""
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.http import HttpResponse
+
+
+# Path do health check e corpo pré-serializado (sem JSON por request)
+HEALTH_PATH = '/health/'
+HEALTH_METHODS = ('GET', 'HEAD')
+_HEALTH_BODY = b'{"status":"ok"}'
+
+
+def _health_response() -> HttpResponse:
+    """Resposta do health check (nova a cada request)."""
+    return HttpResponse(_HEALTH_BODY, content_type='application/json')
+
+
+class HealthCheckMiddleware:
+    """
+    Responde o health check sem passar pelo URL resolver.
+    
+    Probes (k8s/load balancer) batem a cada poucos segundos; aqui o
+    request para no primeiro middleware, sem sessão, auth, resolução
+    de URL nem view. Deve ser o primeiro de MIDDLEWARE (antes do
+    SecurityMiddleware, para que probes HTTP não sejam redirecionados).
+    
+    Só GET/HEAD são respondidos aqui; outros métodos em /health/ seguem
+    a pilha normal (SecurityMiddleware, CSRF, 405 do resolver).
+    """
+    
+    sync_capable = True
+    async_capable = True
+    
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self._is_async = iscoroutinefunction(get_response)
+        if self._is_async:
+            markcoroutinefunction(self)
+    
+    def __call__(self, request):
+        if self._is_async:
+            return self.__acall__(request)
+
+        if request.path == HEALTH_PATH and request.method in HEALTH_METHODS:
+            return _health_response()
+        return self.get_response(request)
+    
+    async def __acall__(self, request):
+        if request.path == HEALTH_PATH and request.method in HEALTH_METHODS:
+            return _health_response()
+        return await self.get_response(request)
@@ -22,15 +22,18 @@ Escalabilidade:
 - Preparado para distributed transactions (futuro)
 """
 
-from typing import List, Optional, Callable
+from typing import TYPE_CHECKING, List, Optional
 from contextlib import contextmanager
 import logging
 
-from django.db import transaction, connection
+from django.db import transaction
 
 from src.core.shared.interfaces import UnitOfWork
 from src.core.shared.events import DomainEvent
 
+if TYPE_CHECKING:
+    from src.core.shared.interfaces import EventPublisher, EventStore
+
 logger = logging.getLogger(__name__)
 
 
@@ -41,6 +44,10 @@ class DjangoUnitOfWork(UnitOfWork):
     Usa django.db.transaction para gerenciar transações PostgreSQL.
     Eventos são publicados apenas após commit bem-sucedido.
     
+    A transação é um bloco transaction.atomic() aberto em __enter__:
+    callbacks de transaction.on_commit rodam após o commit do UoW, e um
+    UoW aberto dentro de outro (ou de um atomic) vira savepoint.
+    
     Features:
     - Context manager (with statement)
     - Auto-commit/rollback
@@ -81,19 +88,22 @@ class DjangoUnitOfWork(UnitOfWork):
         self._event_publisher = event_publisher
         self._event_store = event_store
         self._auto_commit = auto_commit
+        self._atomic = None
         self._transaction_started = False
         self._committed = False
         self._rolled_back = False
-        self._sequence_counters = {}  # aggregate_id -> sequence
     
     def _begin_transaction(self) -> None:
         """
         Inicia transação PostgreSQL.
         
-        Desabilita auto-commit para controle manual.
+        Abre um bloco atomic (e não set_autocommit(False)): assim
+        transaction.on_commit funciona para quem escreve dentro do UoW,
+        e um UoW aninhado vira savepoint.
         """
         if not self._transaction_started:
-            transaction.set_autocommit(False)
+            self._atomic = transaction.atomic()
+            self._atomic.__enter__()
             self._transaction_started = True
             logger.debug("Transaction started")
     
@@ -119,9 +129,11 @@ class DjangoUnitOfWork(UnitOfWork):
             if self._event_store and self._events:
                 self._persist_events()
             
-            # 2. Commit da transação
+            # 2. Commit da transação (roda os callbacks de on_commit; se
+            # o COMMIT falhar, o próprio atomic já desfaz)
             if self._transaction_started:
-                transaction.commit()
+                self._transaction_started = False
+                self._atomic.__exit__(None, None, None)
                 logger.debug("Transaction committed")
             
             self._committed = True
@@ -135,7 +147,7 @@ class DjangoUnitOfWork(UnitOfWork):
             self.rollback()
             raise
         finally:
-            # 4. Restaurar auto-commit
+            # 4. Liberar o bloco atomic
             self._finalize()
     
     def rollback(self) -> None:
@@ -149,7 +161,9 @@ class DjangoUnitOfWork(UnitOfWork):
         
         try:
             if self._transaction_started:
-                transaction.rollback()
+                self._transaction_started = False
+                transaction.set_rollback(True)
+                self._atomic.__exit__(None, None, None)
                 logger.debug("Transaction rolled back")
         except Exception as e:
             logger.error(f"Rollback failed: {e}")
@@ -159,24 +173,14 @@ class DjangoUnitOfWork(UnitOfWork):
             self._finalize()
     
     def _finalize(self) -> None:
-        """Restaura estado da conexão."""
-        if self._transaction_started:
-            try:
-                transaction.set_autocommit(True)
-            except Exception:
-                pass
-            self._transaction_started = False
+        """Descarta o bloco atomic já encerrado."""
+        self._atomic = None
+        self._transaction_started = False
     
     def _persist_events(self) -> None:
-        """Persiste eventos no Event Store."""
-        for event in self._events:
-            # Obter sequência para o agregado
-            sequence = self._get_next_sequence(event.aggregate_id)
-            
-            self._event_store.append(
-                event=event,
-                sequence=sequence,
-            )
+        """Persiste eventos no Event Store (um append_batch por commit)."""
+        # Sequência por agregado atribuída pelo store
+        self._event_store.append_batch(list(self._events))
     
     def _publish_events(self) -> None:
         """
@@ -185,33 +189,22 @@ class DjangoUnitOfWork(UnitOfWork):
         Eventos só são publicados após commit bem-sucedido.
         Se event_publisher não estiver configurado, apenas loga.
         """
-        for event in self._events:
-            logger.info(
-                f"Publishing event: {event.event_type} "
-                f"for aggregate {event.aggregate_id}"
-            )
-            
-            if self._event_publisher:
-                try:
-                    self._event_publisher.publish(event)
-                except Exception as e:
-                    # Log mas não falha - eventos podem ser reprocessados
-                    logger.error(f"Failed to publish event: {e}")
+        if logger.isEnabledFor(logging.INFO):
+            for event in self._events:
+                logger.info(
+                    f"Publishing event: {event.event_type} "
+                    f"for aggregate {event.aggregate_id}"
+                )
         
-        self.clear_events()
-    
-    def _get_next_sequence(self, aggregate_id: str) -> int:
-        """
-        Obtém próximo número de sequência para um agregado.
-        
-        Usado para ordenação de eventos no Event Store.
-        """
-        if aggregate_id not in self._sequence_counters:
-            # Buscar última sequência do banco (se Event Store configurado)
-            self._sequence_counters[aggregate_id] = 0
+        if self._event_publisher:
+            try:
+                # Um publish_batch por commit (um group no Celery)
+                self._event_publisher.publish_batch(list(self._events))
+            except Exception as e:
+                # Log mas não falha - eventos podem ser reprocessados
+                logger.error(f"Failed to publish events: {e}")
         
-        self._sequence_counters[aggregate_id] += 1
-        return self._sequence_counters[aggregate_id]
+        self.clear_events()
     
     @property
     def is_committed(self) -> bool:
@@ -0,0 +1,106 @@
+"""
+Acesso cacheado aos providers de services do container de DI.
+
+Views (HTML e API) resolvem o provider de cada use case uma única vez
+por container, em vez de refazer a busca de atributos a cada request.
+
+Guarda os providers, não as instâncias: services de escrita continuam
+criando uma instância nova por chamada, com seu próprio Unit of Work
+(os de leitura são Singletons no container).
+
+Example:
+    from ._services import ServiceProvider, provider
+
+    class MinhaView(ContainerMixin, View):
+        listar_tickets_service = ServiceProvider()
+
+        def get(self, request):
+            service = self.listar_tickets_service()
+
+    service = provider('listar_tickets_service')()
+"""
+
+import functools
+from typing import Any, Optional
+
+from django.core.exceptions import ImproperlyConfigured
+
+from src.config.container import get_container
+
+
+# Providers de services expostos às views
+SERVICE_NAMES = (
+    'criar_ticket_service',
+    'atribuir_ticket_service',
+    'fechar_ticket_service',
+    'reabrir_ticket_service',
+    'alterar_prioridade_service',
+    'listar_tickets_service',
+    'obter_ticket_service',
+    'contar_tickets_service',
+)
+
+
+def provider(service_name: str, container: Optional[Any] = None) -> Any:
+    """
+    Retorna o provider de um service, resolvido uma vez por nome.
+
+    Caminho quente das views (get_service): uma consulta ao lru_cache
+    por request, sem atravessar container.services.
+
+    Args:
+        service_name: Nome do provider em container.services
+        container: Container de DI (default: get_container())
+
+    Returns:
+        Provider (Factory) do service; chamar para obter a instância
+
+    Raises:
+        AttributeError: Se o container não tem o service
+    """
+    if container is None:
+        container = get_container()
+    return _provider(container, service_name)
+
+
+# Um provider por nome de SERVICE_NAMES (com folga para um reset_container).
+# reset_container() cria um container novo, o que invalida o cache
+# naturalmente (a chave inclui a própria instância).
+@functools.lru_cache(maxsize=2 * len(SERVICE_NAMES))
+def _provider(container: Any, service_name: str) -> Any:
+    """Resolve um provider por (container, nome)."""
+    return getattr(container.services, service_name)
+
+
+class ServiceProvider:
+    """
+    Descriptor que liga um provider de service à classe da view.
+
+    Declarado como atributo de classe com o nome do service; o nome é
+    validado contra SERVICE_NAMES na definição da classe (erro de
+    digitação falha no import, não no request). Na instância, devolve o
+    provider do container da view (view.get_container()).
+
+    Example:
+        listar_tickets_service = ServiceProvider()
+        ...
+        service = self.listar_tickets_service()
+    """
+
+    def __init__(self, service_name: Optional[str] = None):
+        self.service_name = service_name
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        if self.service_name is None:
+            self.service_name = name
+        if self.service_name not in SERVICE_NAMES:
+            raise ImproperlyConfigured(
+                f"{owner.__name__}.{name}: service desconhecido "
+                f"'{self.service_name}'"
+            )
+
+    def __get__(self, view: Any, owner: type) -> Any:
+        if view is None:
+            return self
+        # Direto no lru_cache: um frame Python a menos por resolução
+        return _provider(view.get_container(), self.service_name)
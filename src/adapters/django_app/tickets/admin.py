@@ -8,7 +8,12 @@ from django.contrib import admin
 from django.utils.html import format_html
 from django.utils import timezone
 
-from .models import TicketModel, TicketHistoryModel, DomainEventModel
+from .models import (
+    TicketModel,
+    TicketHistoryModel,
+    DomainEventModel,
+    TicketStatusChoices,
+)
 
 
 @admin.register(TicketModel)
@@ -82,12 +87,13 @@ class TicketAdmin(admin.ModelAdmin):
             'Resolvido': '#28a745',
             'Fechado': '#343a40',
         }
-        color = colors.get(obj.status, '#6c757d')
+        label = obj.get_status_display()
+        color = colors.get(label, '#6c757d')
         return format_html(
             '<span style="background-color: {}; color: white; padding: 3px 8px; '
             'border-radius: 3px; font-size: 11px;">{}</span>',
             color,
-            obj.status
+            label
         )
     status_badge.short_description = 'Status'
     
@@ -99,12 +105,13 @@ class TicketAdmin(admin.ModelAdmin):
             'Alta': '#fd7e14',
             'Crítica': '#dc3545',
         }
-        color = colors.get(obj.prioridade, '#6c757d')
+        label = obj.get_prioridade_display()
+        color = colors.get(label, '#6c757d')
         return format_html(
             '<span style="background-color: {}; color: white; padding: 3px 8px; '
             'border-radius: 3px; font-size: 11px;">{}</span>',
             color,
-            obj.prioridade
+            label
         )
     prioridade_badge.short_description = 'Prioridade'
     
@@ -113,7 +120,7 @@ class TicketAdmin(admin.ModelAdmin):
         if not obj.sla_prazo:
             return '-'
         
-        if obj.status == 'Fechado':
+        if obj.status == TicketStatusChoices.FECHADO:
             return format_html(
                 '<span style="color: #28a745;">✓ Fechado</span>'
             )
@@ -196,6 +203,7 @@ class DomainEventAdmin(admin.ModelAdmin):
     ]
     
     readonly_fields = [
+        'sequence_id',
         'event_id',
         'event_type',
         'aggregate_type',
@@ -212,7 +220,7 @@ class DomainEventAdmin(admin.ModelAdmin):
     
     def event_id_curto(self, obj):
         """Exibe ID do evento curto."""
-        return obj.event_id[:8] + '...'
+        return str(obj.event_id)[:8] + '...'
     event_id_curto.short_description = 'Event ID'
     
     def aggregate_id_curto(self, obj):
@@ -21,13 +21,14 @@ Autenticação:
 - Session (atual)
 """
 
-import json
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 from functools import wraps
 
+import orjson
+from asgiref.sync import sync_to_async
 from django.views import View
-from django.http import JsonResponse, HttpRequest
+from django.http import HttpRequest, HttpResponse, JsonResponse
 from django.utils.decorators import method_decorator
 from django.views.decorators.csrf import csrf_exempt
 
@@ -45,6 +46,8 @@ from src.core.shared.exceptions import (
 )
 from src.config.container import get_container
 
+from ._services import ServiceProvider, provider
+
 logger = logging.getLogger(__name__)
 
 
@@ -81,6 +84,46 @@ def json_response(success: bool, data: Any = None, error: str = None,
     return JsonResponse(response, status=status)
 
 
+def _json_default(obj: Any) -> Any:
+    """
+    Fallback do orjson para tipos que ele não serializa nativamente.
+    
+    DTOs dataclass nem passam por aqui (orjson percorre os campos e
+    formata datetimes direto); objetos com to_dict() usam o dict e o
+    resto vira str.
+    """
+    to_dict = getattr(obj, 'to_dict', None)
+    if to_dict is not None:
+        return to_dict()
+    return str(obj)
+
+
+def json_list_response(items: List[Any], meta: Dict = None) -> HttpResponse:
+    """
+    Cria resposta JSON de listagem.
+    
+    Mesmo formato de json_response ({success, data, meta}), mas o corpo
+    sai de um único orjson.dumps, sem montar a lista de dicts: a página
+    já está em memória, e um StreamingHttpResponse com gerador síncrono
+    seria bufferizado inteiro sob ASGI de qualquer forma.
+    
+    Args:
+        items: DTOs dataclass (serializados direto pelo orjson, sem
+            to_dict()) ou objetos com to_dict()
+        meta: Metadados adicionais
+        
+    Returns:
+        HttpResponse com application/json
+    """
+    body = {'success': True, 'data': items}
+    if meta is not None:
+        body['meta'] = meta
+    return HttpResponse(
+        orjson.dumps(body, default=_json_default),
+        content_type='application/json',
+    )
+
+
 def parse_json_body(request: HttpRequest) -> Dict:
     """
     Parseia body JSON do request.
@@ -98,8 +141,9 @@ def parse_json_body(request: HttpRequest) -> Dict:
         return {}
     
     try:
-        return json.loads(request.body)
-    except json.JSONDecodeError as e:
+        # orjson lê direto os bytes do body (sem decode para str)
+        return orjson.loads(request.body)
+    except orjson.JSONDecodeError as e:
         raise ValueError(f"JSON inválido: {e}")
 
 
@@ -131,8 +175,8 @@ class BaseAPIView(View):
     
     def get_service(self, service_name: str):
         """Obtém service do container."""
-        container = self.get_container()
-        return getattr(container.services, service_name)()
+        # Providers resolvidos uma vez por container (ver _services)
+        return provider(service_name, self.get_container())()
     
     def parse_body(self, request: HttpRequest) -> Dict:
         """Parseia body JSON."""
@@ -200,56 +244,67 @@ class BaseAPIView(View):
 
 class TicketAPIListView(BaseAPIView):
     """
-    API para listar e criar tickets.
+    API para listar e criar tickets (view async).
     
     GET /tickets/api/ - Lista tickets
     POST /tickets/api/ - Cria ticket
+    
+    Sob ASGI a espera pelo banco não prende um worker. Use cases
+    síncronos rodam via sync_to_async.
     """
     
-    def get(self, request: HttpRequest) -> JsonResponse:
+    listar_tickets_service = ServiceProvider()
+    criar_ticket_service = ServiceProvider()
+    
+    async def get(self, request: HttpRequest) -> HttpResponse:
         """
         Lista tickets com filtros opcionais.
         
         Query params:
         - status: Filtrar por status
-        - prioridade: Filtrar por prioridade
+        - prioridade: Filtrar por prioridade (desconhecida: lista vazia)
         - criador_id: Filtrar por criador
         - tecnico_id: Filtrar por técnico
-        - page: Página (default: 1)
+        - page: Página (default: 1; além da última: lista vazia)
         - per_page: Itens por página (default: 20)
         """
         try:
-            listar_service = self.get_service('listar_tickets_service')
+            listar_service = self.listar_tickets_service()
             
             # Extrair filtros
-            status = request.GET.get('status') or None
-            criador_id = request.GET.get('criador_id') or None
-            tecnico_id = request.GET.get('tecnico_id') or None
-            
-            # Executar query
-            tickets = listar_service.execute(
-                status=status,
-                criador_id=criador_id,
-                tecnico_id=tecnico_id,
-            )
-            
-            # Filtrar por prioridade (se necessário)
-            prioridade = request.GET.get('prioridade')
-            if prioridade:
-                tickets = [t for t in tickets if t.prioridade == prioridade]
+            filtros = {
+                name: request.GET.get(name) or None
+                for name in ('status', 'prioridade', 'criador_id', 'tecnico_id')
+            }
             
-            # Paginação simples
+            # Paginação (sem ajuste: página além da última volta vazia)
             page = int(request.GET.get('page', 1))
             per_page = int(request.GET.get('per_page', 20))
+            if page < 1:
+                raise ValidationError("page deve ser >= 1", field="page")
+            if per_page < 1:
+                raise ValidationError("per_page deve ser >= 1", field="per_page")
+            
+            # Só a página pedida sai do banco (LIMIT/OFFSET); o total vem
+            # do mesmo aggregate, sem carregar a listagem inteira. completo:
+            # o JSON expõe o TicketOutputDTO inteiro (descricao, tags)
+            try:
+                tickets, estatisticas = await sync_to_async(
+                    listar_service.execute_com_estatisticas
+                )(
+                    **filtros, pagina=page, por_pagina=per_page,
+                    limitar_pagina=False, completo=True,
+                )
+            except ValidationError as e:
+                # Prioridade desconhecida não casa com nenhum ticket
+                if e.field != 'prioridade':
+                    raise
+                tickets, estatisticas = [], {'filtrados': 0}
             
-            total = len(tickets)
-            start = (page - 1) * per_page
-            end = start + per_page
-            paginated = tickets[start:end]
+            total = estatisticas['filtrados']
             
-            return json_response(
-                success=True,
-                data=[t.to_dict() for t in paginated],
+            return json_list_response(
+                tickets,
                 meta={
                     'total': total,
                     'page': page,
@@ -261,7 +316,11 @@ class TicketAPIListView(BaseAPIView):
         except Exception as e:
             return self.handle_exception(e)
     
-    def post(self, request: HttpRequest) -> JsonResponse:
+    async def post(self, request: HttpRequest) -> JsonResponse:
+        """Cria novo ticket (ver _post)."""
+        return await sync_to_async(self._post)(request)
+    
+    def _post(self, request: HttpRequest) -> JsonResponse:
         """
         Cria novo ticket.
         
@@ -277,7 +336,7 @@ class TicketAPIListView(BaseAPIView):
         try:
             data = self.parse_body(request)
             
-            criar_service = self.get_service('criar_ticket_service')
+            criar_service = self.criar_ticket_service()
             
             input_dto = CriarTicketInputDTO(
                 titulo=data.get('titulo', ''),
@@ -304,18 +363,21 @@ class TicketAPIListView(BaseAPIView):
 
 class TicketAPIDetailView(BaseAPIView):
     """
-    API para operações em ticket específico.
+    API para operações em ticket específico (view async).
     
     GET /tickets/api/<id>/ - Obter ticket
     PATCH /tickets/api/<id>/ - Atualizar ticket
     DELETE /tickets/api/<id>/ - Deletar ticket (futuro)
     """
     
-    def get(self, request: HttpRequest, pk: str) -> JsonResponse:
-        """Obtém detalhes do ticket."""
+    obter_ticket_service = ServiceProvider()
+    alterar_prioridade_service = ServiceProvider()
+    
+    async def get(self, request: HttpRequest, pk: str) -> JsonResponse:
+        """Obtém detalhes do ticket (ORM assíncrono)."""
         try:
-            obter_service = self.get_service('obter_ticket_service')
-            ticket = obter_service.execute(pk)
+            obter_service = self.obter_ticket_service()
+            ticket = await obter_service.aexecute(pk)
             
             return json_response(
                 success=True,
@@ -325,7 +387,11 @@ class TicketAPIDetailView(BaseAPIView):
         except Exception as e:
             return self.handle_exception(e)
     
-    def patch(self, request: HttpRequest, pk: str) -> JsonResponse:
+    async def patch(self, request: HttpRequest, pk: str) -> JsonResponse:
+        """Atualiza ticket parcialmente (ver _patch)."""
+        return await sync_to_async(self._patch)(request, pk)
+    
+    def _patch(self, request: HttpRequest, pk: str) -> JsonResponse:
         """
         Atualiza ticket parcialmente.
         
@@ -339,7 +405,7 @@ class TicketAPIDetailView(BaseAPIView):
             
             # Por enquanto, apenas prioridade pode ser alterada via PATCH
             if 'prioridade' in data:
-                alterar_service = self.get_service('alterar_prioridade_service')
+                alterar_service = self.alterar_prioridade_service()
                 
                 input_dto = AlterarPrioridadeInputDTO(
                     ticket_id=pk,
@@ -372,6 +438,8 @@ class TicketAPIAtribuirView(BaseAPIView):
     POST /tickets/api/<id>/atribuir/
     """
     
+    atribuir_ticket_service = ServiceProvider()
+    
     def post(self, request: HttpRequest, pk: str) -> JsonResponse:
         """
         Atribui ticket a técnico.
@@ -391,7 +459,7 @@ class TicketAPIAtribuirView(BaseAPIView):
                     status=400
                 )
             
-            atribuir_service = self.get_service('atribuir_ticket_service')
+            atribuir_service = self.atribuir_ticket_service()
             
             input_dto = AtribuirTicketInputDTO(
                 ticket_id=pk,
@@ -419,6 +487,8 @@ class TicketAPIFecharView(BaseAPIView):
     POST /tickets/api/<id>/fechar/
     """
     
+    fechar_ticket_service = ServiceProvider()
+    
     def post(self, request: HttpRequest, pk: str) -> JsonResponse:
         """
         Fecha ticket.
@@ -431,7 +501,7 @@ class TicketAPIFecharView(BaseAPIView):
         try:
             data = self.parse_body(request)
             
-            fechar_service = self.get_service('fechar_ticket_service')
+            fechar_service = self.fechar_ticket_service()
             
             input_dto = FecharTicketInputDTO(
                 ticket_id=pk,
@@ -459,6 +529,8 @@ class TicketAPIReabrirView(BaseAPIView):
     POST /tickets/api/<id>/reabrir/
     """
     
+    reabrir_ticket_service = ServiceProvider()
+    
     def post(self, request: HttpRequest, pk: str) -> JsonResponse:
         """
         Reabre ticket.
@@ -471,7 +543,7 @@ class TicketAPIReabrirView(BaseAPIView):
         try:
             data = self.parse_body(request)
             
-            reabrir_service = self.get_service('reabrir_ticket_service')
+            reabrir_service = self.reabrir_ticket_service()
             
             output = reabrir_service.execute(
                 ticket_id=pk,
@@ -497,10 +569,12 @@ class TicketAPIEstatisticasView(BaseAPIView):
     GET /tickets/api/estatisticas/
     """
     
+    contar_tickets_service = ServiceProvider()
+    
     def get(self, request: HttpRequest) -> JsonResponse:
         """Retorna estatísticas de tickets."""
         try:
-            contar_service = self.get_service('contar_tickets_service')
+            contar_service = self.contar_tickets_service()
             estatisticas = contar_service.execute()
             
             return json_response(
@@ -20,12 +20,17 @@ class TicketsConfig(AppConfig):
         Executado quando o app está pronto.
         
         Configura:
-        - Dependency Injection wiring
+        - Container de DI (criado e aquecido no startup)
         - Signal handlers
         """
         # Importar signals (quando implementados)
         # from . import signals
         
+        # Container criado aqui, não no primeiro request: repository,
+        # event store e publisher já saem instanciados e cada resolução
+        # nas views só encontra o Singleton preenchido
+        from src.config.container import get_container
+        get_container()
+        
         # Nota: O wiring do dependency-injector será configurado
         # no container quando necessário usar @inject em views
-        pass
@@ -18,7 +18,7 @@ Princípios:
 from django import forms
 from django.core.exceptions import ValidationError
 
-from .models import TicketPriorityChoices
+from .models import TicketPriorityChoices, USER_ID_MAX_LENGTH
 
 
 class TicketCreateForm(forms.Form):
@@ -122,7 +122,7 @@ class TicketAtribuirForm(forms.Form):
     
     tecnico_id = forms.CharField(
         label='Técnico',
-        max_length=100,
+        max_length=USER_ID_MAX_LENGTH,
         widget=forms.TextInput(attrs={
             'class': 'form-control',
             'placeholder': 'ID do técnico...',
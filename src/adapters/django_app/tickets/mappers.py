@@ -17,6 +17,7 @@ Por que Mappers separados?
 - Facilita migração para outro ORM/banco
 """
 
+import sys
 from datetime import datetime
 from typing import Optional, List
 
@@ -31,9 +32,19 @@ from .models import (
     TicketModel,
     TicketHistoryModel,
     DomainEventModel,
+    TicketStatusChoices,
+    TicketPriorityChoices,
 )
 
 
+# Enum do Core <-> código SMALLINT do banco (label da choice == value do enum)
+_STATUS_TO_DB = {TicketStatus(c.label): c.value for c in TicketStatusChoices}
+_STATUS_FROM_DB = {code: status for status, code in _STATUS_TO_DB.items()}
+
+_PRIORITY_TO_DB = {TicketPriority(c.label): c.value for c in TicketPriorityChoices}
+_PRIORITY_FROM_DB = {code: prio for prio, code in _PRIORITY_TO_DB.items()}
+
+
 class TicketMapper:
     """
     Mapper para conversão entre TicketEntity e TicketModel.
@@ -65,8 +76,8 @@ class TicketMapper:
             titulo=entity.titulo,
             descricao=entity.descricao,
             categoria=entity.categoria,
-            status=entity.status.value,
-            prioridade=entity.prioridade.value,
+            status=_STATUS_TO_DB[entity.status],
+            prioridade=_PRIORITY_TO_DB[entity.prioridade],
             criador_id=entity.criador_id,
             atribuido_a_id=entity.atribuido_a_id,
             criado_em=entity.criado_em,
@@ -90,26 +101,38 @@ class TicketMapper:
             
         Note:
             Bypassa validações do factory method .criar()
-            pois dados já foram validados na criação original
+            pois dados já foram validados na criação original.
+            Aceita models parciais (.only()): descricao e tags adiados
+            viram "" e [] - não persistir entidades carregadas assim.
         """
-        # Converter strings para Enums
-        status = TicketStatus(model.status)
-        prioridade = TicketPriority(model.prioridade)
+        # Converter códigos do banco para Enums
+        status = _STATUS_FROM_DB[model.status]
+        prioridade = _PRIORITY_FROM_DB[model.prioridade]
+        
+        # Campos adiados via .only()/.defer() não são lidos (evita 1 query
+        # por linha); ficam vazios na entidade de listagem
+        deferred = model.get_deferred_fields()
+        descricao = '' if 'descricao' in deferred else model.descricao
+        tags = [] if 'tags' in deferred or not model.tags else list(model.tags)
         
         # Criar entity diretamente (sem validações - dados já validados)
         entity = TicketEntity(
             id=model.id,
             titulo=model.titulo,
-            descricao=model.descricao,
+            descricao=descricao,
             categoria=model.categoria,
             status=status,
             prioridade=prioridade,
-            criador_id=model.criador_id,
-            atribuido_a_id=model.atribuido_a_id,
+            # IDs de usuário se repetem muito entre linhas: sys.intern faz as
+            # entidades compartilharem a mesma str em vez de uma cópia por linha
+            criador_id=sys.intern(model.criador_id),
+            atribuido_a_id=(
+                sys.intern(model.atribuido_a_id) if model.atribuido_a_id else None
+            ),
             criado_em=model.criado_em,
             atualizado_em=model.atualizado_em,
             sla_prazo=model.sla_prazo,
-            tags=list(model.tags) if model.tags else [],
+            tags=tags,
         )
         
         return entity
@@ -127,6 +150,59 @@ class TicketMapper:
         """
         return [TicketMapper.to_entity(model) for model in models]
     
+    @staticmethod
+    def to_list_dict(row: dict) -> dict:
+        """
+        Converte linha de .values() (projeção de listagem) para dict.
+        
+        Caminho rápido sem instanciar Model nem Entity.
+        
+        Args:
+            row: Dict retornado por QuerySet.values()
+            
+        Returns:
+            Dict com status/prioridade como valores do Core
+        """
+        row['status'] = _STATUS_FROM_DB[row['status']].value
+        row['prioridade'] = _PRIORITY_FROM_DB[row['prioridade']].value
+        return row
+    
+    @staticmethod
+    def status_to_db(status) -> int:
+        """
+        Converte status do Core (enum ou valor string) para código do banco.
+        
+        Args:
+            status: TicketStatus ou valor como "Aberto"
+            
+        Returns:
+            Código SMALLINT persistido
+        """
+        return _STATUS_TO_DB[TicketStatus(status)]
+    
+    @staticmethod
+    def status_from_db(code: int) -> TicketStatus:
+        """Converte código do banco para TicketStatus."""
+        return _STATUS_FROM_DB[code]
+    
+    @staticmethod
+    def prioridade_to_db(prioridade) -> int:
+        """
+        Converte prioridade do Core (enum ou valor string) para código do banco.
+        
+        Args:
+            prioridade: TicketPriority ou valor como "Alta"
+            
+        Returns:
+            Código SMALLINT persistido
+        """
+        return _PRIORITY_TO_DB[TicketPriority(prioridade)]
+    
+    @staticmethod
+    def prioridade_from_db(code: int) -> TicketPriority:
+        """Converte código do banco para TicketPriority."""
+        return _PRIORITY_FROM_DB[code]
+    
     @staticmethod
     def update_model(model: TicketModel, entity: TicketEntity) -> TicketModel:
         """
@@ -144,8 +220,8 @@ class TicketMapper:
         model.titulo = entity.titulo
         model.descricao = entity.descricao
         model.categoria = entity.categoria
-        model.status = entity.status.value
-        model.prioridade = entity.prioridade.value
+        model.status = _STATUS_TO_DB[entity.status]
+        model.prioridade = _PRIORITY_TO_DB[entity.prioridade]
         model.atribuido_a_id = entity.atribuido_a_id
         model.atualizado_em = entity.atualizado_em
         model.sla_prazo = entity.sla_prazo
@@ -0,0 +1,55 @@
+"""
+Troca a PK do Event Store por uma sequência monotônica.
+
+- domain_events.event_id: deixa de ser PK (UUID aleatório espalha os
+  inserts pelo B-tree) e passa a ser UUID com índice único
+- domain_events.sequence_id: nova PK BIGINT auto-incremento; mantém os
+  inserts append-only no fim do índice e serve de ordenação global
+"""
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """PK sequencial para domain_events."""
+
+    dependencies = [
+        ('tickets', '0001_initial'),
+    ]
+
+    operations = [
+        # =================================================================
+        # Tabela: domain_events
+        # =================================================================
+        # 1. Rebaixar event_id para índice único (remove a PK antiga)
+        migrations.AlterField(
+            model_name='domaineventmodel',
+            name='event_id',
+            field=models.UUIDField(
+                unique=True,
+                db_index=True,
+                help_text='UUID único do evento'
+            ),
+        ),
+
+        # 2. Nova PK sequencial (preenche linhas existentes na ordem física)
+        migrations.AddField(
+            model_name='domaineventmodel',
+            name='sequence_id',
+            field=models.BigAutoField(
+                primary_key=True,
+                serialize=False,
+                help_text='Sequência global de gravação (ordenação entre agregados)'
+            ),
+            preserve_default=False,
+        ),
+
+        migrations.AlterModelOptions(
+            name='domaineventmodel',
+            options={
+                'verbose_name': 'Evento de Domínio',
+                'verbose_name_plural': 'Eventos de Domínio',
+                'ordering': ['sequence_id'],
+            },
+        ),
+    ]
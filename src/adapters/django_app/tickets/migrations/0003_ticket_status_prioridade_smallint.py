@@ -0,0 +1,161 @@
+"""
+Converte tickets.status e tickets.prioridade de VARCHAR para SMALLINT.
+
+Cada linha (e cada entrada dos índices compostos) passa a guardar
+2 bytes em vez do texto completo do status/prioridade.
+
+Passos:
+1. Remove os índices compostos que usam as colunas antigas
+2. Cria colunas inteiras temporárias e preenche via CASE
+3. Remove as colunas texto e renomeia as novas
+4. Recria os índices compostos sobre as colunas inteiras
+"""
+
+from django.db import migrations, models
+
+
+STATUS_CHOICES = [
+    (1, 'Aberto'),
+    (2, 'Em Progresso'),
+    (3, 'Aguardando Cliente'),
+    (4, 'Resolvido'),
+    (5, 'Fechado'),
+]
+
+PRIORITY_CHOICES = [
+    (1, 'Baixa'),
+    (2, 'Média'),
+    (3, 'Alta'),
+    (4, 'Crítica'),
+]
+
+
+def _case_to_code(column, choices):
+    """Monta CASE texto -> código."""
+    whens = ' '.join(f"WHEN '{label}' THEN {code}" for code, label in choices)
+    return f"CASE {column} {whens} END"
+
+
+def _case_to_label(column, choices):
+    """Monta CASE código -> texto (reverse)."""
+    whens = ' '.join(f"WHEN {code} THEN '{label}'" for code, label in choices)
+    return f"CASE {column} {whens} END"
+
+
+class Migration(migrations.Migration):
+    """Status/prioridade como SMALLINT."""
+
+    dependencies = [
+        ('tickets', '0002_domain_event_sequence_pk'),
+    ]
+
+    operations = [
+        # =================================================================
+        # 1. Índices compostos sobre as colunas texto
+        # =================================================================
+        migrations.RemoveIndex(
+            model_name='ticketmodel',
+            name='idx_ticket_status_criado',
+        ),
+        migrations.RemoveIndex(
+            model_name='ticketmodel',
+            name='idx_ticket_tecnico_status',
+        ),
+        migrations.RemoveIndex(
+            model_name='ticketmodel',
+            name='idx_ticket_prio_sla',
+        ),
+
+        # =================================================================
+        # 2. Colunas inteiras temporárias + cópia dos dados
+        # =================================================================
+        migrations.AddField(
+            model_name='ticketmodel',
+            name='status_code',
+            field=models.SmallIntegerField(null=True),
+        ),
+        migrations.AddField(
+            model_name='ticketmodel',
+            name='prioridade_code',
+            field=models.SmallIntegerField(null=True),
+        ),
+        migrations.RunSQL(
+            sql=(
+                "UPDATE tickets SET "
+                f"status_code = {_case_to_code('status', STATUS_CHOICES)}, "
+                f"prioridade_code = {_case_to_code('prioridade', PRIORITY_CHOICES)}"
+            ),
+            reverse_sql=(
+                "UPDATE tickets SET "
+                f"status = {_case_to_label('status_code', STATUS_CHOICES)}, "
+                f"prioridade = {_case_to_label('prioridade_code', PRIORITY_CHOICES)}"
+            ),
+        ),
+
+        # =================================================================
+        # 3. Troca das colunas
+        # =================================================================
+        migrations.RemoveField(
+            model_name='ticketmodel',
+            name='status',
+        ),
+        migrations.RemoveField(
+            model_name='ticketmodel',
+            name='prioridade',
+        ),
+        migrations.RenameField(
+            model_name='ticketmodel',
+            old_name='status_code',
+            new_name='status',
+        ),
+        migrations.RenameField(
+            model_name='ticketmodel',
+            old_name='prioridade_code',
+            new_name='prioridade',
+        ),
+        migrations.AlterField(
+            model_name='ticketmodel',
+            name='status',
+            field=models.SmallIntegerField(
+                choices=STATUS_CHOICES,
+                default=1,
+                db_index=True,
+                help_text='Estado atual do ticket'
+            ),
+        ),
+        migrations.AlterField(
+            model_name='ticketmodel',
+            name='prioridade',
+            field=models.SmallIntegerField(
+                choices=PRIORITY_CHOICES,
+                default=2,
+                db_index=True,
+                help_text='Nível de prioridade'
+            ),
+        ),
+
+        # =================================================================
+        # 4. Índices compostos sobre as colunas inteiras
+        # =================================================================
+        migrations.AddIndex(
+            model_name='ticketmodel',
+            index=models.Index(
+                fields=['status', 'criado_em'],
+                name='idx_ticket_status_criado'
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='ticketmodel',
+            index=models.Index(
+                fields=['atribuido_a_id', 'status'],
+                name='idx_ticket_tecnico_status'
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='ticketmodel',
+            index=models.Index(
+                fields=['prioridade', 'sla_prazo'],
+                name='idx_ticket_prio_sla'
+            ),
+        ),
+    ]
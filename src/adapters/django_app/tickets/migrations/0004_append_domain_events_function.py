@@ -0,0 +1,107 @@
+"""
+Função PL/pgSQL append_domain_events(jsonb) para o Event Store.
+
+Faz todo o append de um commit em um único round-trip:
+- pg_advisory_xact_lock por agregado (ordem fixa, sem deadlock)
+- leitura do high-water mark de sequência de cada agregado
+- INSERT multi-linha via jsonb_to_recordset
+- pg_notify('domain_events', <último sequence_id>)
+
+Apenas PostgreSQL; em outros bancos a migration não faz nada e o
+DjangoEventStore usa o caminho via ORM.
+"""
+
+from django.db import migrations
+
+
+CREATE_FUNCTION_SQL = """
+    CREATE OR REPLACE FUNCTION append_domain_events(events jsonb)
+    RETURNS bigint AS $$
+    DECLARE
+        agg text;
+        last_id bigint;
+    BEGIN
+        -- Lock por agregado, em ordem fixa (evita deadlock entre batches)
+        FOR agg IN
+            SELECT DISTINCT e->>'aggregate_id'
+            FROM jsonb_array_elements(events) AS e
+            ORDER BY 1
+        LOOP
+            PERFORM pg_advisory_xact_lock(hashtext(agg));
+        END LOOP;
+
+        WITH x AS (
+            SELECT *
+            FROM ROWS FROM (
+                jsonb_to_recordset(events) AS (
+                    event_id uuid,
+                    event_type varchar,
+                    aggregate_type varchar,
+                    aggregate_id varchar,
+                    event_data jsonb,
+                    version integer,
+                    occurred_at timestamptz,
+                    correlation_id varchar,
+                    causation_id varchar,
+                    user_id varchar
+                )
+            ) WITH ORDINALITY AS r
+        ),
+        -- High-water mark de sequência por agregado (lido sob o lock)
+        hw AS (
+            SELECT d.aggregate_id, max(d.sequence) AS last_seq
+            FROM domain_events d
+            WHERE d.aggregate_id IN (SELECT aggregate_id FROM x)
+            GROUP BY d.aggregate_id
+        ),
+        ins AS (
+            INSERT INTO domain_events (
+                event_id, event_type, aggregate_type, aggregate_id,
+                event_data, version, sequence, occurred_at, recorded_at,
+                correlation_id, causation_id, user_id
+            )
+            SELECT
+                x.event_id, x.event_type, x.aggregate_type, x.aggregate_id,
+                x.event_data, x.version,
+                COALESCE(hw.last_seq, 0)
+                    + row_number() OVER (PARTITION BY x.aggregate_id ORDER BY x.ordinality),
+                x.occurred_at, now(),
+                x.correlation_id, x.causation_id, x.user_id
+            FROM x
+            LEFT JOIN hw ON hw.aggregate_id = x.aggregate_id
+            ORDER BY x.ordinality
+            RETURNING sequence_id
+        )
+        SELECT max(sequence_id) INTO last_id FROM ins;
+
+        PERFORM pg_notify('domain_events', last_id::text);
+        RETURN last_id;
+    END;
+    $$ LANGUAGE plpgsql;
+"""
+
+DROP_FUNCTION_SQL = "DROP FUNCTION IF EXISTS append_domain_events(jsonb);"
+
+
+def create_function(apps, schema_editor):
+    """Cria a função (apenas PostgreSQL)."""
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(CREATE_FUNCTION_SQL)
+
+
+def drop_function(apps, schema_editor):
+    """Remove a função (apenas PostgreSQL)."""
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(DROP_FUNCTION_SQL)
+
+
+class Migration(migrations.Migration):
+    """Append de eventos server-side."""
+
+    dependencies = [
+        ('tickets', '0003_ticket_status_prioridade_smallint'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_function, drop_function),
+    ]
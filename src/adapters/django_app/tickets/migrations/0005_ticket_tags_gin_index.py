@@ -0,0 +1,55 @@
+"""
+Índice GIN (jsonb_path_ops) em tickets.tags.
+
+Acelera filtros por tag (tags__contains=['bug'] -> tags @> '["bug"]').
+jsonb_path_ops só atende containment, mas gera um índice menor.
+
+O índice só existe no PostgreSQL; nos demais bancos apenas o estado
+do model é atualizado.
+"""
+
+from django.contrib.postgres.indexes import GinIndex
+from django.db import migrations
+
+
+TAGS_INDEX = GinIndex(
+    fields=['tags'],
+    name='gin_ticket_tags',
+    opclasses=['jsonb_path_ops'],
+)
+
+
+def create_index(apps, schema_editor):
+    """Cria o índice GIN (apenas PostgreSQL)."""
+    if schema_editor.connection.vendor == 'postgresql':
+        model = apps.get_model('tickets', 'TicketModel')
+        schema_editor.add_index(model, TAGS_INDEX)
+
+
+def drop_index(apps, schema_editor):
+    """Remove o índice GIN (apenas PostgreSQL)."""
+    if schema_editor.connection.vendor == 'postgresql':
+        model = apps.get_model('tickets', 'TicketModel')
+        schema_editor.remove_index(model, TAGS_INDEX)
+
+
+class Migration(migrations.Migration):
+    """GIN em tags."""
+
+    dependencies = [
+        ('tickets', '0004_append_domain_events_function'),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddIndex(
+                    model_name='ticketmodel',
+                    index=TAGS_INDEX,
+                ),
+            ],
+            database_operations=[
+                migrations.RunPython(create_index, drop_index),
+            ],
+        ),
+    ]
@@ -0,0 +1,76 @@
+"""
+Colunas de ID de usuário com COLLATE "C" (PostgreSQL).
+
+Colunas:
+- tickets.criador_id / tickets.atribuido_a_id
+- ticket_history.user_id
+- domain_events.user_id
+
+IDs de usuário são opacos e só comparados por igualdade; collation "C"
+compara byte a byte, sem regras de locale, nos índices compostos
+(atribuido_a_id, status) e (criador_id, criado_em).
+
+O tamanho continua VARCHAR(100): nenhuma linha existente é truncada ou
+rejeitada. UserIdField só emite o COLLATE no PostgreSQL; nos demais
+bancos as colunas não mudam.
+"""
+
+from django.db import migrations
+
+import src.adapters.django_app.tickets.models
+
+
+class Migration(migrations.Migration):
+    """IDs de usuário com collation "C"."""
+
+    dependencies = [
+        ('tickets', '0005_ticket_tags_gin_index'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='ticketmodel',
+            name='criador_id',
+            field=src.adapters.django_app.tickets.models.UserIdField(
+                max_length=100,
+                db_collation='C',
+                db_index=True,
+                help_text='ID do usuário criador'
+            ),
+        ),
+        migrations.AlterField(
+            model_name='ticketmodel',
+            name='atribuido_a_id',
+            field=src.adapters.django_app.tickets.models.UserIdField(
+                max_length=100,
+                db_collation='C',
+                null=True,
+                blank=True,
+                db_index=True,
+                help_text='ID do técnico responsável'
+            ),
+        ),
+        migrations.AlterField(
+            model_name='tickethistorymodel',
+            name='user_id',
+            field=src.adapters.django_app.tickets.models.UserIdField(
+                max_length=100,
+                db_collation='C',
+                null=True,
+                blank=True,
+                help_text='Usuário que causou o evento'
+            ),
+        ),
+        migrations.AlterField(
+            model_name='domaineventmodel',
+            name='user_id',
+            field=src.adapters.django_app.tickets.models.UserIdField(
+                max_length=100,
+                db_collation='C',
+                null=True,
+                blank=True,
+                db_index=True,
+                help_text='Usuário que iniciou a ação'
+            ),
+        ),
+    ]
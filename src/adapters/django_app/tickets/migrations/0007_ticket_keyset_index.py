@@ -0,0 +1,26 @@
+"""
+Índice (criado_em DESC, id DESC) em tickets.
+
+Atende a paginação por keyset de list_paginated: o banco posiciona
+no cursor (criado_em, id) e lê per_page + 1 entradas, sem OFFSET.
+"""
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """Índice para keyset pagination."""
+
+    dependencies = [
+        ('tickets', '0006_user_id_columns_collation_c'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='ticketmodel',
+            index=models.Index(
+                fields=['-criado_em', '-id'],
+                name='idx_ticket_criado_id'
+            ),
+        ),
+    ]
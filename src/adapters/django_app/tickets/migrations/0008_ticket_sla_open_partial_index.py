@@ -0,0 +1,30 @@
+"""
+Índice parcial em tickets.sla_prazo para tickets em aberto.
+
+Atende list_atrasados / apenas_atrasados / get_estatisticas:
+`sla_prazo < now() AND status IN (Aberto, Em Progresso, Aguardando
+Cliente)`. Só as linhas em aberto entram no índice, então a busca
+percorre apenas tickets abertos e vencidos.
+"""
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """Índice parcial de SLA."""
+
+    dependencies = [
+        ('tickets', '0007_ticket_keyset_index'),
+    ]
+
+    operations = [
+        # Códigos de TicketStatusChoices: ABERTO, EM_PROGRESSO, AGUARDANDO_CLIENTE
+        migrations.AddIndex(
+            model_name='ticketmodel',
+            index=models.Index(
+                condition=models.Q(status__in=(1, 2, 3)),
+                fields=['sla_prazo'],
+                name='tix_sla_open_idx'
+            ),
+        ),
+    ]
@@ -17,25 +17,66 @@ Relacionamentos:
 
 from django.db import models
 from django.contrib.auth import get_user_model
+from django.contrib.postgres.indexes import GinIndex
 from django.utils import timezone
 import uuid
 
 
-class TicketStatusChoices(models.TextChoices):
-    """Choices para status de ticket (espelha TicketStatus do Core)."""
-    ABERTO = 'Aberto', 'Aberto'
-    EM_PROGRESSO = 'Em Progresso', 'Em Progresso'
-    AGUARDANDO_CLIENTE = 'Aguardando Cliente', 'Aguardando Cliente'
-    RESOLVIDO = 'Resolvido', 'Resolvido'
-    FECHADO = 'Fechado', 'Fechado'
+# IDs de usuário são opacos (str(user.pk), "anonymous", IdP externo), sem
+# validação de tamanho na API: o limite continua 100. Collation "C"
+# (comparação byte a byte, sem regras de locale) deixa as comparações nos
+# índices compostos mais baratas.
+USER_ID_MAX_LENGTH = 100
+USER_ID_COLLATION = 'C'
 
 
-class TicketPriorityChoices(models.TextChoices):
-    """Choices para prioridade de ticket (espelha TicketPriority do Core)."""
-    BAIXA = 'Baixa', 'Baixa'
-    MEDIA = 'Média', 'Média'
-    ALTA = 'Alta', 'Alta'
-    CRITICA = 'Crítica', 'Crítica'
+class UserIdField(models.CharField):
+    """
+    CharField para IDs de usuário com collation só no PostgreSQL.
+    
+    A collation "C" vem de db_collation, mas só é emitida no DDL do
+    PostgreSQL; nos demais bancos (SQLite em dev/testes) a coluna é
+    criada/alterada sem COLLATE.
+    """
+    
+    def db_parameters(self, connection):
+        params = super().db_parameters(connection)
+        if connection.vendor != 'postgresql':
+            params['collation'] = None
+        return params
+
+
+class TicketStatusChoices(models.IntegerChoices):
+    """
+    Choices para status de ticket (espelha TicketStatus do Core).
+    
+    Persistido como SMALLINT (2 bytes); o label é o valor do enum do Core.
+    """
+    ABERTO = 1, 'Aberto'
+    EM_PROGRESSO = 2, 'Em Progresso'
+    AGUARDANDO_CLIENTE = 3, 'Aguardando Cliente'
+    RESOLVIDO = 4, 'Resolvido'
+    FECHADO = 5, 'Fechado'
+
+
+# Status considerados "em aberto" para SLA (códigos SMALLINT)
+OPEN_STATUSES = (
+    TicketStatusChoices.ABERTO,
+    TicketStatusChoices.EM_PROGRESSO,
+    TicketStatusChoices.AGUARDANDO_CLIENTE,
+)
+
+
+class TicketPriorityChoices(models.IntegerChoices):
+    """
+    Choices para prioridade de ticket (espelha TicketPriority do Core).
+    
+    Persistido como SMALLINT (2 bytes); o label é o valor do enum do Core.
+    """
+    BAIXA = 1, 'Baixa'
+    MEDIA = 2, 'Média'
+    ALTA = 3, 'Alta'
+    CRITICA = 4, 'Crítica'
 
 
 class TicketModel(models.Model):
@@ -87,16 +128,14 @@ class TicketModel(models.Model):
     )
     
     # Estado
-    status = models.CharField(
-        max_length=50,
+    status = models.SmallIntegerField(
         choices=TicketStatusChoices.choices,
         default=TicketStatusChoices.ABERTO,
         db_index=True,
         help_text="Estado atual do ticket"
     )
     
-    prioridade = models.CharField(
-        max_length=20,
+    prioridade = models.SmallIntegerField(
         choices=TicketPriorityChoices.choices,
         default=TicketPriorityChoices.MEDIA,
         db_index=True,
@@ -105,14 +144,16 @@ class TicketModel(models.Model):
     
     # Relacionamentos (strings para flexibilidade de integração)
     # Em produção, pode ser ForeignKey para User model
-    criador_id = models.CharField(
-        max_length=100,
+    criador_id = UserIdField(
+        max_length=USER_ID_MAX_LENGTH,
+        db_collation=USER_ID_COLLATION,
         db_index=True,
         help_text="ID do usuário criador"
     )
     
-    atribuido_a_id = models.CharField(
-        max_length=100,
+    atribuido_a_id = UserIdField(
+        max_length=USER_ID_MAX_LENGTH,
+        db_collation=USER_ID_COLLATION,
         null=True,
         blank=True,
         db_index=True,
@@ -157,13 +198,27 @@ class TicketModel(models.Model):
             models.Index(fields=['atribuido_a_id', 'status']),
             models.Index(fields=['prioridade', 'sla_prazo']),
             models.Index(fields=['criador_id', 'criado_em']),
+            # Keyset pagination: ORDER BY criado_em DESC, id DESC
+            models.Index(fields=['-criado_em', '-id'], name='idx_ticket_criado_id'),
+            # Parcial: SLA só dos tickets em aberto (list_atrasados)
+            models.Index(
+                fields=['sla_prazo'],
+                name='tix_sla_open_idx',
+                condition=models.Q(status__in=OPEN_STATUSES),
+            ),
+            # Containment em tags (tags @> '["bug"]'); só PostgreSQL
+            GinIndex(
+                fields=['tags'],
+                name='gin_ticket_tags',
+                opclasses=['jsonb_path_ops'],
+            ),
         ]
     
     def __str__(self):
         return f"[{self.id[:8]}] {self.titulo}"
     
     def __repr__(self):
-        return f"<TicketModel id={self.id[:8]} status={self.status}>"
+        return f"<TicketModel id={self.id[:8]} status={self.get_status_display()}>"
 
 
 class TicketHistoryModel(models.Model):
@@ -205,8 +260,9 @@ class TicketHistoryModel(models.Model):
         help_text="Dados serializados do evento"
     )
     
-    user_id = models.CharField(
-        max_length=100,
+    user_id = UserIdField(
+        max_length=USER_ID_MAX_LENGTH,
+        db_collation=USER_ID_COLLATION,
         null=True,
         blank=True,
         help_text="Usuário que causou o evento"
@@ -246,9 +302,15 @@ class DomainEventModel(models.Model):
     """
     
     # Identificação
-    event_id = models.CharField(
-        max_length=36,
+    # PK sequencial: inserts append-only sempre no fim do B-tree
+    sequence_id = models.BigAutoField(
         primary_key=True,
+        help_text="Sequência global de gravação (ordenação entre agregados)"
+    )
+    
+    event_id = models.UUIDField(
+        unique=True,
+        db_index=True,
         help_text="UUID único do evento"
     )
     
@@ -313,8 +375,9 @@ class DomainEventModel(models.Model):
         help_text="ID do evento que causou este"
     )
     
-    user_id = models.CharField(
-        max_length=100,
+    user_id = UserIdField(
+        max_length=USER_ID_MAX_LENGTH,
+        db_collation=USER_ID_COLLATION,
         null=True,
         blank=True,
         db_index=True,
@@ -325,7 +388,7 @@ class DomainEventModel(models.Model):
         db_table = 'domain_events'
         verbose_name = 'Evento de Domínio'
         verbose_name_plural = 'Eventos de Domínio'
-        ordering = ['recorded_at']
+        ordering = ['sequence_id']
         indexes = [
             models.Index(fields=['aggregate_id', 'sequence']),
             models.Index(fields=['aggregate_type', 'recorded_at']),
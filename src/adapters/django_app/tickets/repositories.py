@@ -22,24 +22,125 @@ Escalabilidade:
 - Herda de BaseRepository para funcionalidade comum
 """
 
-from typing import List, Optional, Dict, Any, Type
+from typing import TYPE_CHECKING, List, Optional, Dict, Any, Type, Iterator, Tuple
 from datetime import datetime
+import base64
+import hashlib
 import logging
 
-from django.db import transaction
-from django.db.models import Count, Q, F
+import orjson
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models import BooleanField, Case, Count, Q, F, Value, When
+from django.db.models.functions import Now
 from django.utils import timezone
 
 from src.core.tickets.entities import TicketEntity, TicketStatus, TicketPriority
 from src.core.tickets.ports import TicketRepository as TicketRepositoryPort
-from src.core.shared.exceptions import EntityNotFoundError
+from src.core.shared.interfaces import EventStore as EventStorePort
+from src.core.shared.exceptions import EntityNotFoundError, ValidationError
 
 from ..shared.repository import BaseRepository, PaginatedResult, PaginationParams, SortParams
-from .models import TicketModel, TicketHistoryModel
+from .models import (
+    TicketModel,
+    TicketStatusChoices,
+    OPEN_STATUSES,
+)
 from .mappers import TicketMapper
 
+if TYPE_CHECKING:
+    from src.core.shared.events import DomainEvent
+
 logger = logging.getLogger(__name__)
 
+# Versão monotônica dos tickets no cache. Toda chave cacheada derivada da
+# tabela (contagens, estatísticas) inclui a versão; incrementá-la invalida
+# tudo de uma vez, sem enumerar chaves.
+TICKETS_VERSION_KEY = 'tickets:ver'
+
+
+def tickets_cache_version() -> int:
+    """Versão atual dos tickets no cache (cria com 1 se ausente)."""
+    return cache.get_or_set(TICKETS_VERSION_KEY, 1, None)
+
+
+def _incr_tickets_version() -> None:
+    """Incrementa a versão dos tickets no cache."""
+    try:
+        cache.incr(TICKETS_VERSION_KEY)
+    except ValueError:
+        # Versão ainda não existe (ou foi removida do cache)
+        cache.set(TICKETS_VERSION_KEY, 1, None)
+
+
+def bump_tickets_version() -> None:
+    """
+    Invalida todos os agregados cacheados de tickets após o commit.
+    
+    Incrementar dentro da transação deixaria um leitor concorrente
+    cachear o estado anterior já na versão nova; on_commit só roda
+    depois que a escrita fica visível (e na hora, fora de transação).
+    """
+    transaction.on_commit(_incr_tickets_version)
+
+
+# Predicado de SLA vencido, avaliado no banco (now() do servidor).
+# Casa com o índice parcial tix_sla_open_idx.
+_ATRASADO_Q = Q(sla_prazo__lt=Now(), status__in=OPEN_STATUSES)
+
+# Código do banco -> label do status (count_grouped_by_status)
+_STATUS_LABELS = dict(TicketStatusChoices.choices)
+
+# Ordenações aceitas por list_paginated: (ordenar_por, ordem) -> expressões
+# prontas. Conjunto fixo = poucos formatos de ORDER BY (planos reaproveitados)
+# e nada vindo do cliente chega ao SQL. criado_em desempata por id (keyset);
+# sla_prazo manda NULLs (sem SLA) para o fim nos dois sentidos.
+_ORDER_EXPR = {
+    ('criado_em', 'asc'): (F('criado_em').asc(), F('id').asc()),
+    ('criado_em', 'desc'): (F('criado_em').desc(), F('id').desc()),
+    ('atualizado_em', 'asc'): (F('atualizado_em').asc(),),
+    ('atualizado_em', 'desc'): (F('atualizado_em').desc(),),
+    ('prioridade', 'asc'): (F('prioridade').asc(),),
+    ('prioridade', 'desc'): (F('prioridade').desc(),),
+    ('status', 'asc'): (F('status').asc(),),
+    ('status', 'desc'): (F('status').desc(),),
+    ('sla_prazo', 'asc'): (F('sla_prazo').asc(nulls_last=True),),
+    ('sla_prazo', 'desc'): (F('sla_prazo').desc(nulls_last=True),),
+    ('titulo', 'asc'): (F('titulo').asc(),),
+    ('titulo', 'desc'): (F('titulo').desc(),),
+}
+
+
+def _bucket_counts(field: str, members, to_db) -> Dict[str, Count]:
+    """
+    Monta um Count(filter=...) por membro do enum do Core.
+    
+    Iterar o enum do domínio (e não as choices) mantém o aggregate em
+    sincronia com TicketStatus/TicketPriority.
+    
+    Args:
+        field: Coluna a comparar ('status' ou 'prioridade')
+        members: Enum do Core
+        to_db: Conversor membro -> código do banco
+        
+    Returns:
+        kwargs para QuerySet.aggregate()
+    """
+    return {
+        f'{field}_{member.name.lower()}': Count('id', filter=Q(**{field: to_db(member)}))
+        for member in members
+    }
+
+
+def _bucket_values(aggregates: Dict[str, int], field: str, members) -> Dict[str, int]:
+    """Converte o resultado plano de _bucket_counts em {valor do enum: contagem}."""
+    return {
+        member.value: aggregates[f'{field}_{member.name.lower()}']
+        for member in members
+    }
+
 
 class DjangoTicketRepository(TicketRepositoryPort):
     """
@@ -68,52 +169,98 @@ class DjangoTicketRepository(TicketRepositoryPort):
         tickets = repo.list_by_status(TicketStatus.ABERTO)
     """
     
-    def __init__(self):
-        """Inicializa repository."""
-        self._mapper = TicketMapper()
+    # Mapper sem estado: uma instância compartilhada
+    _mapper = TicketMapper()
+    
+    # Colunas carregadas em listagens (sem descricao/tags, os campos grandes)
+    LIST_FIELDS = (
+        'id', 'titulo', 'status', 'prioridade', 'categoria',
+        'criador_id', 'atribuido_a_id', 'criado_em', 'atualizado_em',
+        'sla_prazo',
+    )
+    
+    # Relações carregadas junto nas leituras (padrão de BaseRepository).
+    # criador_id/atribuido_a_id são IDs opacos, não FKs: hoje não há
+    # relação a carregar, mas listagens e get_by_id já passam por _base_qs()
+    select_related_fields: Tuple[str, ...] = ()
+    prefetch_related_fields: Tuple[str, ...] = ()
+    
+    # Colunas sobrescritas no UPSERT (criador_id/criado_em não mudam)
+    UPDATE_FIELDS = (
+        'titulo', 'descricao', 'categoria', 'status', 'prioridade',
+        'atribuido_a_id', 'atualizado_em', 'sla_prazo', 'tags',
+    )
+    UPSERT_BATCH_SIZE = 500
+    
+    # Linhas por round-trip em iter_all
+    ITER_CHUNK_SIZE = 2000
+    
+    # Cache de COUNT(*) do list_paginated (chave = versão + assinatura dos filtros)
+    COUNT_CACHE_TTL = 60
+    
+    # Cache de get_estatisticas (chave = versão). Escritas já invalidam
+    # pela versão; o TTL curto limita só a defasagem de 'atrasados'
+    # (SLA que vence sem nenhuma escrita)
+    STATS_CACHE_TTL = 30
     
     def save(self, ticket: TicketEntity) -> None:
         """
         Persiste ticket (create ou update).
         
-        Detecta automaticamente se é criação ou atualização
-        baseado na existência do ID no banco.
+        Um único INSERT ... ON CONFLICT (id) DO UPDATE: sem o SELECT
+        prévio do update_or_create.
         
         Args:
             ticket: Entidade de domínio a persistir
-            
-        Note:
-            Usa update_or_create para atomicidade
         """
         logger.debug(f"Saving ticket: {ticket.id}")
         
-        # Preparar dados para persistência
-        model_data = {
-            'titulo': ticket.titulo,
-            'descricao': ticket.descricao,
-            'categoria': ticket.categoria,
-            'status': ticket.status.value,
-            'prioridade': ticket.prioridade.value,
-            'criador_id': ticket.criador_id,
-            'atribuido_a_id': ticket.atribuido_a_id,
-            'criado_em': ticket.criado_em,
-            'atualizado_em': ticket.atualizado_em,
-            'sla_prazo': ticket.sla_prazo,
-            'tags': ticket.tags,
-        }
-        
-        # Upsert: create ou update
-        TicketModel.objects.update_or_create(
-            id=ticket.id,
-            defaults=model_data
-        )
+        self._upsert([self._mapper.to_model(ticket)])
+        bump_tickets_version()
         
         logger.info(f"Ticket saved: {ticket.id}")
     
+    def save_many(self, tickets: List[TicketEntity]) -> None:
+        """
+        Persiste vários tickets em UPSERTs de UPSERT_BATCH_SIZE linhas.
+        
+        Útil para importação e reconstrução a partir de eventos.
+        
+        Args:
+            tickets: Entidades a persistir
+        """
+        if not tickets:
+            return
+        
+        self._upsert([self._mapper.to_model(t) for t in tickets])
+        bump_tickets_version()
+        
+        logger.info(f"Tickets saved: {len(tickets)}")
+    
+    def _upsert(self, models: List[TicketModel]) -> None:
+        """
+        INSERT ... ON CONFLICT (id) DO UPDATE SET <UPDATE_FIELDS>.
+        
+        Args:
+            models: Models (não salvos) a gravar
+        """
+        TicketModel.objects.bulk_create(
+            models,
+            batch_size=self.UPSERT_BATCH_SIZE,
+            update_conflicts=True,
+            unique_fields=['id'],
+            update_fields=self.UPDATE_FIELDS,
+        )
+    
     def get_by_id(self, ticket_id: str) -> Optional[TicketEntity]:
         """
         Busca ticket por ID.
         
+        Uma única consulta: a entidade não carrega relações filhas
+        (history fica em TicketHistoryModel e não é lida aqui), então
+        não há prefetch a fazer. Se a página de detalhe passar a exibir
+        o histórico, declare-o em prefetch_related_fields.
+        
         Args:
             ticket_id: UUID do ticket
             
@@ -121,7 +268,24 @@ class DjangoTicketRepository(TicketRepositoryPort):
             Entidade encontrada ou None
         """
         try:
-            model = TicketModel.objects.get(id=ticket_id)
+            model = self._base_qs().get(id=ticket_id)
+            return self._mapper.to_entity(model)
+        except TicketModel.DoesNotExist:
+            logger.debug(f"Ticket not found: {ticket_id}")
+            return None
+    
+    async def aget_by_id(self, ticket_id: str) -> Optional[TicketEntity]:
+        """
+        Busca ticket por ID com o ORM assíncrono (aget).
+        
+        Args:
+            ticket_id: UUID do ticket
+            
+        Returns:
+            Entidade encontrada ou None
+        """
+        try:
+            model = await self._base_qs().aget(id=ticket_id)
             return self._mapper.to_entity(model)
         except TicketModel.DoesNotExist:
             logger.debug(f"Ticket not found: {ticket_id}")
@@ -140,10 +304,32 @@ class DjangoTicketRepository(TicketRepositoryPort):
         deleted_count, _ = TicketModel.objects.filter(id=ticket_id).delete()
         
         if deleted_count > 0:
+            bump_tickets_version()
             logger.info(f"Ticket deleted: {ticket_id}")
         else:
             logger.debug(f"Ticket not found for deletion: {ticket_id}")
     
+    @classmethod
+    def _base_qs(cls):
+        """
+        Queryset base das leituras (listagens e get_by_id).
+        
+        Aplica select_related/prefetch_related declarados na classe,
+        evitando N+1 quando houver relações a carregar.
+        
+        Returns:
+            QuerySet de TicketModel
+        """
+        queryset = TicketModel.objects.all()
+        
+        if cls.select_related_fields:
+            queryset = queryset.select_related(*cls.select_related_fields)
+        
+        if cls.prefetch_related_fields:
+            queryset = queryset.prefetch_related(*cls.prefetch_related_fields)
+        
+        return queryset
+    
     def list_all(self) -> List[TicketEntity]:
         """
         Lista todos os tickets.
@@ -151,23 +337,61 @@ class DjangoTicketRepository(TicketRepositoryPort):
         Returns:
             Lista de todas as entidades
             
-        Warning:
-            Use com cuidado em produção - sem paginação
+        Deprecated:
+            Materializa a tabela inteira; use iter_all()
         """
-        models = TicketModel.objects.all()
-        return self._mapper.to_entity_list(models)
+        return list(self.iter_all())
     
-    def list_by_status(self, status: TicketStatus) -> List[TicketEntity]:
+    def iter_all(self) -> Iterator[TicketEntity]:
+        """
+        Itera todos os tickets em blocos de ITER_CHUNK_SIZE linhas.
+        
+        Sem cache do QuerySet: a memória fica em O(chunk). No
+        PostgreSQL o iterator usa cursor nomeado (server-side).
+        
+        Yields:
+            Entidades de domínio
+        """
+        for model in self._base_qs().iterator(chunk_size=self.ITER_CHUNK_SIZE):
+            yield self._mapper.to_entity(model)
+    
+    def list_by_status(
+        self,
+        status: TicketStatus,
+        limit: Optional[int] = None,
+    ) -> List[TicketEntity]:
         """
         Lista tickets por status.
         
         Args:
             status: Status a filtrar
+            limit: Máximo de tickets, mais recentes primeiro (LIMIT no
+                banco). Listagem de painel: carrega só LIST_FIELDS
             
         Returns:
             Lista de entidades com o status especificado
         """
-        models = TicketModel.objects.filter(status=status.value)
+        models = self._base_qs().filter(status=self._mapper.status_to_db(status))
+        if limit is not None:
+            # Servido por idx_ticket_status_criado
+            models = models.only(*self.LIST_FIELDS).order_by('-criado_em')[:limit]
+        return self._mapper.to_entity_list(models)
+    
+    def list_recentes(self, limit: int) -> List[TicketEntity]:
+        """
+        Lista os tickets criados mais recentemente.
+        
+        Args:
+            limit: Máximo de tickets (LIMIT no banco)
+            
+        Returns:
+            Entidades parciais (só LIST_FIELDS), mais recentes primeiro
+        """
+        models = (
+            self._base_qs()
+            .only(*self.LIST_FIELDS)
+            .order_by('-criado_em', '-id')[:limit]
+        )
         return self._mapper.to_entity_list(models)
     
     def list_by_criador(self, criador_id: str) -> List[TicketEntity]:
@@ -180,7 +404,7 @@ class DjangoTicketRepository(TicketRepositoryPort):
         Returns:
             Lista de entidades do criador
         """
-        models = TicketModel.objects.filter(criador_id=criador_id)
+        models = self._base_qs().filter(criador_id=criador_id)
         return self._mapper.to_entity_list(models)
     
     def list_by_tecnico(self, tecnico_id: str) -> List[TicketEntity]:
@@ -193,7 +417,7 @@ class DjangoTicketRepository(TicketRepositoryPort):
         Returns:
             Lista de entidades atribuídas ao técnico
         """
-        models = TicketModel.objects.filter(atribuido_a_id=tecnico_id)
+        models = self._base_qs().filter(atribuido_a_id=tecnico_id)
         return self._mapper.to_entity_list(models)
     
     def exists(self, ticket_id: str) -> bool:
@@ -217,20 +441,113 @@ class DjangoTicketRepository(TicketRepositoryPort):
         """
         return TicketModel.objects.count()
     
-    def count_by_status(self) -> Dict[str, int]:
+    def count_by_status(self, status: TicketStatus) -> int:
+        """
+        Conta tickets com um status.
+        
+        Lê do mesmo GROUP BY cacheado de count_grouped_by_status.
+        
+        Args:
+            status: Status para filtrar
+        
+        Returns:
+            Número de tickets com o status
+        """
+        return self.count_grouped_by_status().get(status.value, 0)
+    
+    def count_grouped_by_status(self) -> Dict[str, int]:
         """
         Conta tickets agrupados por status.
         
+        GROUP BY direto em tuplas (values_list) e sem o ORDER BY
+        default do model. Cacheado por COUNT_CACHE_TTL segundos na
+        versão atual dos tickets.
+        
         Returns:
             Dicionário {status: quantidade}
         """
-        counts = (
-            TicketModel.objects
-            .values('status')
-            .annotate(count=Count('id'))
+        cache_key = f"tickets:count_by_status:{tickets_cache_version()}"
+        
+        counts = cache.get(cache_key)
+        if counts is None:
+            rows = (
+                TicketModel.objects
+                .values('status')
+                .annotate(c=Count('id'))
+                .order_by()
+                .values_list('status', 'c')
+            )
+            counts = {_STATUS_LABELS[code]: c for code, c in rows}
+            cache.set(cache_key, counts, self.COUNT_CACHE_TTL)
+        
+        return counts
+    
+    def list_with_status_counts(
+        self,
+        status: Optional[TicketStatus] = None,
+        criador_id: Optional[str] = None,
+        tecnico_id: Optional[str] = None,
+        prioridade: Optional[TicketPriority] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        completo: bool = False,
+    ) -> Tuple[List[TicketEntity], Dict[str, Any]]:
+        """
+        Lista tickets filtrados e contagem por status.
+        
+        A lista carrega apenas LIST_FIELDS (entidades de leitura, sem
+        descricao/tags), a menos que completo=True. As contagens saem de um único aggregate com Count(filter=...)
+        sobre o mesmo queryset da lista (sem os filtros de status e
+        prioridade), em vez de um COUNT por status; o mesmo aggregate
+        conta as linhas que passam em todos os filtros ('filtrados').
+        
+        Com limit, a página sai do banco via LIMIT/OFFSET em
+        (-criado_em, -id), ordem coberta por idx_ticket_criado_id.
+        
+        Args:
+            status: Filtrar lista por status
+            criador_id: Filtrar por criador
+            tecnico_id: Filtrar por técnico
+            prioridade: Filtrar lista por prioridade
+            offset: Linhas a pular (com limit)
+            limit: Máximo de linhas na lista (None = todas)
+            completo: Carregar todas as colunas (entidades completas)
+            
+        Returns:
+            Tupla (entidades, {"total": int, "filtrados": int,
+            "por_status": {status: int}})
+        """
+        queryset = self._base_qs()
+        if criador_id:
+            queryset = queryset.filter(criador_id=criador_id)
+        if tecnico_id:
+            queryset = queryset.filter(atribuido_a_id=tecnico_id)
+        
+        list_filter = Q()
+        if status is not None:
+            list_filter &= Q(status=self._mapper.status_to_db(status))
+        if prioridade is not None:
+            list_filter &= Q(prioridade=self._mapper.prioridade_to_db(prioridade))
+        
+        aggregates = queryset.aggregate(
+            total=Count('id'),
+            filtrados=Count('id', filter=list_filter) if list_filter else Count('id'),
+            **_bucket_counts('status', TicketStatus, self._mapper.status_to_db),
         )
+        counts = {
+            'total': aggregates['total'],
+            'filtrados': aggregates['filtrados'],
+            'por_status': _bucket_values(aggregates, 'status', TicketStatus),
+        }
+        
+        queryset = queryset.filter(list_filter)
+        if not completo:
+            queryset = queryset.only(*self.LIST_FIELDS)
+        
+        if limit is not None:
+            queryset = queryset.order_by('-criado_em', '-id')[offset:offset + limit]
         
-        return {item['status']: item['count'] for item in counts}
+        return self._mapper.to_entity_list(queryset), counts
     
     # =========================================================================
     # Queries Avançadas (Query Repository)
@@ -245,37 +562,55 @@ class DjangoTicketRepository(TicketRepositoryPort):
         criador_id: Optional[str] = None,
         tecnico_id: Optional[str] = None,
         categoria: Optional[str] = None,
+        tag: Optional[str] = None,
         apenas_atrasados: bool = False,
         ordenar_por: str = 'criado_em',
         ordem: str = 'desc',
+        cursor: Optional[str] = None,
+        as_dicts: bool = False,
     ) -> Dict[str, Any]:
         """
         Lista tickets com paginação e filtros.
         
+        Ordenando por criado_em (padrão) a navegação é por keyset:
+        passe o next_cursor da página anterior em `cursor` e o banco
+        busca direto a partir de (criado_em, id), sem OFFSET. Sem
+        cursor, `page` continua funcionando via OFFSET.
+        
         Args:
-            page: Número da página (1-indexed)
+            page: Número da página (1-indexed; ignorado se houver cursor)
             per_page: Itens por página
             status: Filtrar por status
             prioridade: Filtrar por prioridade
             criador_id: Filtrar por criador
             tecnico_id: Filtrar por técnico
             categoria: Filtrar por categoria
+            tag: Filtrar por tag (containment; usa índice GIN no PostgreSQL)
             apenas_atrasados: Apenas tickets com SLA vencido
-            ordenar_por: Campo para ordenação
+            ordenar_por: Campo para ordenação (chaves de _ORDER_EXPR)
             ordem: 'asc' ou 'desc'
+            cursor: Cursor opaco retornado em next_cursor
+            as_dicts: Retorna items como dicts de .values() (sem mapper),
+                com esta_atrasado já calculado pelo banco
             
         Returns:
-            Dict com items, total, pagina, total_paginas, etc.
+            Dict com items (entidades parciais, só LIST_FIELDS), total, pagina, total_paginas, next_cursor, etc.
+            
+        Raises:
+            ValidationError: Cursor inválido, usado sem ordenar por criado_em
+                ou campo de ordenação desconhecido
         """
         # Base queryset
-        queryset = TicketModel.objects.all()
+        queryset = self._base_qs()
         
         # Aplicar filtros
         if status:
-            queryset = queryset.filter(status=status)
+            queryset = queryset.filter(status=self._mapper.status_to_db(status))
         
         if prioridade:
-            queryset = queryset.filter(prioridade=prioridade)
+            queryset = queryset.filter(
+                prioridade=self._mapper.prioridade_to_db(prioridade)
+            )
         
         if criador_id:
             queryset = queryset.filter(criador_id=criador_id)
@@ -286,49 +621,184 @@ class DjangoTicketRepository(TicketRepositoryPort):
         if categoria:
             queryset = queryset.filter(categoria=categoria)
         
+        if tag:
+            queryset = queryset.filter(tags__contains=[tag])
+        
         if apenas_atrasados:
-            now = datetime.now()
-            queryset = queryset.filter(
-                sla_prazo__lt=now,
-                status__in=['Aberto', 'Em Progresso', 'Aguardando Cliente']
+            queryset = queryset.filter(_ATRASADO_Q)
+        
+        # Contagem total (cacheada por assinatura dos filtros)
+        total = self._count_cached(queryset, {
+            'status': status,
+            'prioridade': prioridade,
+            'criador_id': criador_id,
+            'tecnico_id': tecnico_id,
+            'categoria': categoria,
+            'tag': tag,
+            'apenas_atrasados': apenas_atrasados,
+        })
+        
+        # Ordenação: criado_em usa keyset (criado_em, id); demais campos, OFFSET
+        keyset = ordenar_por == 'criado_em'
+        descending = ordem != 'asc'
+        
+        order_by = _ORDER_EXPR.get((ordenar_por, 'desc' if descending else 'asc'))
+        if order_by is None:
+            raise ValidationError(
+                f"Campo de ordenação inválido: {ordenar_por}",
+                field="ordenar_por",
             )
+        queryset = queryset.order_by(*order_by)
         
-        # Ordenação
-        order_field = ordenar_por if ordem == 'asc' else f'-{ordenar_por}'
-        queryset = queryset.order_by(order_field)
+        # Projeção: só as colunas de listagem (+ esta_atrasado calculado
+        # no banco, para as linhas em dict não dependerem do relógio local)
+        if as_dicts:
+            # CASE em vez do predicado puro: sla_prazo NULL daria NULL
+            queryset = queryset.annotate(
+                esta_atrasado=Case(
+                    When(_ATRASADO_Q, then=Value(True)),
+                    default=Value(False),
+                    output_field=BooleanField(),
+                )
+            ).values(*self.LIST_FIELDS, 'esta_atrasado')
+        else:
+            queryset = queryset.only(*self.LIST_FIELDS)
         
-        # Contagem total
-        total = queryset.count()
+        # Paginação (busca 1 linha extra para saber se há próxima página)
+        if cursor:
+            if not keyset:
+                raise ValidationError(
+                    "Cursor só é suportado ordenando por criado_em",
+                    field="cursor",
+                )
+            cursor_ts, cursor_id = self._decode_cursor(cursor)
+            if descending:
+                queryset = queryset.filter(
+                    Q(criado_em__lt=cursor_ts) | Q(criado_em=cursor_ts, id__lt=cursor_id)
+                )
+            else:
+                queryset = queryset.filter(
+                    Q(criado_em__gt=cursor_ts) | Q(criado_em=cursor_ts, id__gt=cursor_id)
+                )
+            rows = list(queryset[:per_page + 1])
+        else:
+            offset = (page - 1) * per_page
+            rows = list(queryset[offset:offset + per_page + 1])
         
-        # Paginação
-        offset = (page - 1) * per_page
-        models = queryset[offset:offset + per_page]
+        tem_proxima = len(rows) > per_page
+        rows = rows[:per_page]
         
         # Calcular metadados
         total_pages = (total + per_page - 1) // per_page
         
+        next_cursor = None
+        if keyset and tem_proxima:
+            last = rows[-1]
+            next_cursor = (
+                self._encode_cursor(last['criado_em'], last['id']) if as_dicts
+                else self._encode_cursor(last.criado_em, last.id)
+            )
+        
+        if as_dicts:
+            items = [self._mapper.to_list_dict(row) for row in rows]
+        else:
+            items = self._mapper.to_entity_list(rows)
+        
         return {
-            'items': self._mapper.to_entity_list(models),
+            'items': items,
             'total': total,
             'pagina': page,
             'por_pagina': per_page,
             'total_paginas': total_pages,
-            'tem_proxima': page < total_pages,
-            'tem_anterior': page > 1,
+            'tem_proxima': tem_proxima,
+            'tem_anterior': bool(cursor) or page > 1,
+            'next_cursor': next_cursor,
         }
     
-    def list_atrasados(self) -> List[TicketEntity]:
+    def _count_cached(self, queryset, filters: Dict[str, Any]) -> int:
+        """
+        COUNT(*) do queryset filtrado, cacheado por COUNT_CACHE_TTL segundos.
+        
+        A chave inclui a versão dos tickets (TICKETS_VERSION_KEY);
+        save()/delete() incrementam a versão no commit e invalidam
+        todas as contagens de uma vez.
+        
+        Args:
+            queryset: Queryset já filtrado
+            filters: Filtros aplicados (assinatura da chave)
+            
+        Returns:
+            Total de linhas
+        """
+        version = tickets_cache_version()
+        filter_sig = hashlib.md5(repr(sorted(filters.items())).encode()).hexdigest()
+        cache_key = f"tickets:count:{version}:{filter_sig}"
+        
+        total = cache.get(cache_key)
+        if total is None:
+            total = queryset.count()
+            cache.set(cache_key, total, self.COUNT_CACHE_TTL)
+        
+        return total
+    
+    @staticmethod
+    def _encode_cursor(criado_em: datetime, ticket_id: str) -> str:
+        """
+        Gera cursor opaco a partir da última linha da página.
+        
+        Args:
+            criado_em: criado_em do último ticket emitido
+            ticket_id: ID do último ticket emitido
+            
+        Returns:
+            base64 url-safe de "<criado_em iso>|<id>"
+        """
+        raw = f"{criado_em.isoformat()}|{ticket_id}"
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+    
+    @staticmethod
+    def _decode_cursor(cursor: str) -> Tuple[datetime, str]:
+        """
+        Decodifica cursor gerado por _encode_cursor.
+        
+        Args:
+            cursor: Cursor opaco
+            
+        Returns:
+            Tupla (criado_em, id)
+            
+        Raises:
+            ValidationError: Se o cursor estiver malformado
+        """
+        try:
+            raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+            ts, ticket_id = raw.split('|', 1)
+            return datetime.fromisoformat(ts), ticket_id
+        except ValueError:
+            raise ValidationError("Cursor de paginação inválido", field="cursor")
+    
+    def list_atrasados(self, limit: Optional[int] = None) -> List[TicketEntity]:
         """
         Lista tickets com SLA vencido.
         
+        Servido pelo índice parcial tix_sla_open_idx (sla_prazo WHERE
+        status em aberto), com now() avaliado no banco.
+        
+        Args:
+            limit: Máximo de tickets (None = todos)
+            
         Returns:
-            Lista de tickets atrasados
+            Tickets atrasados (entidades parciais, só LIST_FIELDS)
         """
-        now = datetime.now()
-        models = TicketModel.objects.filter(
-            sla_prazo__lt=now,
-            status__in=['Aberto', 'Em Progresso', 'Aguardando Cliente']
-        ).order_by('sla_prazo')
+        models = (
+            self._base_qs()
+            .filter(_ATRASADO_Q)
+            .only(*self.LIST_FIELDS)
+            .order_by('sla_prazo')
+        )
+        
+        if limit is not None:
+            models = models[:limit]
         
         return self._mapper.to_entity_list(models)
     
@@ -336,31 +806,51 @@ class DjangoTicketRepository(TicketRepositoryPort):
         """
         Retorna estatísticas gerais de tickets.
         
+        Status e prioridade têm poucos valores fixos, então total,
+        contagens por status/prioridade e atrasados saem de um único
+        aggregate com Count(filter=...) (FILTER no PostgreSQL) - um
+        round-trip e uma varredura da tabela.
+        
+        O resultado fica no cache por STATS_CACHE_TTL segundos, na chave
+        da versão atual dos tickets: qualquer save()/delete() ou evento
+        gravado invalida ao commitar. 'atrasados' pode ficar até STATS_CACHE_TTL
+        defasado quando um SLA vence sem escrita no meio.
+        
         Returns:
             Dict com estatísticas
         """
-        now = datetime.now()
+        cache_key = f"tickets:stats:{tickets_cache_version()}"
         
-        total = TicketModel.objects.count()
+        estatisticas = cache.get(cache_key)
+        if estatisticas is None:
+            estatisticas = self._compute_estatisticas()
+            cache.set(cache_key, estatisticas, self.STATS_CACHE_TTL)
         
-        por_status = dict(
-            TicketModel.objects
-            .values('status')
-            .annotate(count=Count('id'))
-            .values_list('status', 'count')
+        return estatisticas
+    
+    def _compute_estatisticas(self) -> Dict[str, Any]:
+        """Executa o aggregate de get_estatisticas (sem cache)."""
+        aggregates = TicketModel.objects.aggregate(
+            total=Count('id'),
+            atrasados=Count('id', filter=_ATRASADO_Q),
+            **_bucket_counts('status', TicketStatus, self._mapper.status_to_db),
+            **_bucket_counts('prioridade', TicketPriority, self._mapper.prioridade_to_db),
         )
         
-        por_prioridade = dict(
-            TicketModel.objects
-            .values('prioridade')
-            .annotate(count=Count('id'))
-            .values_list('prioridade', 'count')
-        )
+        total = aggregates['total']
+        atrasados = aggregates['atrasados']
         
-        atrasados = TicketModel.objects.filter(
-            sla_prazo__lt=now,
-            status__in=['Aberto', 'Em Progresso', 'Aguardando Cliente']
-        ).count()
+        # Mantém o formato anterior: só valores com ao menos 1 ticket
+        por_status = {
+            value: count
+            for value, count in _bucket_values(aggregates, 'status', TicketStatus).items()
+            if count
+        }
+        por_prioridade = {
+            value: count
+            for value, count in _bucket_values(aggregates, 'prioridade', TicketPriority).items()
+            if count
+        }
         
         return {
             'total': total,
@@ -371,7 +861,7 @@ class DjangoTicketRepository(TicketRepositoryPort):
         }
 
 
-class DjangoEventStore:
+class DjangoEventStore(EventStorePort):
     """
     Event Store usando Django ORM.
     
@@ -381,8 +871,29 @@ class DjangoEventStore:
     - Analytics
     
     Preparado para Event Sourcing completo no futuro.
+    
+    Com FAST_EVENT_WRITE=True a gravação desce abaixo do ORM
+    (INSERT parametrizado via executemany), sem save()/signals.
     """
     
+    # Colunas gravadas pelo caminho rápido (mesma ordem dos placeholders)
+    _INSERT_COLUMNS = (
+        'event_id', 'event_type', 'aggregate_type', 'aggregate_id',
+        'event_data', 'version', 'sequence', 'occurred_at', 'recorded_at',
+        'correlation_id', 'causation_id', 'user_id',
+    )
+    
+    # Linhas por INSERT multi-linha em bulk_append (12 colunas por linha)
+    BULK_BATCH_SIZE = 500
+    
+    _insert_sql = (
+        "INSERT INTO domain_events ("
+        + ", ".join(_INSERT_COLUMNS)
+        + ") VALUES ("
+        + ", ".join(["%s"] * len(_INSERT_COLUMNS))
+        + ")"
+    )
+    
     def append(
         self,
         event: 'DomainEvent',
@@ -399,23 +910,219 @@ class DjangoEventStore:
             correlation_id: ID de correlação
             user_id: ID do usuário
         """
+        self.bulk_append(
+            [event],
+            correlation_id=correlation_id,
+            user_id=user_id,
+            sequences=[sequence],
+        )
+    
+    def bulk_append(
+        self,
+        events: List['DomainEvent'],
+        correlation_id: Optional[str] = None,
+        user_id: Optional[str] = None,
+        sequences: Optional[List[int]] = None,
+    ) -> None:
+        """
+        Adiciona uma rajada de eventos em uma única transação.
+        
+        Grava via bulk_create (INSERT multi-linha em lotes de
+        BULK_BATCH_SIZE) ou, com FAST_EVENT_WRITE=True, via executemany.
+        
+        Args:
+            events: Eventos na ordem em que ocorreram
+            correlation_id: ID de correlação
+            user_id: ID do usuário
+            sequences: Sequência de cada evento; se omitido, continua a
+                partir da maior sequência já gravada de cada agregado
+        """
         from .models import DomainEventModel
         from .mappers import DomainEventMapper
         
-        model = DomainEventMapper.to_model(
-            event=event,
-            sequence=sequence,
-            correlation_id=correlation_id,
-            user_id=user_id,
+        if not events:
+            return
+        
+        with transaction.atomic():
+            if sequences is None:
+                sequences = self._next_sequences(events)
+            
+            models = [
+                DomainEventMapper.to_model(
+                    event=event,
+                    sequence=sequence,
+                    correlation_id=correlation_id,
+                    user_id=user_id,
+                )
+                for event, sequence in zip(events, sequences)
+            ]
+            
+            if getattr(settings, 'FAST_EVENT_WRITE', False):
+                self._insert_rows(models)
+            else:
+                DomainEventModel.objects.bulk_create(
+                    models, batch_size=self.BULK_BATCH_SIZE
+                )
+        
+        bump_tickets_version()
+        
+        logger.debug(f"Events stored: {len(events)}")
+    
+    def _next_sequences(self, events: List['DomainEvent']) -> List[int]:
+        """Calcula a próxima sequência de cada evento, por agregado."""
+        next_sequence = {}
+        sequences = []
+        for event in events:
+            aggregate_id = event.aggregate_id
+            if aggregate_id not in next_sequence:
+                next_sequence[aggregate_id] = self._last_sequence(aggregate_id)
+            next_sequence[aggregate_id] += 1
+            sequences.append(next_sequence[aggregate_id])
+        return sequences
+    
+    def append_batch(
+        self,
+        events: List['DomainEvent'],
+        correlation_id: Optional[str] = None,
+        user_id: Optional[str] = None,
+    ) -> None:
+        """
+        Adiciona vários eventos (de um ou mais agregados) ao store.
+        
+        No PostgreSQL chama append_domain_events(jsonb): lock por
+        agregado, high-water mark de sequência, INSERT e pg_notify em
+        um único round-trip. Nos demais bancos usa bulk_append().
+        
+        Args:
+            events: Eventos na ordem em que ocorreram
+            correlation_id: ID de correlação
+            user_id: ID do usuário
+        """
+        if not events:
+            return
+        
+        if connection.vendor != 'postgresql':
+            self.bulk_append(events, correlation_id=correlation_id, user_id=user_id)
+            return
+        
+        # orjson serializa datetime nativamente (RFC 3339, sem isoformat()
+        # por evento); decode porque o parâmetro vai como texto para ::jsonb
+        payload = orjson.dumps(
+            [
+                {
+                    'event_id': event.event_id,
+                    'event_type': event.event_type,
+                    'aggregate_type': event.aggregate_type,
+                    'aggregate_id': event.aggregate_id,
+                    'event_data': event._get_event_data(),
+                    'version': event.version,
+                    'occurred_at': (
+                        timezone.make_aware(event.occurred_at)
+                        if timezone.is_naive(event.occurred_at)
+                        else event.occurred_at
+                    ),
+                    'correlation_id': correlation_id,
+                    'causation_id': None,
+                    'user_id': user_id,
+                }
+                for event in events
+            ],
+            default=str,
+        ).decode()
+        
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT append_domain_events(%s::jsonb)", [payload])
+        
+        bump_tickets_version()
+        
+        logger.debug(f"Event batch stored: {len(events)} events")
+    
+    def _last_sequence(self, aggregate_id: str) -> int:
+        """Retorna a maior sequência já gravada para o agregado (0 se nenhuma)."""
+        from .models import DomainEventModel
+        
+        last = (
+            DomainEventModel.objects
+            .filter(aggregate_id=aggregate_id)
+            .order_by('-sequence')
+            .values_list('sequence', flat=True)
+            .first()
         )
-        model.save()
+        return last or 0
+    
+    def _insert_rows(self, models: List[Any]) -> None:
+        """
+        Insere eventos com SQL cru, sem passar pelo save() do ORM.
+        
+        A conversão de valores usa get_db_prep_save de cada campo,
+        então UUID/JSON/datetime ficam corretos em qualquer backend.
+        
+        Args:
+            models: DomainEventModel ainda não persistidos
+        """
+        from .models import DomainEventModel
         
-        logger.debug(f"Event stored: {event.event_type} for {event.aggregate_id}")
+        fields = [DomainEventModel._meta.get_field(c) for c in self._INSERT_COLUMNS]
+        rows = [
+            [
+                f.get_db_prep_save(f.pre_save(m, add=True), connection)
+                for f in fields
+            ]
+            for m in models
+        ]
+        
+        with connection.cursor() as cursor:
+            cursor.executemany(self._insert_sql, rows)
+    
+    # Linhas por fetch do cursor server-side durante replay
+    REPLAY_CHUNK_SIZE = 2000
+    
+    def replay(
+        self,
+        aggregate_type: Optional[str] = None,
+        after_sequence_id: int = 0,
+        chunk_size: int = REPLAY_CHUNK_SIZE,
+    ) -> Iterator[Tuple[str, str, Dict[str, Any], int, datetime]]:
+        """
+        Percorre o Event Store em ordem global para reconstruir projeções.
+        
+        Usa values_list + iterator(): no PostgreSQL abre um cursor
+        server-side e não instancia models, então a memória fica
+        O(chunk_size) independentemente do tamanho do store.
+        
+        Args:
+            aggregate_type: Filtrar por tipo de agregado (ex: "Ticket")
+            after_sequence_id: Retomar a partir deste sequence_id (exclusivo)
+            chunk_size: Linhas buscadas por round-trip
+            
+        Yields:
+            Tuplas (aggregate_id, event_type, event_data, sequence, occurred_at)
+        """
+        from .models import DomainEventModel
+        
+        queryset = DomainEventModel.objects.filter(sequence_id__gt=after_sequence_id)
+        
+        if aggregate_type:
+            queryset = queryset.filter(aggregate_type=aggregate_type)
+        
+        rows = (
+            queryset
+            .order_by('sequence_id')
+            .values_list(
+                'aggregate_id', 'event_type', 'event_data', 'sequence', 'occurred_at'
+            )
+        )
+        
+        yield from rows.iterator(chunk_size=chunk_size)
+    
+    # Linhas por fetch ao ler o stream de um agregado
+    AGGREGATE_CHUNK_SIZE = 1000
     
     def get_events_for_aggregate(
         self,
         aggregate_id: str,
         since_sequence: int = 0,
+        limit: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
         """
         Recupera eventos de um agregado.
@@ -423,26 +1130,47 @@ class DjangoEventStore:
         Args:
             aggregate_id: ID do agregado
             since_sequence: Sequência inicial
+            limit: Máximo de eventos retornados (None = todos)
             
         Returns:
             Lista de eventos em formato dict
         """
+        return list(self.iter_events_for_aggregate(aggregate_id, since_sequence, limit))
+    
+    def iter_events_for_aggregate(
+        self,
+        aggregate_id: str,
+        since_sequence: int = 0,
+        limit: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Itera os eventos de um agregado sem montar a lista.
+        
+        Lê via values() + iterator(): nenhum model é instanciado.
+        
+        Args:
+            aggregate_id: ID do agregado
+            since_sequence: Sequência inicial
+            limit: Máximo de eventos (None = todos)
+            
+        Yields:
+            Eventos em formato dict
+        """
         from .models import DomainEventModel
         
-        events = (
+        rows = (
             DomainEventModel.objects
             .filter(aggregate_id=aggregate_id, sequence__gte=since_sequence)
-            .order_by('sequence')
+            .order_by('sequence', 'sequence_id')
+            .values(
+                'event_id', 'event_type', 'aggregate_id',
+                'event_data', 'sequence', 'occurred_at',
+            )
         )
         
-        return [
-            {
-                'event_id': e.event_id,
-                'event_type': e.event_type,
-                'aggregate_id': e.aggregate_id,
-                'event_data': e.event_data,
-                'sequence': e.sequence,
-                'occurred_at': e.occurred_at,
-            }
-            for e in events
-        ]
+        if limit is not None:
+            rows = rows[:limit]
+        
+        for row in rows.iterator(chunk_size=self.AGGREGATE_CHUNK_SIZE):
+            row['event_id'] = str(row['event_id'])
+            yield row
@@ -23,12 +23,52 @@ Endpoints API JSON:
 - POST /tickets/api/<id>/reabrir/ - Reabrir ticket
 """
 
-from django.urls import path
+from django.urls import include, path
 from . import views
 from . import api_views
 
 app_name = 'tickets'
 
+# Rotas organizadas em árvore: cada prefixo (api/, <pk>/) é um include(),
+# então o resolver só percorre a subárvore do prefixo que casou. Novas
+# rotas entram no grupo do seu prefixo, não na lista de topo. Prefixos
+# literais (api/, criar/, dashboard/) vêm antes de <str:pk>/, que casa
+# qualquer segmento.
+
+# Ações sobre um ticket (HTML): /tickets/<pk>/...
+ticket_patterns = [
+    # Detalhes
+    path('', views.TicketDetailView.as_view(), name='detail'),
+    
+    # Ações
+    path('atribuir/', views.TicketAtribuirView.as_view(), name='atribuir'),
+    path('fechar/', views.TicketFecharView.as_view(), name='fechar'),
+    path('reabrir/', views.TicketReabrirView.as_view(), name='reabrir'),
+    path('prioridade/', views.TicketAlterarPrioridadeView.as_view(), name='prioridade'),
+]
+
+# Ações sobre um ticket (API): /tickets/api/<pk>/...
+api_ticket_patterns = [
+    # Detalhes e atualização
+    path('', api_views.TicketAPIDetailView.as_view(), name='api_detail'),
+    
+    # Ações via API
+    path('atribuir/', api_views.TicketAPIAtribuirView.as_view(), name='api_atribuir'),
+    path('fechar/', api_views.TicketAPIFecharView.as_view(), name='api_fechar'),
+    path('reabrir/', api_views.TicketAPIReabrirView.as_view(), name='api_reabrir'),
+]
+
+# API JSON: /tickets/api/...
+api_patterns = [
+    # Listagem e criação
+    path('', api_views.TicketAPIListView.as_view(), name='api_list'),
+    
+    # Estatísticas (antes do <pk> para não conflitar)
+    path('estatisticas/', api_views.TicketAPIEstatisticasView.as_view(), name='api_estatisticas'),
+    
+    path('<str:pk>/', include(api_ticket_patterns)),
+]
+
 urlpatterns = [
     # =========================================================================
     # Views HTML (Templates)
@@ -43,30 +83,15 @@ urlpatterns = [
     # Criação
     path('criar/', views.TicketCreateView.as_view(), name='create'),
     
-    # Detalhes
-    path('<str:pk>/', views.TicketDetailView.as_view(), name='detail'),
-    
-    # Ações
-    path('<str:pk>/atribuir/', views.TicketAtribuirView.as_view(), name='atribuir'),
-    path('<str:pk>/fechar/', views.TicketFecharView.as_view(), name='fechar'),
-    path('<str:pk>/reabrir/', views.TicketReabrirView.as_view(), name='reabrir'),
-    path('<str:pk>/prioridade/', views.TicketAlterarPrioridadeView.as_view(), name='prioridade'),
-    
     # =========================================================================
     # API JSON
     # =========================================================================
     
-    # Listagem e criação
-    path('api/', api_views.TicketAPIListView.as_view(), name='api_list'),
-    
-    # Estatísticas (antes do <pk> para não conflitar)
-    path('api/estatisticas/', api_views.TicketAPIEstatisticasView.as_view(), name='api_estatisticas'),
+    path('api/', include(api_patterns)),
     
-    # Detalhes e atualização
-    path('api/<str:pk>/', api_views.TicketAPIDetailView.as_view(), name='api_detail'),
+    # =========================================================================
+    # Ticket (HTML) - por último: <str:pk> casa qualquer segmento
+    # =========================================================================
     
-    # Ações via API
-    path('api/<str:pk>/atribuir/', api_views.TicketAPIAtribuirView.as_view(), name='api_atribuir'),
-    path('api/<str:pk>/fechar/', api_views.TicketAPIFecharView.as_view(), name='api_fechar'),
-    path('api/<str:pk>/reabrir/', api_views.TicketAPIReabrirView.as_view(), name='api_reabrir'),
+    path('<str:pk>/', include(ticket_patterns)),
 ]
@@ -22,15 +22,23 @@ Princípios:
 - Views não acessam Models diretamente
 """
 
+import asyncio
+import functools
 import logging
-from typing import Any, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
 
+from asgiref.sync import sync_to_async
+from django.db import connection
 from django.views import View
 from django.http import HttpResponse, HttpRequest, HttpResponseRedirect
 from django.shortcuts import render, redirect
 from django.contrib import messages
 from django.urls import reverse
 from django.core.paginator import Paginator
+from django.utils.cache import patch_cache_control
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_control
 
 from src.core.tickets.dtos import (
     CriarTicketInputDTO,
@@ -46,6 +54,7 @@ from src.core.shared.exceptions import (
 )
 from src.config.container import get_container
 
+from ._services import ServiceProvider, provider
 from .forms import (
     TicketCreateForm,
     TicketAtribuirForm,
@@ -62,6 +71,75 @@ logger = logging.getLogger(__name__)
 # Mixins
 # =============================================================================
 
+# Prioridade do DTO (valor do enum) -> choice do TicketAlterarPrioridadeForm
+_PRIORITY_MAP = {
+    'Baixa': 'BAIXA',
+    'Média': 'MEDIA',
+    'Alta': 'ALTA',
+    'Crítica': 'CRITICA',
+}
+
+# Filtros da listagem lidos da querystring (TicketListView)
+_FILTROS_LISTAGEM = ('status', 'prioridade', 'criador_id', 'tecnico_id')
+
+
+def _parse_filtros(params) -> Dict[str, Optional[str]]:
+    """
+    Lê os filtros da listagem da querystring em uma passada.
+    
+    Args:
+        params: request.GET
+        
+    Returns:
+        Dict filtro -> valor (None quando ausente/vazio)
+    """
+    return {name: params.get(name) or None for name in _FILTROS_LISTAGEM}
+
+
+# Cache-Control das páginas só de leitura (listagem e dashboard). private
+# porque o HTML depende da sessão (usuário, mensagens) e não pode ir para
+# cache compartilhado; max_age=0 + must_revalidate porque a listagem tem
+# que refletir a escrita que acabou de redirecionar para ela (o navegador
+# nunca serve a cópia guardada sem voltar ao servidor).
+_CACHE_CONTROL_LEITURA = {'private': True, 'max_age': 0, 'must_revalidate': True}
+
+
+# Pool dedicado às consultas paralelas do dashboard. Limitado: cada
+# thread abre sua própria conexão durante a consulta, então max_workers é
+# também o teto de conexões extras que o dashboard ocupa no banco. Fora
+# das consultas as threads não seguram conexão (ver _in_worker).
+_DASHBOARD_POOL = ThreadPoolExecutor(
+    max_workers=4, thread_name_prefix='dashboard-query'
+)
+
+
+def _in_worker(func: Callable, *args: Any, **kwargs: Any):
+    """
+    Executa um use case síncrono em uma thread de _DASHBOARD_POOL.
+    
+    Chamadas independentes rodam em paralelo (cada thread com sua
+    conexão; o driver libera o GIL enquanto espera o banco). A conexão
+    da thread é fechada ao fim de cada chamada, ignorando CONN_MAX_AGE:
+    threads ociosas do pool não ficam segurando conexões persistentes
+    fora do orçamento dos workers do servidor.
+    
+    Args:
+        func: Callable síncrono
+        *args, **kwargs: Repassados para func
+        
+    Returns:
+        Future (awaitable) com o resultado de func
+    """
+    @functools.wraps(func)
+    def run():
+        try:
+            return func(*args, **kwargs)
+        finally:
+            connection.close()
+    
+    return asyncio.get_running_loop().run_in_executor(_DASHBOARD_POOL, run)
+
+
 class ContainerMixin:
     """
     Mixin que fornece acesso ao DI Container.
@@ -83,8 +161,8 @@ class ContainerMixin:
         Returns:
             Instância do service
         """
-        container = self.get_container()
-        return getattr(container.services, service_name)()
+        # Providers resolvidos uma vez por container (ver _services)
+        return provider(service_name, self.get_container())()
 
 
 class FlashMessageMixin:
@@ -155,63 +233,53 @@ class TicketListView(ContainerMixin, FlashMessageMixin, View):
     GET /tickets/?status=Aberto&page=2
     """
     
+    listar_tickets_service = ServiceProvider()
+    
     template_name = 'tickets/list.html'
     paginate_by = 20
     
+    @method_decorator(cache_control(**_CACHE_CONTROL_LEITURA))
     def get(self, request: HttpRequest) -> HttpResponse:
         """Lista tickets com filtros."""
         # Obter services
-        listar_service = self.get_service('listar_tickets_service')
-        contar_service = self.get_service('contar_tickets_service')
+        listar_service = self.listar_tickets_service()
         
-        # Processar filtros
+        # Form só para renderizar os campos (nunca é validado); os
+        # filtros saem de uma única leitura do GET
         filtro_form = TicketFiltroForm(request.GET)
+        filtros = _parse_filtros(request.GET)
         
-        # Extrair parâmetros
-        status = request.GET.get('status') or None
-        prioridade = request.GET.get('prioridade') or None
-        criador_id = request.GET.get('criador_id') or None
-        tecnico_id = request.GET.get('tecnico_id') or None
+        try:
+            page_number = max(int(request.GET.get('page', 1)), 1)
+        except ValueError:
+            page_number = 1
         
-        # Executar query
+        # Executar query (página + estatísticas; LIMIT/OFFSET no banco)
         try:
-            tickets = listar_service.execute(
-                status=status,
-                criador_id=criador_id,
-                tecnico_id=tecnico_id,
+            tickets, estatisticas = listar_service.execute_com_estatisticas(
+                **filtros,
+                pagina=page_number,
+                por_pagina=self.paginate_by,
             )
             
-            # Filtrar por prioridade (se necessário)
-            if prioridade:
-                tickets = [t for t in tickets if t.prioridade == prioridade]
-            
         except Exception as e:
             logger.error(f"Erro ao listar tickets: {e}")
             tickets = []
+            estatisticas = {'total': 0, 'filtrados': 0, 'por_status': {}}
             self.error_message(request, "Erro ao carregar tickets.")
         
-        # Paginação
-        paginator = Paginator(tickets, self.paginate_by)
-        page_number = request.GET.get('page', 1)
+        # Paginação: o Paginator só calcula a navegação (range não
+        # materializa nada); os itens da página já vieram do banco
+        paginator = Paginator(range(estatisticas['filtrados']), self.paginate_by)
         page_obj = paginator.get_page(page_number)
-        
-        # Estatísticas
-        try:
-            estatisticas = contar_service.execute()
-        except Exception:
-            estatisticas = {'total': 0, 'por_status': {}}
+        page_obj.object_list = tickets
         
         context = {
             'page_obj': page_obj,
             'tickets': page_obj.object_list,
             'estatisticas': estatisticas,
             'filtro_form': filtro_form,
-            'filtros_ativos': {
-                'status': status,
-                'prioridade': prioridade,
-                'criador_id': criador_id,
-                'tecnico_id': tecnico_id,
-            },
+            'filtros_ativos': filtros,
             'total_tickets': paginator.count,
         }
         
@@ -225,11 +293,13 @@ class TicketDetailView(ContainerMixin, FlashMessageMixin, UserContextMixin, View
     GET /tickets/<id>/
     """
     
+    obter_ticket_service = ServiceProvider()
+    
     template_name = 'tickets/detail.html'
     
     def get(self, request: HttpRequest, pk: str) -> HttpResponse:
         """Exibe detalhes do ticket."""
-        obter_service = self.get_service('obter_ticket_service')
+        obter_service = self.obter_ticket_service()
         
         try:
             ticket = obter_service.execute(pk)
@@ -241,19 +311,14 @@ class TicketDetailView(ContainerMixin, FlashMessageMixin, UserContextMixin, View
             self.error_message(request, "Erro ao carregar ticket.")
             return redirect('tickets:list')
         
-        # Forms para ações
-        atribuir_form = TicketAtribuirForm()
-        fechar_form = TicketFecharForm()
-        reabrir_form = TicketReabrirForm()
+        # Atribuir/fechar/reabrir são <form> estáticos no template; só o
+        # select de prioridade depende do ticket e precisa de Form
         prioridade_form = TicketAlterarPrioridadeForm(
             initial={'prioridade': self._normalize_priority(ticket.prioridade)}
         )
         
         context = {
             'ticket': ticket,
-            'atribuir_form': atribuir_form,
-            'fechar_form': fechar_form,
-            'reabrir_form': reabrir_form,
             'prioridade_form': prioridade_form,
             'user_id': self.get_user_id(request),
         }
@@ -262,13 +327,7 @@ class TicketDetailView(ContainerMixin, FlashMessageMixin, UserContextMixin, View
     
     def _normalize_priority(self, prioridade: str) -> str:
         """Normaliza prioridade para o formato do form."""
-        mapping = {
-            'Baixa': 'BAIXA',
-            'Média': 'MEDIA',
-            'Alta': 'ALTA',
-            'Crítica': 'CRITICA',
-        }
-        return mapping.get(prioridade, 'MEDIA')
+        return _PRIORITY_MAP.get(prioridade, 'MEDIA')
 
 
 class TicketCreateView(ContainerMixin, FlashMessageMixin, UserContextMixin, View):
@@ -279,6 +338,8 @@ class TicketCreateView(ContainerMixin, FlashMessageMixin, UserContextMixin, View
     POST /tickets/criar/ - Processa criação
     """
     
+    criar_ticket_service = ServiceProvider()
+    
     template_name = 'tickets/create.html'
     
     def get(self, request: HttpRequest) -> HttpResponse:
@@ -293,7 +354,7 @@ class TicketCreateView(ContainerMixin, FlashMessageMixin, UserContextMixin, View
         if not form.is_valid():
             return render(request, self.template_name, {'form': form})
         
-        criar_service = self.get_service('criar_ticket_service')
+        criar_service = self.criar_ticket_service()
         
         try:
             # Converter form para DTO
@@ -340,6 +401,8 @@ class TicketAtribuirView(ContainerMixin, FlashMessageMixin, UserContextMixin, Vi
     POST /tickets/<id>/atribuir/
     """
     
+    atribuir_ticket_service = ServiceProvider()
+    
     def post(self, request: HttpRequest, pk: str) -> HttpResponse:
         """Processa atribuição de ticket."""
         form = TicketAtribuirForm(request.POST)
@@ -348,7 +411,7 @@ class TicketAtribuirView(ContainerMixin, FlashMessageMixin, UserContextMixin, Vi
             self.error_message(request, "Dados de atribuição inválidos.")
             return redirect('tickets:detail', pk=pk)
         
-        atribuir_service = self.get_service('atribuir_ticket_service')
+        atribuir_service = self.atribuir_ticket_service()
         
         try:
             input_dto = AtribuirTicketInputDTO(
@@ -388,11 +451,13 @@ class TicketFecharView(ContainerMixin, FlashMessageMixin, UserContextMixin, View
     POST /tickets/<id>/fechar/
     """
     
+    fechar_ticket_service = ServiceProvider()
+    
     def post(self, request: HttpRequest, pk: str) -> HttpResponse:
         """Processa fechamento de ticket."""
         form = TicketFecharForm(request.POST)
         
-        fechar_service = self.get_service('fechar_ticket_service')
+        fechar_service = self.fechar_ticket_service()
         
         try:
             input_dto = FecharTicketInputDTO(
@@ -426,11 +491,13 @@ class TicketReabrirView(ContainerMixin, FlashMessageMixin, UserContextMixin, Vie
     POST /tickets/<id>/reabrir/
     """
     
+    reabrir_ticket_service = ServiceProvider()
+    
     def post(self, request: HttpRequest, pk: str) -> HttpResponse:
         """Processa reabertura de ticket."""
         form = TicketReabrirForm(request.POST)
         
-        reabrir_service = self.get_service('reabrir_ticket_service')
+        reabrir_service = self.reabrir_ticket_service()
         
         try:
             output = reabrir_service.execute(
@@ -462,6 +529,8 @@ class TicketAlterarPrioridadeView(ContainerMixin, FlashMessageMixin, UserContext
     POST /tickets/<id>/prioridade/
     """
     
+    alterar_prioridade_service = ServiceProvider()
+    
     def post(self, request: HttpRequest, pk: str) -> HttpResponse:
         """Processa alteração de prioridade."""
         form = TicketAlterarPrioridadeForm(request.POST)
@@ -470,7 +539,7 @@ class TicketAlterarPrioridadeView(ContainerMixin, FlashMessageMixin, UserContext
             self.error_message(request, "Prioridade inválida.")
             return redirect('tickets:detail', pk=pk)
         
-        alterar_service = self.get_service('alterar_prioridade_service')
+        alterar_service = self.alterar_prioridade_service()
         
         try:
             input_dto = AlterarPrioridadeInputDTO(
@@ -515,31 +584,37 @@ class DashboardView(ContainerMixin, View):
     Dashboard com visão geral dos tickets.
     
     GET /tickets/dashboard/
+    
+    View assíncrona: as cinco consultas são independentes e rodam em
+    paralelo (asyncio.gather), então a latência é a da mais lenta, não
+    a soma. Sob WSGI o Django executa a view via async_to_sync.
     """
     
+    listar_tickets_service = ServiceProvider()
+    contar_tickets_service = ServiceProvider()
+    
     template_name = 'tickets/dashboard.html'
     
-    def get(self, request: HttpRequest) -> HttpResponse:
+    async def get(self, request: HttpRequest) -> HttpResponse:
         """Exibe dashboard."""
-        listar_service = self.get_service('listar_tickets_service')
-        contar_service = self.get_service('contar_tickets_service')
+        listar_service = self.listar_tickets_service()
+        contar_service = self.contar_tickets_service()
         
         try:
-            # Estatísticas gerais
-            estatisticas = contar_service.execute()
-            
-            # Tickets recentes
-            todos_tickets = listar_service.execute()
-            tickets_recentes = todos_tickets[:5]
-            
-            # Tickets atrasados
-            tickets_atrasados = [t for t in todos_tickets if t.esta_atrasado][:5]
-            
-            # Tickets por status
-            tickets_abertos = [t for t in todos_tickets if t.status == 'Aberto'][:5]
-            tickets_em_progresso = [
-                t for t in todos_tickets if t.status == 'Em Progresso'
-            ][:5]
+            # Estatísticas + uma consulta com LIMIT por lista, concorrentes
+            (
+                estatisticas,
+                tickets_recentes,
+                tickets_atrasados,
+                tickets_abertos,
+                tickets_em_progresso,
+            ) = await asyncio.gather(
+                _in_worker(contar_service.execute),
+                _in_worker(listar_service.listar_recentes, limit=5),
+                _in_worker(listar_service.listar_atrasados, limit=5),
+                _in_worker(listar_service.listar_por_status, 'Aberto', limit=5),
+                _in_worker(listar_service.listar_por_status, 'Em Progresso', limit=5),
+            )
             
         except Exception as e:
             logger.error(f"Erro ao carregar dashboard: {e}")
@@ -557,4 +632,8 @@ class DashboardView(ContainerMixin, View):
             'tickets_em_progresso': tickets_em_progresso,
         }
         
-        return render(request, self.template_name, context)
+        # Context processors (request.user, messages) podem ir ao banco
+        response = await sync_to_async(render)(request, self.template_name, context)
+        # cache_control do Django 4.2 não decora views async
+        patch_cache_control(response, **_CACHE_CONTROL_LEITURA)
+        return response
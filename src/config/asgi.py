@@ -0,0 +1,17 @@
+"""
+ASGI config for TechSupport Manager.
+
+Exposes the ASGI callable as a module-level variable named ``application``.
+
+As API views de tickets (lista/detalhe) são async: sob ASGI
+(ex: uvicorn src.config.asgi:application) a espera pelo banco não
+prende um worker por request.
+"""
+
+import os
+
+from django.core.asgi import get_asgi_application
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'src.config.settings')
+
+application = get_asgi_application()
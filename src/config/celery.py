@@ -41,10 +41,10 @@ app.conf.update(
     # Backend de resultados (Redis)
     result_backend=os.environ.get('CELERY_RESULT_BACKEND', 'redis://localhost:6379/1'),
     
-    # Serialização
-    task_serializer='json',
-    accept_content=['json'],
-    result_serializer='json',
+    # Serialização (msgpack; json aceito para mensagens antigas na fila)
+    task_serializer='msgpack',
+    accept_content=['msgpack', 'json'],
+    result_serializer='msgpack',
     
     # Timezone
     timezone='America/Sao_Paulo',
@@ -53,7 +53,9 @@ app.conf.update(
     # Configurações de execução
     task_acks_late=True,  # ACK após execução (mais seguro)
     task_reject_on_worker_lost=True,
-    worker_prefetch_multiplier=1,  # Uma tarefa por vez (mais justo)
+    # Prefetch por processo: 4 para handlers curtos/IO-bound (eventos);
+    # workers de tarefas longas/CPU-bound devem usar 1 (mais justo)
+    worker_prefetch_multiplier=int(os.environ.get('CELERY_PREFETCH_MULTIPLIER', '4')),
     
     # Retry
     task_default_retry_delay=60,  # 1 minuto
@@ -70,7 +72,11 @@ app.conf.update(
 # Definir filas
 app.conf.task_queues = (
     Queue('default', Exchange('default'), routing_key='default'),
-    Queue('events', Exchange('events'), routing_key='events.#'),
+    # Consumidores de eventos têm prioridade no RabbitMQ (x-priority)
+    Queue(
+        'events', Exchange('events'), routing_key='events.#',
+        consumer_arguments={'x-priority': 5},
+    ),
     Queue('notifications', Exchange('notifications'), routing_key='notifications.#'),
     Queue('reports', Exchange('reports'), routing_key='reports.#'),
 )
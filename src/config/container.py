@@ -26,7 +26,36 @@ Estrutura:
 from dependency_injector import containers, providers
 from dependency_injector.wiring import Provide, inject
 from typing import Optional, Type, Callable, Any
+import functools
+import importlib
 import logging
+import threading
+from types import MappingProxyType
+
+from django.core.exceptions import ImproperlyConfigured
+from django.utils.module_loading import import_string
+
+# Importados uma vez aqui, não a cada resolução de provider: Core puro,
+# publishers (só dependem do Core) e o UoW em memória (unit_of_work só
+# importa django.db, que não exige settings). Adapters que importam
+# models continuam via _import_class (dependem do registry de apps e
+# importam este módulo indiretamente).
+from src.adapters.django_app.events.publishers import (
+    LoggingEventPublisher,
+    RequestBufferedEventPublisher,
+)
+from src.adapters.django_app.shared.unit_of_work import InMemoryUnitOfWork
+from src.core.tickets.ports import InMemoryTicketRepository
+from src.core.tickets.use_cases import (
+    AlterarPrioridadeService,
+    AtribuirTicketService,
+    ContarTicketsService,
+    CriarTicketService,
+    FecharTicketService,
+    ListarTicketsService,
+    ObterTicketService,
+    ReabrirTicketService,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -35,17 +64,60 @@ logger = logging.getLogger(__name__)
 # Helper Functions (definido primeiro para uso nos containers)
 # =============================================================================
 
+@functools.lru_cache(maxsize=None)
 def _import_class(module_path: str, class_name: str) -> Type:
     """
     Importa classe dinamicamente.
     
-    Usado para lazy loading e evitar circular imports.
+    Usado para lazy loading e evitar circular imports. Memoizado: a
+    importação acontece na primeira chamada e as seguintes (novos
+    containers após reset_container, UoW por request) são um lookup
+    de dict.
     """
-    import importlib
     module = importlib.import_module(module_path)
     return getattr(module, class_name)
 
 
+# Providers de infraestrutura que são só "instanciar a classe do
+# adapter": (módulo, classe). Enquanto o Django não está pronto eles
+# passam pelas factories lazy de InfrastructureContainer; depois,
+# _bind_adapter_classes() troca o provides pela classe em si.
+_ADAPTER_CLASSES = {
+    'ticket_repository': (
+        'src.adapters.django_app.tickets.repositories', 'DjangoTicketRepository'
+    ),
+    'event_store': (
+        'src.adapters.django_app.tickets.repositories', 'DjangoEventStore'
+    ),
+    'unit_of_work_factory': (
+        'src.adapters.django_app.shared.unit_of_work', 'DjangoUnitOfWork'
+    ),
+}
+
+
+def _lazy_adapter(provider_name: str) -> Callable[..., Any]:
+    """
+    Cria a factory lazy de um provider de _ADAPTER_CLASSES.
+    
+    Função comum (não staticmethod no corpo do container): o provider
+    chama a closure direto, sem passar pelo descriptor.
+    
+    Args:
+        provider_name: Chave em _ADAPTER_CLASSES
+        
+    Returns:
+        Callable que importa a classe (memoizado) e a instancia com os
+        kwargs recebidos do provider
+    """
+    module_path, class_name = _ADAPTER_CLASSES[provider_name]
+    
+    def create(**kwargs: Any) -> Any:
+        return _import_class(module_path, class_name)(**kwargs)
+    
+    create.__qualname__ = f'_lazy_adapter.<{provider_name}>'
+    return create
+
+
 # =============================================================================
 # Core Container - Entidades e Interfaces Puras
 # =============================================================================
@@ -83,49 +155,30 @@ class InfrastructureContainer(containers.DeclarativeContainer):
     # Repositories
     # -------------------------------------------------------------------------
     
-    @staticmethod
-    def _create_ticket_repository():
-        """Factory para criar ticket repository."""
-        from src.adapters.django_app.tickets.repositories import DjangoTicketRepository
-        return DjangoTicketRepository()
-    
-    ticket_repository = providers.Singleton(_create_ticket_repository)
+    ticket_repository = providers.Singleton(_lazy_adapter('ticket_repository'))
     
     # -------------------------------------------------------------------------
     # Event Infrastructure
     # -------------------------------------------------------------------------
     
-    @staticmethod
-    def _create_event_store():
-        """Factory para criar event store."""
-        from src.adapters.django_app.tickets.repositories import DjangoEventStore
-        return DjangoEventStore()
+    event_store = providers.Singleton(_lazy_adapter('event_store'))
     
-    event_store = providers.Singleton(_create_event_store)
+    # Publisher de fato; classe trocada por settings.EVENT_PUBLISHER_CLASS
+    event_publisher_backend = providers.Singleton(LoggingEventPublisher)
     
-    @staticmethod
-    def _create_event_publisher():
-        """Factory para criar event publisher."""
-        from src.adapters.django_app.events.publishers import LoggingEventPublisher
-        return LoggingEventPublisher()
-    
-    event_publisher = providers.Singleton(_create_event_publisher)
+    # Em request com EventBatchMiddleware, publica em lote ao final
+    event_publisher = providers.Singleton(
+        RequestBufferedEventPublisher,
+        inner=event_publisher_backend,
+    )
     
     # -------------------------------------------------------------------------
     # Unit of Work Factory
     # -------------------------------------------------------------------------
     
-    @staticmethod
-    def _create_unit_of_work(event_publisher, event_store):
-        """Factory para criar Unit of Work."""
-        from src.adapters.django_app.shared.unit_of_work import DjangoUnitOfWork
-        return DjangoUnitOfWork(
-            event_publisher=event_publisher,
-            event_store=event_store,
-        )
-    
+    # Chamada a cada request de escrita
     unit_of_work_factory = providers.Factory(
-        _create_unit_of_work,
+        _lazy_adapter('unit_of_work_factory'),
         event_publisher=event_publisher,
         event_store=event_store,
     )
@@ -139,8 +192,9 @@ class ServiceContainer(containers.DeclarativeContainer):
     """
     Container para Use Cases / Application Services.
     
-    Cada service é uma Factory que cria nova instância por chamada,
-    injetando as dependências necessárias.
+    Services de escrita são Factories (nova instância, com seu próprio
+    Unit of Work, por chamada); os de leitura, sem estado, são
+    Singletons.
     """
     
     config = providers.Configuration()
@@ -150,62 +204,32 @@ class ServiceContainer(containers.DeclarativeContainer):
     # Ticket Services - Write Operations
     # -------------------------------------------------------------------------
     
-    @staticmethod
-    def _create_criar_ticket_service(ticket_repo, uow):
-        """Factory para CriarTicketService."""
-        from src.core.tickets.use_cases import CriarTicketService
-        return CriarTicketService(ticket_repo=ticket_repo, uow=uow)
-    
     criar_ticket_service = providers.Factory(
-        _create_criar_ticket_service,
+        CriarTicketService,
         ticket_repo=infrastructure.ticket_repository,
         uow=infrastructure.unit_of_work_factory,
     )
     
-    @staticmethod
-    def _create_atribuir_ticket_service(ticket_repo, uow):
-        """Factory para AtribuirTicketService."""
-        from src.core.tickets.use_cases import AtribuirTicketService
-        return AtribuirTicketService(ticket_repo=ticket_repo, uow=uow)
-    
     atribuir_ticket_service = providers.Factory(
-        _create_atribuir_ticket_service,
+        AtribuirTicketService,
         ticket_repo=infrastructure.ticket_repository,
         uow=infrastructure.unit_of_work_factory,
     )
     
-    @staticmethod
-    def _create_fechar_ticket_service(ticket_repo, uow):
-        """Factory para FecharTicketService."""
-        from src.core.tickets.use_cases import FecharTicketService
-        return FecharTicketService(ticket_repo=ticket_repo, uow=uow)
-    
     fechar_ticket_service = providers.Factory(
-        _create_fechar_ticket_service,
+        FecharTicketService,
         ticket_repo=infrastructure.ticket_repository,
         uow=infrastructure.unit_of_work_factory,
     )
     
-    @staticmethod
-    def _create_reabrir_ticket_service(ticket_repo, uow):
-        """Factory para ReabrirTicketService."""
-        from src.core.tickets.use_cases import ReabrirTicketService
-        return ReabrirTicketService(ticket_repo=ticket_repo, uow=uow)
-    
     reabrir_ticket_service = providers.Factory(
-        _create_reabrir_ticket_service,
+        ReabrirTicketService,
         ticket_repo=infrastructure.ticket_repository,
         uow=infrastructure.unit_of_work_factory,
     )
     
-    @staticmethod
-    def _create_alterar_prioridade_service(ticket_repo, uow):
-        """Factory para AlterarPrioridadeService."""
-        from src.core.tickets.use_cases import AlterarPrioridadeService
-        return AlterarPrioridadeService(ticket_repo=ticket_repo, uow=uow)
-    
     alterar_prioridade_service = providers.Factory(
-        _create_alterar_prioridade_service,
+        AlterarPrioridadeService,
         ticket_repo=infrastructure.ticket_repository,
         uow=infrastructure.unit_of_work_factory,
     )
@@ -213,37 +237,21 @@ class ServiceContainer(containers.DeclarativeContainer):
     # -------------------------------------------------------------------------
     # Ticket Services - Read Operations (sem UoW)
     # -------------------------------------------------------------------------
+    # Sem estado além do repositório (também Singleton): uma instância
+    # por container, em vez de construir o service a cada request
     
-    @staticmethod
-    def _create_listar_tickets_service(ticket_repo):
-        """Factory para ListarTicketsService."""
-        from src.core.tickets.use_cases import ListarTicketsService
-        return ListarTicketsService(ticket_repo=ticket_repo)
-    
-    listar_tickets_service = providers.Factory(
-        _create_listar_tickets_service,
+    listar_tickets_service = providers.Singleton(
+        ListarTicketsService,
         ticket_repo=infrastructure.ticket_repository,
     )
     
-    @staticmethod
-    def _create_obter_ticket_service(ticket_repo):
-        """Factory para ObterTicketService."""
-        from src.core.tickets.use_cases import ObterTicketService
-        return ObterTicketService(ticket_repo=ticket_repo)
-    
-    obter_ticket_service = providers.Factory(
-        _create_obter_ticket_service,
+    obter_ticket_service = providers.Singleton(
+        ObterTicketService,
         ticket_repo=infrastructure.ticket_repository,
     )
     
-    @staticmethod
-    def _create_contar_tickets_service(ticket_repo):
-        """Factory para ContarTicketsService."""
-        from src.core.tickets.use_cases import ContarTicketsService
-        return ContarTicketsService(ticket_repo=ticket_repo)
-    
-    contar_tickets_service = providers.Factory(
-        _create_contar_tickets_service,
+    contar_tickets_service = providers.Singleton(
+        ContarTicketsService,
         ticket_repo=infrastructure.ticket_repository,
     )
 
@@ -283,10 +291,10 @@ class Container(containers.DeclarativeContainer):
         config=config,
     )
     
-    infrastructure = providers.Container(
-        InfrastructureContainer,
-        config=config,
-    )
+    # Ligado explicitamente em _configure_container(): um Container()
+    # avulso (testes) não materializa os adapters de produção e pode
+    # receber a sua própria infraestrutura via _attach_infrastructure()
+    infrastructure = providers.DependenciesContainer()
     
     services = providers.Container(
         ServiceContainer,
@@ -301,24 +309,56 @@ class Container(containers.DeclarativeContainer):
 
 _container: Optional[Container] = None
 
+# Configuração padrão (sem Django ou sem SLA_HOURS nos settings) e dos
+# containers de teste. Somente leitura (MappingProxyType): from_dict()
+# mescla em um dict novo, então o mesmo objeto é passado sem cópia e
+# nenhum chamador consegue alterar os defaults dos demais
+_DEFAULT_CONFIG = MappingProxyType({
+    'debug': True,
+    'sla_critica_horas': 4,
+    'sla_alta_horas': 24,
+    'sla_media_horas': 72,
+    'sla_baixa_horas': 168,
+})
+
+# Serializa só a criação: sem ele, requests simultâneos no cold start
+# podem montar (e descartar) vários Containers
+_container_lock = threading.Lock()
+
+# Módulos ligados por wire_container() quando nenhum é informado
+_DEFAULT_WIRE_MODULES = (
+    'src.adapters.django_app.tickets.views',
+    'src.adapters.django_app.tickets.api_views',
+)
+
+# Módulos já ligados ao container atual (limpo em reset_container)
+_wired_modules: set = set()
+
 
 def get_container() -> Container:
     """
     Retorna instância global do container.
     
-    Cria e configura se não existir (lazy initialization).
-    Thread-safe por padrão do dependency-injector.
+    Cria e configura se não existir (lazy initialization). Thread-safe
+    com double-checked locking: depois da primeira chamada o caminho é
+    só a leitura do global, sem adquirir o lock.
     
     Returns:
         Container configurado
     """
     global _container
     
-    if _container is None:
-        _container = Container()
-        _configure_container(_container)
+    container = _container
+    if container is None:
+        with _container_lock:
+            container = _container
+            if container is None:
+                container = Container()
+                _configure_container(container)
+                # Publica só depois de configurado
+                _container = container
     
-    return _container
+    return container
 
 
 def _configure_container(container: Container) -> None:
@@ -328,23 +368,110 @@ def _configure_container(container: Container) -> None:
     try:
         from django.conf import settings
         
+        # Uma leitura de cada setting (LazySettings.__getattr__)
+        sla = getattr(settings, 'SLA_HOURS', {})
+        publisher_class = getattr(settings, 'EVENT_PUBLISHER_CLASS', None)
         container.config.from_dict({
-            'debug': getattr(settings, 'DEBUG', True),
-            'sla_critica_horas': getattr(settings, 'SLA_HOURS', {}).get('CRITICA', 4),
-            'sla_alta_horas': getattr(settings, 'SLA_HOURS', {}).get('ALTA', 24),
-            'sla_media_horas': getattr(settings, 'SLA_HOURS', {}).get('MEDIA', 72),
-            'sla_baixa_horas': getattr(settings, 'SLA_HOURS', {}).get('BAIXA', 168),
+            'debug': getattr(settings, 'DEBUG', _DEFAULT_CONFIG['debug']),
+            'sla_critica_horas': sla.get('CRITICA', _DEFAULT_CONFIG['sla_critica_horas']),
+            'sla_alta_horas': sla.get('ALTA', _DEFAULT_CONFIG['sla_alta_horas']),
+            'sla_media_horas': sla.get('MEDIA', _DEFAULT_CONFIG['sla_media_horas']),
+            'sla_baixa_horas': sla.get('BAIXA', _DEFAULT_CONFIG['sla_baixa_horas']),
         })
-    except Exception as e:
-        logger.warning(f"Could not configure container from Django settings: {e}")
+    except (ImportError, ImproperlyConfigured) as e:
+        # Sem Django ou sem settings configurados; outros erros (bug de
+        # configuração) não são mascarados
+        logger.warning("Could not configure container from Django settings: %s", e)
         # Configuração padrão
-        container.config.from_dict({
-            'debug': True,
-            'sla_critica_horas': 4,
-            'sla_alta_horas': 24,
-            'sla_media_horas': 72,
-            'sla_baixa_horas': 168,
-        })
+        container.config.from_dict(_DEFAULT_CONFIG)
+        publisher_class = None
+    
+    infrastructure = _attach_infrastructure(
+        container, InfrastructureContainer(config=container.config)
+    )
+    if publisher_class:
+        # Resolvido uma vez aqui; o caminho de publish só chama o Singleton
+        infrastructure.event_publisher_backend.set_provides(
+            import_string(publisher_class)
+        )
+    _bind_adapter_classes(container, infrastructure)
+
+
+def _attach_infrastructure(
+    container: Container,
+    infrastructure: containers.Container,
+) -> containers.Container:
+    """
+    Liga uma infraestrutura ao container.
+    
+    O ServiceContainer recebe uma cópia do DependenciesContainer na
+    criação do Container, então o override precisa ser feito nos dois.
+    
+    Args:
+        container: Container principal
+        infrastructure: Instância com os providers de infraestrutura
+            (InfrastructureContainer ou equivalente de teste)
+        
+    Returns:
+        A própria infraestrutura
+    """
+    container.infrastructure.override(infrastructure)
+    container.services.infrastructure.override(infrastructure)
+    return infrastructure
+
+
+def _bind_adapter_classes(
+    container: Container,
+    infrastructure: InfrastructureContainer,
+) -> None:
+    """
+    Liga os providers de infraestrutura direto às classes dos adapters.
+    
+    Singleton(DjangoTicketRepository) / Factory(DjangoUnitOfWork, ...)
+    instanciam a classe no caminho em C do dependency-injector, sem o
+    frame da factory lazy. Os adapters importam models, então só dá
+    para importá-los com os models carregados (models_ready, o que já
+    vale dentro de AppConfig.ready()); antes disso (import precoce do
+    container) as factories lazy continuam valendo.
+    """
+    try:
+        from django.apps import apps
+        if not apps.models_ready:
+            return
+    except ImportError:
+        return
+    
+    for provider_name, (module_path, class_name) in _ADAPTER_CLASSES.items():
+        getattr(infrastructure, provider_name).set_provides(
+            _import_class(module_path, class_name)
+        )
+    
+    _warm_container(container, infrastructure)
+
+
+# Singletons criados junto com o container (ainda sob _container_lock)
+_EAGER_SINGLETONS = ('ticket_repository', 'event_store', 'event_publisher')
+
+
+def _warm_container(
+    container: Container,
+    infrastructure: InfrastructureContainer,
+) -> None:
+    """
+    Valida o grafo e instancia os singletons de infraestrutura.
+    
+    O grafo não muda depois de configurado: check_dependencies() falha
+    já na criação (e não no primeiro request) se faltar alguma
+    dependência, e os singletons ficam prontos antes do container ser
+    publicado, então o primeiro request de cada service não paga a
+    criação do repositório/publisher.
+    
+    Overrides continuam possíveis (testes), mas devem preferir
+    TestingContainer a .override() no Container global.
+    """
+    container.check_dependencies()
+    for provider_name in _EAGER_SINGLETONS:
+        getattr(infrastructure, provider_name)()
 
 
 def reset_container() -> None:
@@ -355,8 +482,9 @@ def reset_container() -> None:
     """
     global _container
     
-    if _container is not None:
+    with _container_lock:
         _container = None
+        _wired_modules.clear()
     
     logger.debug("Container reset")
 
@@ -372,18 +500,23 @@ def wire_container(modules: list = None) -> None:
     """
     container = get_container()
     
-    default_modules = [
-        'src.adapters.django_app.tickets.views',
-        'src.adapters.django_app.tickets.api_views',
-    ]
+    target_modules = modules if modules else _DEFAULT_WIRE_MODULES
     
-    target_modules = modules if modules else default_modules
+    # Idempotente: módulos já ligados a este container não são
+    # reimportados nem percorridos de novo
+    new_modules = [m for m in target_modules if m not in _wired_modules]
+    if not new_modules:
+        return
     
     try:
-        container.wire(modules=target_modules)
-        logger.info(f"Container wired with modules: {target_modules}")
+        container.wire(
+            modules=[importlib.import_module(m) for m in new_modules]
+        )
+        _wired_modules.update(new_modules)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Container wired with modules: %s", new_modules)
     except Exception as e:
-        logger.warning(f"Could not wire container: {e}")
+        logger.warning("Could not wire container: %s", e)
 
 
 # =============================================================================
@@ -407,55 +540,25 @@ class TestingContainer(containers.DeclarativeContainer):
     config = providers.Configuration()
     
     # In-memory repository
-    @staticmethod
-    def _create_in_memory_repository():
-        """Factory para criar in-memory repository."""
-        from src.core.tickets.ports import InMemoryTicketRepository
-        return InMemoryTicketRepository()
-    
-    ticket_repository = providers.Singleton(_create_in_memory_repository)
+    ticket_repository = providers.Singleton(InMemoryTicketRepository)
     
     # In-memory UoW
-    @staticmethod
-    def _create_in_memory_uow():
-        """Factory para criar in-memory UoW."""
-        from src.adapters.django_app.shared.unit_of_work import InMemoryUnitOfWork
-        return InMemoryUnitOfWork()
-    
-    unit_of_work_factory = providers.Factory(_create_in_memory_uow)
+    unit_of_work_factory = providers.Factory(InMemoryUnitOfWork)
     
     # Services com in-memory dependencies
-    @staticmethod
-    def _create_criar_ticket_service_test(ticket_repo, uow):
-        """Factory para CriarTicketService em testes."""
-        from src.core.tickets.use_cases import CriarTicketService
-        return CriarTicketService(ticket_repo=ticket_repo, uow=uow)
-    
     criar_ticket_service = providers.Factory(
-        _create_criar_ticket_service_test,
+        CriarTicketService,
         ticket_repo=ticket_repository,
         uow=unit_of_work_factory,
     )
     
-    @staticmethod
-    def _create_listar_tickets_service_test(ticket_repo):
-        """Factory para ListarTicketsService em testes."""
-        from src.core.tickets.use_cases import ListarTicketsService
-        return ListarTicketsService(ticket_repo=ticket_repo)
-    
     listar_tickets_service = providers.Factory(
-        _create_listar_tickets_service_test,
+        ListarTicketsService,
         ticket_repo=ticket_repository,
     )
     
-    @staticmethod
-    def _create_obter_ticket_service_test(ticket_repo):
-        """Factory para ObterTicketService em testes."""
-        from src.core.tickets.use_cases import ObterTicketService
-        return ObterTicketService(ticket_repo=ticket_repo)
-    
     obter_ticket_service = providers.Factory(
-        _create_obter_ticket_service_test,
+        ObterTicketService,
         ticket_repo=ticket_repository,
     )
 
@@ -468,11 +571,5 @@ def create_test_container() -> TestingContainer:
         TestingContainer pronto para uso
     """
     container = TestingContainer()
-    container.config.from_dict({
-        'debug': True,
-        'sla_critica_horas': 4,
-        'sla_alta_horas': 24,
-        'sla_media_horas': 72,
-        'sla_baixa_horas': 168,
-    })
+    container.config.from_dict(_DEFAULT_CONFIG)
     return container
@@ -67,13 +67,19 @@ INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + LOCAL_APPS
 # =============================================================================
 
 MIDDLEWARE = [
+    # Primeiro: /health/ responde sem o resto da pilha nem o URL resolver
+    'src.adapters.django_app.shared.middleware.HealthCheckMiddleware',
     'django.middleware.security.SecurityMiddleware',
+    # Antes dos demais: comprime a resposta final (HTML e JSON da API)
+    'django.middleware.gzip.GZipMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    # Eventos de domínio do request publicados em lote ao final
+    'src.adapters.django_app.events.middleware.EventBatchMiddleware',
 ]
 
 ROOT_URLCONF = 'src.config.urls'
@@ -101,6 +107,7 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = 'src.config.wsgi.application'
+ASGI_APPLICATION = 'src.config.asgi.application'  # API async (uvicorn/daphne)
 
 # =============================================================================
 # Banco de Dados
@@ -128,6 +135,11 @@ else:
     DB_PORT = os.getenv('DATABASE_PORT', '5432')
     DB_NAME = os.getenv('DATABASE_NAME', 'techsupport_db')
 
+# Prepared statements (psycopg3): vazio desliga; 0 prepara já na
+# primeira execução (semântica do psycopg, distinta de desligado)
+_DB_PREPARE_THRESHOLD_ENV = os.getenv('DATABASE_PREPARE_THRESHOLD', '5').strip()
+DB_PREPARE_THRESHOLD = int(_DB_PREPARE_THRESHOLD_ENV) if _DB_PREPARE_THRESHOLD_ENV else None
+
 # Determinar engine baseado na configuração
 if DB_NAME and DB_HOST:
     DATABASES = {
@@ -138,9 +150,21 @@ if DB_NAME and DB_HOST:
             'PASSWORD': DB_PASSWORD,
             'HOST': DB_HOST,
             'PORT': DB_PORT,
-            'CONN_MAX_AGE': 60,  # Connection pooling
+            # Conexões persistentes: evita handshake por request e mantém
+            # os prepared statements da sessão vivos entre requests
+            'CONN_MAX_AGE': int(os.getenv('DATABASE_CONN_MAX_AGE', '600')),
+            'CONN_HEALTH_CHECKS': True,
             'OPTIONS': {
                 'connect_timeout': 10,
+                # psycopg3: queries executadas >= N vezes viram PREPARE
+                # server-side. O backend do Django só prepara com
+                # server_side_binding=True (ServerBindingCursor); com o
+                # default (ClientCursor) o threshold não tem efeito.
+                # Atrás de PgBouncer em transaction pooling os prepares não
+                # sobrevivem à troca de conexão: use
+                # DATABASE_PREPARE_THRESHOLD='' para desligar os dois.
+                'server_side_binding': DB_PREPARE_THRESHOLD is not None,
+                'prepare_threshold': DB_PREPARE_THRESHOLD,
             },
         }
     }
@@ -186,6 +210,16 @@ else:
         }
     }
 
+# =============================================================================
+# Mensagens (flash)
+# =============================================================================
+
+# Só cookie: as views de escrita definem a mensagem e redirecionam em
+# seguida, então ela cabe no cookie da resposta. Sem o fallback para
+# sessão do FallbackStorage (default), nenhum POST salva a sessão só
+# por causa de uma mensagem.
+MESSAGE_STORAGE = 'django.contrib.messages.storage.cookie.CookieStorage'
+
 # =============================================================================
 # Validação de Senha
 # =============================================================================
@@ -282,11 +316,13 @@ LOGGING = {
 # Configurações de SLA (Domain)
 # =============================================================================
 
+# Lido uma vez no load dos settings; o container copia para a sua
+# config ao ser criado (não relê o ambiente por request)
 SLA_HOURS = {
-    'CRITICA': int(os.getenv('SLA_CRITICA_HORAS', 4)),
-    'ALTA': int(os.getenv('SLA_ALTA_HORAS', 24)),
-    'MEDIA': int(os.getenv('SLA_MEDIA_HORAS', 72)),
-    'BAIXA': int(os.getenv('SLA_BAIXA_HORAS', 168)),
+    'CRITICA': int(os.getenv('SLA_CRITICA_HORAS', '4')),
+    'ALTA': int(os.getenv('SLA_ALTA_HORAS', '24')),
+    'MEDIA': int(os.getenv('SLA_MEDIA_HORAS', '72')),
+    'BAIXA': int(os.getenv('SLA_BAIXA_HORAS', '168')),
 }
 
 # =============================================================================
@@ -300,15 +336,15 @@ CELERY_BROKER_URL = os.getenv(
 )
 
 # Backend de resultados (Redis)
-CELERY_RESULT_BACKEND = os.getenv(
-    'CELERY_RESULT_BACKEND',
-    REDIS_URL + '/1' if REDIS_URL else 'redis://localhost:6379/1'
-)
+_DEFAULT_RESULT_BACKEND = f'{REDIS_URL}/1' if REDIS_URL else 'redis://localhost:6379/1'
+CELERY_RESULT_BACKEND = os.getenv('CELERY_RESULT_BACKEND', _DEFAULT_RESULT_BACKEND)
 
 # Serialização
-CELERY_ACCEPT_CONTENT = ['json']
-CELERY_TASK_SERIALIZER = 'json'
-CELERY_RESULT_SERIALIZER = 'json'
+# msgpack: payloads de evento menores e (de)serialização mais barata que
+# JSON; json continua aceito para mensagens já enfileiradas no deploy
+CELERY_ACCEPT_CONTENT = ['msgpack', 'json']
+CELERY_TASK_SERIALIZER = 'msgpack'
+CELERY_RESULT_SERIALIZER = 'msgpack'
 
 # Timezone
 CELERY_TIMEZONE = TIME_ZONE
@@ -317,7 +353,10 @@ CELERY_ENABLE_UTC = True
 # Configurações de execução
 CELERY_TASK_ACKS_LATE = True
 CELERY_TASK_REJECT_ON_WORKER_LOST = True
-CELERY_WORKER_PREFETCH_MULTIPLIER = 1
+# Prefetch: handlers de evento são curtos e IO-bound (notificação,
+# projeção), onde 2-4 mensagens por processo rendem mais que 1. Para
+# workers de tarefas longas/CPU-bound (relatórios), usar 1.
+CELERY_WORKER_PREFETCH_MULTIPLIER = int(os.getenv('CELERY_PREFETCH_MULTIPLIER', '4'))
 
 # Retry
 CELERY_TASK_DEFAULT_RETRY_DELAY = 60
@@ -330,3 +369,13 @@ CELERY_RESULT_EXPIRES = 3600  # 1 hora
 # 'sync' = LoggingEventPublisher (desenvolvimento)
 # 'celery' = CeleryEventPublisher (produção)
 EVENT_PUBLISHER_MODE = os.getenv('EVENT_PUBLISHER_MODE', 'sync')
+
+# Classe do publisher, decidida aqui uma vez; o container importa e liga
+# no startup (nenhuma comparação de modo por evento publicado)
+if EVENT_PUBLISHER_MODE == 'celery':
+    EVENT_PUBLISHER_CLASS = 'src.adapters.django_app.events.publishers.CeleryEventPublisher'
+else:
+    EVENT_PUBLISHER_CLASS = 'src.adapters.django_app.events.publishers.LoggingEventPublisher'
+
+# Event Store: grava eventos com INSERT cru (executemany) em vez de save()
+FAST_EVENT_WRITE = os.getenv('FAST_EVENT_WRITE', 'False').lower() in ('true', '1', 'yes')
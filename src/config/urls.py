@@ -17,8 +17,7 @@ urlpatterns = [
     # Tickets App
     path('tickets/', include('src.adapters.django_app.tickets.urls')),
     
-    # Health check
-    path('health/', lambda r: __import__('django.http', fromlist=['JsonResponse']).JsonResponse({'status': 'ok'})),
+    # Health check: /health/ é respondido por HealthCheckMiddleware
 ]
 
 # Adicionar URLs de debug em desenvolvimento
@@ -16,14 +16,31 @@ Pattern: Event Sourcing Simplificado
     - Event Store persiste histórico (opcional)
 """
 
-from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
-from datetime import datetime
+from abc import ABC
+from dataclasses import dataclass, field, fields
+from datetime import datetime, timezone
+from functools import partial
 from typing import Any, Dict, Optional, ClassVar
 import uuid
 
 
-@dataclass(frozen=False)  # frozen=False para permitir inicialização customizada
+# Campos de DomainEvent (fora do payload "data" de to_dict)
+_BASE_FIELDS = frozenset({"event_id", "aggregate_id", "occurred_at", "version"})
+
+
+def _new_event_id() -> str:
+    """
+    Gera o ID de um evento (UUID4 em texto, formato com hífens).
+    
+    Função de módulo referenciada direto pelo default_factory (sem o
+    frame extra de uma lambda por evento).
+    """
+    return str(uuid.uuid4())
+
+
+# frozen=True: fatos históricos, compartilháveis sem cópia e hasheáveis;
+# slots=True: sem __dict__ por evento. Subclasses declaram os dois.
+@dataclass(frozen=True, slots=True)
 class DomainEvent(ABC):
     """
     Classe base abstrata para Domain Events.
@@ -39,58 +56,55 @@ class DomainEvent(ABC):
     Attributes:
         event_id: Identificador único do evento
         aggregate_id: ID do agregado que gerou o evento
+        event_type: Tipo do evento (nome da classe)
         aggregate_type: Tipo do agregado (ex: "Ticket")
-        occurred_at: Momento em que o evento ocorreu
+        occurred_at: Momento em que o evento ocorreu (UTC, timezone-aware)
         version: Versão do schema do evento (para evolução)
     
     Example:
-        @dataclass
+        @dataclass(frozen=True, slots=True)
         class TicketCriadoEvent(DomainEvent):
+            aggregate_type: ClassVar[str] = "Ticket"
+            
             criador_id: str
             titulo: str
-            
-            @property
-            def aggregate_type(self) -> str:
-                return "Ticket"
     """
     
     # Campos comuns a todos os eventos
-    event_id: str = field(default_factory=lambda: str(uuid.uuid4()))
-    aggregate_id: str = ""
-    occurred_at: datetime = field(default_factory=datetime.now)
+    event_id: str = field(default_factory=_new_event_id)
+    # Obrigatório (keyword-only): o construtor rejeita a ausência e
+    # __post_init__ rejeita o valor vazio
+    aggregate_id: str = field(kw_only=True)
+    # Aware em UTC desde a criação: quem persiste (DateTimeField com
+    # USE_TZ) não precisa converter/localizar cada evento
+    occurred_at: datetime = field(default_factory=partial(datetime.now, timezone.utc))
     version: int = 1  # Para versionamento de schema
     
-    # Metadata para serialização
-    _event_type: ClassVar[str] = ""
-    
-    def __post_init__(self):
+    # Tipo do evento (nome da classe), fixado por __init_subclass__:
+    # to_dict()/__repr__ leem um atributo de classe, sem __class__.__name__
+    event_type: ClassVar[str] = ""
+    
+    # Tipo do agregado que gera o evento (ex: "Ticket", "Agendamento").
+    # Constante de classe (não property): to_dict() lê um atributo, sem
+    # chamar método por evento. Obrigatório nas subclasses.
+    aggregate_type: ClassVar[str] = ""
+    
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Fixa event_type e garante que a subclasse declara aggregate_type."""
+        # super() explícito: slots=True recria a classe e o super() sem
+        # argumentos ficaria preso à classe original
+        super(DomainEvent, cls).__init_subclass__(**kwargs)
+        cls.event_type = cls.__name__
+        if not cls.aggregate_type:
+            raise TypeError(
+                f"{cls.__name__} deve definir aggregate_type (ClassVar[str])"
+            )
+    
+    def __post_init__(self) -> None:
         """Validação após inicialização."""
         if not self.aggregate_id:
             raise ValueError("aggregate_id é obrigatório")
     
-    @property
-    @abstractmethod
-    def aggregate_type(self) -> str:
-        """
-        Retorna o tipo do agregado que gerou este evento.
-        
-        Deve ser implementado por subclasses.
-        
-        Returns:
-            Nome do tipo do agregado (ex: "Ticket", "Agendamento")
-        """
-        ...
-    
-    @property
-    def event_type(self) -> str:
-        """
-        Retorna o tipo do evento (nome da classe).
-        
-        Returns:
-            Nome da classe do evento
-        """
-        return self.__class__.__name__
-    
     def to_dict(self) -> Dict[str, Any]:
         """
         Serializa evento para dicionário.
@@ -122,12 +136,12 @@ class DomainEvent(ABC):
         Returns:
             Dicionário com dados específicos do evento
         """
-        # Pega todos os campos que não são os da classe base
-        base_fields = {"event_id", "aggregate_id", "occurred_at", "version"}
+        # Pega todos os campos que não são os da classe base (sem
+        # __dict__ com slots=True; fields() cobre os dois casos)
         return {
-            key: value
-            for key, value in self.__dict__.items()
-            if key not in base_fields and not key.startswith("_")
+            f.name: getattr(self, f.name)
+            for f in fields(self)
+            if f.name not in _BASE_FIELDS and not f.name.startswith("_")
         }
     
     @classmethod
@@ -149,7 +163,7 @@ class DomainEvent(ABC):
         """
         event_data = data.get("data", {})
         return cls(
-            event_id=data.get("event_id", str(uuid.uuid4())),
+            event_id=data.get("event_id") or _new_event_id(),
             aggregate_id=data["aggregate_id"],
             occurred_at=datetime.fromisoformat(data["occurred_at"]),
             version=data.get("version", 1),
@@ -178,6 +192,7 @@ class EventMetadata:
     
     Attributes:
         correlation_id: ID para rastrear fluxo de eventos relacionados
+            (gerado no primeiro acesso se não informado)
         causation_id: ID do evento que causou este
         user_id: ID do usuário que iniciou a ação
         timestamp: Momento do registro (pode diferir de occurred_at)
@@ -189,11 +204,26 @@ class EventMetadata:
         causation_id: Optional[str] = None,
         user_id: Optional[str] = None,
     ):
-        self.correlation_id = correlation_id or str(uuid.uuid4())
+        self._correlation_id = correlation_id or None
         self.causation_id = causation_id
         self.user_id = user_id
         self.timestamp = datetime.now()
     
+    @property
+    def correlation_id(self) -> str:
+        """
+        Retorna o correlation ID, gerando-o no primeiro acesso.
+        
+        Metadata que nunca sai do processo não paga o uuid4(); o ID
+        é gerado em hexadecimal (32 caracteres, sem hífens).
+        
+        Returns:
+            Correlation ID
+        """
+        if self._correlation_id is None:
+            self._correlation_id = uuid.uuid4().hex
+        return self._correlation_id
+    
     def to_dict(self) -> Dict[str, Any]:
         """Serializa metadata para dicionário."""
         return {
@@ -30,16 +30,21 @@ class DomainException(Exception):
         self.message = message
         self.code = code or self.__class__.__name__
         super().__init__(self.message)
+        # Formatados uma vez: str(e) / to_dict() costumam ser chamados
+        # mais de uma vez por erro (log + resposta)
+        self._str = f"[{self.code}] {self.message}"
+        self._base_dict = {
+            "error": self.code,
+            "message": self.message,
+        }
     
     def __str__(self) -> str:
-        return f"[{self.code}] {self.message}"
+        return self._str
     
     def to_dict(self) -> dict:
         """Serializa exceção para dicionário (útil para APIs)."""
-        return {
-            "error": self.code,
-            "message": self.message,
-        }
+        # Cópia: subclasses acrescentam campos ao resultado
+        return dict(self._base_dict)
 
 
 class ValidationError(DomainException):
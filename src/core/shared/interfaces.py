@@ -13,7 +13,8 @@ O fluxo de dependência sempre aponta para o Core.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional, TypeVar, Generic, Protocol
+from collections import deque
+from typing import Deque, List, Optional, Tuple, TypeVar, Generic, Protocol
 from contextlib import contextmanager
 
 from .events import DomainEvent
@@ -22,8 +23,11 @@ from .events import DomainEvent
 # Type variable para entidades genéricas
 T = TypeVar("T")
 
+# Métodos que toda implementação de UnitOfWork deve sobrescrever
+_UOW_ABSTRACT_METHODS = ("_begin_transaction", "commit", "rollback")
 
-class UnitOfWork(ABC):
+
+class UnitOfWork:
     """
     Unit of Work - Coordena transações atômicas.
     
@@ -50,10 +54,34 @@ class UnitOfWork(ABC):
             def commit(self):
                 transaction.commit()
                 self._publish_events()
+    
+    Note:
+        Classe base simples (sem ABC): um UoW é criado por request e
+        ABCMeta checaria __abstractmethods__ a cada instância. A
+        obrigação de sobrescrever _begin_transaction/commit/rollback
+        é verificada uma vez, na definição da subclasse.
     """
     
+    def __init_subclass__(cls, **kwargs):
+        """
+        Valida que a subclasse implementa os métodos obrigatórios.
+        
+        Raises:
+            TypeError: Se algum de _UOW_ABSTRACT_METHODS não foi sobrescrito
+        """
+        super().__init_subclass__(**kwargs)
+        missing = [
+            name for name in _UOW_ABSTRACT_METHODS
+            if getattr(cls, name) is getattr(UnitOfWork, name)
+        ]
+        if missing:
+            raise TypeError(
+                f"{cls.__name__} deve implementar: {', '.join(missing)}"
+            )
+    
     def __init__(self):
-        self._events: List[DomainEvent] = []
+        # deque: append O(1) sem realocação em lotes grandes
+        self._events: Deque[DomainEvent] = deque()
     
     def __enter__(self) -> "UnitOfWork":
         """
@@ -83,7 +111,6 @@ class UnitOfWork(ABC):
             self.commit()
         return False  # Não suprime exceções
     
-    @abstractmethod
     def _begin_transaction(self) -> None:
         """
         Inicia uma nova transação.
@@ -93,7 +120,6 @@ class UnitOfWork(ABC):
         """
         raise NotImplementedError
     
-    @abstractmethod
     def commit(self) -> None:
         """
         Persiste todas as mudanças e publica eventos.
@@ -109,7 +135,6 @@ class UnitOfWork(ABC):
         """
         raise NotImplementedError
     
-    @abstractmethod
     def rollback(self) -> None:
         """
         Desfaz todas as mudanças e descarta eventos.
@@ -134,19 +159,20 @@ class UnitOfWork(ABC):
             with uow:
                 ticket = Ticket.criar(...)
                 repo.save(ticket)
-                uow.publish_event(TicketCriadoEvent(ticket.id))
+                uow.publish_event(TicketCriadoEvent(aggregate_id=ticket.id))
             # Evento publicado aqui, após commit
         """
         self._events.append(event)
     
-    def collect_events(self) -> List[DomainEvent]:
+    def collect_events(self) -> Tuple[DomainEvent, ...]:
         """
         Retorna eventos enfileirados (para testing/debugging).
         
         Returns:
-            Lista de eventos pendentes
+            Tupla (imutável) dos eventos pendentes; os eventos são
+            frozen, então podem ser compartilhados sem cópia
         """
-        return list(self._events)
+        return tuple(self._events)
     
     def clear_events(self) -> None:
         """Limpa fila de eventos."""
@@ -278,7 +304,20 @@ class EventStore(ABC):
             ConcurrencyError: Se versão não corresponde
         """
         raise NotImplementedError
-    
+
+    @abstractmethod
+    def append_batch(self, events: List[DomainEvent]) -> None:
+        """
+        Adiciona os eventos de um commit ao store, em uma única gravação.
+
+        Chamado uma vez por commit do Unit of Work, dentro da transação.
+        A sequência de cada evento no seu agregado é atribuída pelo store.
+
+        Args:
+            events: Eventos na ordem em que ocorreram
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def get_events_for_aggregate(
         self,
@@ -18,7 +18,7 @@ Benefícios:
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Tuple
 
 from .entities import TicketEntity, TicketStatus, TicketPriority
 
@@ -27,13 +27,14 @@ from .entities import TicketEntity, TicketStatus, TicketPriority
 # INPUT DTOs (Entrada)
 # =============================================================================
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CriarTicketInputDTO:
     """
     DTO de entrada para criar ticket.
     
     Imutável (frozen=True) para garantir que dados
-    validados não sejam alterados acidentalmente.
+    validados não sejam alterados acidentalmente; slots=True
+    dispensa o __dict__ por instância.
     
     Attributes:
         titulo: Título do ticket
@@ -49,7 +50,7 @@ class CriarTicketInputDTO:
     criador_id: str
     prioridade: str = "MEDIA"
     categoria: str = "Geral"
-    tags: tuple = field(default_factory=tuple)  # tuple para ser hashable
+    tags: Tuple[str, ...] = ()  # tuple para ser hashable
     
     def to_dict(self) -> dict:
         """Converte para dicionário."""
@@ -63,7 +64,7 @@ class CriarTicketInputDTO:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AtribuirTicketInputDTO:
     """
     DTO de entrada para atribuir ticket.
@@ -86,7 +87,7 @@ class AtribuirTicketInputDTO:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FecharTicketInputDTO:
     """
     DTO de entrada para fechar ticket.
@@ -109,7 +110,7 @@ class FecharTicketInputDTO:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AlterarPrioridadeInputDTO:
     """
     DTO de entrada para alterar prioridade.
@@ -136,7 +137,7 @@ class AlterarPrioridadeInputDTO:
 # OUTPUT DTOs (Saída)
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class TicketOutputDTO:
     """
     DTO de saída completo com dados do ticket.
@@ -220,7 +221,7 @@ class TicketOutputDTO:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class TicketListItemDTO:
     """
     DTO otimizado para listagens de tickets.
@@ -289,7 +290,7 @@ class TicketListItemDTO:
 # QUERY DTOs (Filtros de Busca)
 # =============================================================================
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ListarTicketsQueryDTO:
     """
     DTO para parâmetros de busca/filtro de tickets.
@@ -333,7 +334,7 @@ class ListarTicketsQueryDTO:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class PaginatedResultDTO:
     """
     DTO para resultados paginados.
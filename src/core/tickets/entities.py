@@ -67,9 +67,9 @@ class TicketStatus(Enum):
             pass
         
         # Tenta pelo valor ("Aberto")
-        for status in cls:
-            if status.value.lower() == value.lower():
-                return status
+        status = _STATUS_POR_VALOR.get(value.lower())
+        if status is not None:
+            return status
         
         raise ValueError(f"Status inválido: {value}")
 
@@ -93,13 +93,7 @@ class TicketPriority(Enum):
     @property
     def sla_horas(self) -> int:
         """Retorna horas de SLA para esta prioridade."""
-        sla_map = {
-            TicketPriority.CRITICA: 4,
-            TicketPriority.ALTA: 24,
-            TicketPriority.MEDIA: 72,
-            TicketPriority.BAIXA: 168,
-        }
-        return sla_map[self]
+        return _SLA_HORAS[self]
     
     @classmethod
     def from_string(cls, value: str) -> "TicketPriority":
@@ -122,14 +116,65 @@ class TicketPriority(Enum):
             pass
         
         # Tenta pelo valor ("Média")
-        for priority in cls:
-            if priority.value.lower() == value.lower():
-                return priority
+        priority = _PRIORIDADE_POR_VALOR.get(value.lower())
+        if priority is not None:
+            return priority
         
         raise ValueError(f"Prioridade inválida: {value}")
 
 
-@dataclass
+# Valor em minúsculas -> membro, para from_string() sem varrer o enum
+_STATUS_POR_VALOR = {status.value.lower(): status for status in TicketStatus}
+_PRIORIDADE_POR_VALOR = {
+    prioridade.value.lower(): prioridade for prioridade in TicketPriority
+}
+
+# Transições de status permitidas (ver TicketEntity.alterar_status)
+_TRANSICOES_VALIDAS = {
+    TicketStatus.ABERTO: frozenset({
+        TicketStatus.EM_PROGRESSO,
+        TicketStatus.AGUARDANDO_CLIENTE,
+    }),
+    TicketStatus.EM_PROGRESSO: frozenset({
+        TicketStatus.AGUARDANDO_CLIENTE,
+        TicketStatus.RESOLVIDO,
+    }),
+    TicketStatus.AGUARDANDO_CLIENTE: frozenset({
+        TicketStatus.EM_PROGRESSO,
+        TicketStatus.RESOLVIDO,
+    }),
+    TicketStatus.RESOLVIDO: frozenset({
+        TicketStatus.FECHADO,
+        TicketStatus.EM_PROGRESSO,
+    }),
+    TicketStatus.FECHADO: frozenset({
+        TicketStatus.ABERTO,  # Reabrir
+    }),
+}
+
+# Constantes de validação de TicketEntity (no módulo: com slots=True a
+# classe só guarda os campos do ticket)
+TITULO_MIN_LENGTH = 3
+TITULO_MAX_LENGTH = 200
+DESCRICAO_MIN_LENGTH = 10
+DESCRICAO_MAX_LENGTH = 5000
+
+# SLA por prioridade, montado uma vez no import (não a cada acesso)
+_SLA_HORAS = {
+    TicketPriority.CRITICA: 4,
+    TicketPriority.ALTA: 24,
+    TicketPriority.MEDIA: 72,
+    TicketPriority.BAIXA: 168,
+}
+
+# Mesmo SLA já como timedelta: _calcular_sla() faz uma consulta só
+_SLA_TIMEDELTAS = {
+    prioridade: timedelta(hours=horas)
+    for prioridade, horas in _SLA_HORAS.items()
+}
+
+
+@dataclass(slots=True)
 class TicketEntity:
     """
     Entidade de Domínio: Ticket.
@@ -196,12 +241,6 @@ class TicketEntity:
     # Metadata
     tags: List[str] = field(default_factory=list)
     
-    # Constantes de validação
-    TITULO_MIN_LENGTH: int = 3
-    TITULO_MAX_LENGTH: int = 200
-    DESCRICAO_MIN_LENGTH: int = 10
-    DESCRICAO_MAX_LENGTH: int = 5000
-    
     @classmethod
     def criar(
         cls,
@@ -273,15 +312,15 @@ class TicketEntity:
         
         titulo_limpo = titulo.strip()
         
-        if len(titulo_limpo) < cls.TITULO_MIN_LENGTH:
+        if len(titulo_limpo) < TITULO_MIN_LENGTH:
             raise ValidationError(
-                f"Título deve ter pelo menos {cls.TITULO_MIN_LENGTH} caracteres",
+                f"Título deve ter pelo menos {TITULO_MIN_LENGTH} caracteres",
                 field="titulo"
             )
         
-        if len(titulo_limpo) > cls.TITULO_MAX_LENGTH:
+        if len(titulo_limpo) > TITULO_MAX_LENGTH:
             raise ValidationError(
-                f"Título deve ter no máximo {cls.TITULO_MAX_LENGTH} caracteres",
+                f"Título deve ter no máximo {TITULO_MAX_LENGTH} caracteres",
                 field="titulo"
             )
     
@@ -296,15 +335,15 @@ class TicketEntity:
         
         descricao_limpa = descricao.strip()
         
-        if len(descricao_limpa) < cls.DESCRICAO_MIN_LENGTH:
+        if len(descricao_limpa) < DESCRICAO_MIN_LENGTH:
             raise ValidationError(
-                f"Descrição deve ter pelo menos {cls.DESCRICAO_MIN_LENGTH} caracteres",
+                f"Descrição deve ter pelo menos {DESCRICAO_MIN_LENGTH} caracteres",
                 field="descricao"
             )
         
-        if len(descricao_limpa) > cls.DESCRICAO_MAX_LENGTH:
+        if len(descricao_limpa) > DESCRICAO_MAX_LENGTH:
             raise ValidationError(
-                f"Descrição deve ter no máximo {cls.DESCRICAO_MAX_LENGTH} caracteres",
+                f"Descrição deve ter no máximo {DESCRICAO_MAX_LENGTH} caracteres",
                 field="descricao"
             )
     
@@ -324,8 +363,7 @@ class TicketEntity:
         O SLA é calculado a partir do momento de criação,
         usando as horas definidas para cada prioridade.
         """
-        horas_sla = self.prioridade.sla_horas
-        self.sla_prazo = self.criado_em + timedelta(hours=horas_sla)
+        self.sla_prazo = self.criado_em + _SLA_TIMEDELTAS[self.prioridade]
     
     def atribuir_a(self, tecnico_id: str) -> None:
         """
@@ -376,29 +414,7 @@ class TicketEntity:
         Raises:
             BusinessRuleViolationError: Se transição inválida
         """
-        transicoes_validas = {
-            TicketStatus.ABERTO: [
-                TicketStatus.EM_PROGRESSO,
-                TicketStatus.AGUARDANDO_CLIENTE,
-            ],
-            TicketStatus.EM_PROGRESSO: [
-                TicketStatus.AGUARDANDO_CLIENTE,
-                TicketStatus.RESOLVIDO,
-            ],
-            TicketStatus.AGUARDANDO_CLIENTE: [
-                TicketStatus.EM_PROGRESSO,
-                TicketStatus.RESOLVIDO,
-            ],
-            TicketStatus.RESOLVIDO: [
-                TicketStatus.FECHADO,
-                TicketStatus.EM_PROGRESSO,
-            ],
-            TicketStatus.FECHADO: [
-                TicketStatus.ABERTO,  # Reabrir
-            ],
-        }
-        
-        if novo_status not in transicoes_validas.get(self.status, []):
+        if novo_status not in _TRANSICOES_VALIDAS.get(self.status, frozenset()):
             raise BusinessRuleViolationError(
                 f"Transição de {self.status.value} para {novo_status.value} não é permitida",
                 rule="transicao_status_invalida"
@@ -22,13 +22,13 @@ Uso:
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, Any, Optional, List
+from typing import Any, ClassVar, Dict, List, Optional
 from datetime import datetime
 
 from src.core.shared.events import DomainEvent
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TicketCriadoEvent(DomainEvent):
     """
     Evento: Ticket foi criado.
@@ -47,20 +47,13 @@ class TicketCriadoEvent(DomainEvent):
         categoria: Categoria do ticket
     """
     
+    aggregate_type: ClassVar[str] = "Ticket"
+    
     criador_id: str = ""
     titulo: str = ""
     prioridade: str = ""
     categoria: str = ""
     
-    def __post_init__(self):
-        """Validação e inicialização."""
-        # Não chamar super().__post_init__() pois aggregate_id já está setado
-        pass
-    
-    @property
-    def aggregate_type(self) -> str:
-        return "Ticket"
-    
     def _get_event_data(self) -> Dict[str, Any]:
         return {
             "criador_id": self.criador_id,
@@ -70,7 +63,7 @@ class TicketCriadoEvent(DomainEvent):
         }
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TicketAtribuidoEvent(DomainEvent):
     """
     Evento: Ticket foi atribuído a técnico.
@@ -87,16 +80,11 @@ class TicketAtribuidoEvent(DomainEvent):
         atribuido_por_id: ID de quem fez a atribuição (opcional)
     """
     
+    aggregate_type: ClassVar[str] = "Ticket"
+    
     tecnico_id: str = ""
     atribuido_por_id: Optional[str] = None
     
-    def __post_init__(self):
-        pass
-    
-    @property
-    def aggregate_type(self) -> str:
-        return "Ticket"
-    
     def _get_event_data(self) -> Dict[str, Any]:
         data = {"tecnico_id": self.tecnico_id}
         if self.atribuido_por_id:
@@ -104,7 +92,7 @@ class TicketAtribuidoEvent(DomainEvent):
         return data
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TicketFechadoEvent(DomainEvent):
     """
     Evento: Ticket foi fechado.
@@ -122,17 +110,12 @@ class TicketFechadoEvent(DomainEvent):
         dentro_sla: Se foi resolvido dentro do SLA
     """
     
+    aggregate_type: ClassVar[str] = "Ticket"
+    
     fechado_por_id: str = ""
     tempo_resolucao_horas: Optional[float] = None
     dentro_sla: bool = True
     
-    def __post_init__(self):
-        pass
-    
-    @property
-    def aggregate_type(self) -> str:
-        return "Ticket"
-    
     def _get_event_data(self) -> Dict[str, Any]:
         return {
             "fechado_por_id": self.fechado_por_id,
@@ -141,7 +124,7 @@ class TicketFechadoEvent(DomainEvent):
         }
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TicketReabertoEvent(DomainEvent):
     """
     Evento: Ticket foi reaberto.
@@ -158,16 +141,11 @@ class TicketReabertoEvent(DomainEvent):
         motivo: Motivo da reabertura (opcional)
     """
     
+    aggregate_type: ClassVar[str] = "Ticket"
+    
     reaberto_por_id: str = ""
     motivo: Optional[str] = None
     
-    def __post_init__(self):
-        pass
-    
-    @property
-    def aggregate_type(self) -> str:
-        return "Ticket"
-    
     def _get_event_data(self) -> Dict[str, Any]:
         data = {"reaberto_por_id": self.reaberto_por_id}
         if self.motivo:
@@ -175,7 +153,7 @@ class TicketReabertoEvent(DomainEvent):
         return data
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TicketPrioridadeAlteradaEvent(DomainEvent):
     """
     Evento: Prioridade do ticket foi alterada.
@@ -193,17 +171,12 @@ class TicketPrioridadeAlteradaEvent(DomainEvent):
         alterado_por_id: ID de quem alterou
     """
     
+    aggregate_type: ClassVar[str] = "Ticket"
+    
     prioridade_anterior: str = ""
     prioridade_nova: str = ""
     alterado_por_id: str = ""
     
-    def __post_init__(self):
-        pass
-    
-    @property
-    def aggregate_type(self) -> str:
-        return "Ticket"
-    
     def _get_event_data(self) -> Dict[str, Any]:
         return {
             "prioridade_anterior": self.prioridade_anterior,
@@ -212,7 +185,7 @@ class TicketPrioridadeAlteradaEvent(DomainEvent):
         }
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TicketComentarioAdicionadoEvent(DomainEvent):
     """
     Evento: Comentário foi adicionado ao ticket.
@@ -223,17 +196,12 @@ class TicketComentarioAdicionadoEvent(DomainEvent):
         e_interno: Se é comentário interno (não visível ao cliente)
     """
     
+    aggregate_type: ClassVar[str] = "Ticket"
+    
     autor_id: str = ""
     conteudo_preview: str = ""
     e_interno: bool = False
     
-    def __post_init__(self):
-        pass
-    
-    @property
-    def aggregate_type(self) -> str:
-        return "Ticket"
-    
     def _get_event_data(self) -> Dict[str, Any]:
         return {
             "autor_id": self.autor_id,
@@ -242,7 +210,7 @@ class TicketComentarioAdicionadoEvent(DomainEvent):
         }
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TicketSLAVioladoEvent(DomainEvent):
     """
     Evento: SLA do ticket foi violado (atrasou).
@@ -261,17 +229,12 @@ class TicketSLAVioladoEvent(DomainEvent):
         tecnico_responsavel_id: ID do técnico (se atribuído)
     """
     
+    aggregate_type: ClassVar[str] = "Ticket"
+    
     prazo_sla: datetime = field(default_factory=datetime.now)
     horas_atraso: float = 0.0
     tecnico_responsavel_id: Optional[str] = None
     
-    def __post_init__(self):
-        pass
-    
-    @property
-    def aggregate_type(self) -> str:
-        return "Ticket"
-    
     def _get_event_data(self) -> Dict[str, Any]:
         data = {
             "prazo_sla": self.prazo_sla.isoformat(),
@@ -21,7 +21,7 @@ Example:
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional, Protocol, runtime_checkable
+from typing import Any, Dict, Iterator, List, Optional, Protocol, Tuple, runtime_checkable
 
 from .entities import TicketEntity, TicketStatus, TicketPriority
 from .dtos import TicketListItemDTO, ListarTicketsQueryDTO, PaginatedResultDTO
@@ -45,6 +45,7 @@ class TicketRepository(Protocol):
         get_by_id: Busca por ID
         delete: Remove ticket
         list_all: Lista todos
+        iter_all: Itera todos (memória constante)
         list_by_status: Filtra por status
         list_by_criador: Filtra por criador
         list_by_tecnico: Filtra por técnico atribuído
@@ -84,6 +85,18 @@ class TicketRepository(Protocol):
         """
         ...
     
+    async def aget_by_id(self, ticket_id: str) -> Optional[TicketEntity]:
+        """
+        Versão assíncrona de get_by_id (views async / ASGI).
+        
+        Args:
+            ticket_id: Identificador único do ticket
+            
+        Returns:
+            Entidade encontrada ou None se não existir
+        """
+        ...
+    
     def delete(self, ticket_id: str) -> None:
         """
         Remove ticket do repositório.
@@ -100,26 +113,64 @@ class TicketRepository(Protocol):
         """
         Lista todos os tickets.
         
-        Atenção: Em produção com muitos dados, prefira métodos
-        com paginação.
+        Atenção: Em produção com muitos dados, prefira iter_all ou
+        métodos com paginação.
         
         Returns:
             Lista de todos os tickets
         """
         ...
     
-    def list_by_status(self, status: TicketStatus) -> List[TicketEntity]:
+    def iter_all(self) -> Iterator[TicketEntity]:
+        """
+        Itera todos os tickets sem carregar a tabela inteira em memória.
+        
+        Returns:
+            Iterador de tickets
+        """
+        ...
+    
+    def list_by_status(
+        self,
+        status: TicketStatus,
+        limit: Optional[int] = None,
+    ) -> List[TicketEntity]:
         """
         Lista tickets por status.
         
         Args:
             status: Status para filtrar
+            limit: Máximo de tickets, mais recentes primeiro (None = todos)
             
         Returns:
             Lista de tickets com o status especificado
         """
         ...
     
+    def list_recentes(self, limit: int) -> List[TicketEntity]:
+        """
+        Lista os tickets criados mais recentemente.
+        
+        Args:
+            limit: Máximo de tickets
+            
+        Returns:
+            Tickets em ordem decrescente de criação
+        """
+        ...
+    
+    def list_atrasados(self, limit: Optional[int] = None) -> List[TicketEntity]:
+        """
+        Lista tickets com SLA vencido, do mais atrasado ao menos.
+        
+        Args:
+            limit: Máximo de tickets (None = todos)
+            
+        Returns:
+            Tickets atrasados
+        """
+        ...
+    
     def list_by_criador(self, criador_id: str) -> List[TicketEntity]:
         """
         Lista tickets de um criador.
@@ -176,6 +227,60 @@ class TicketRepository(Protocol):
             Número de tickets com o status
         """
         ...
+    
+    def count_grouped_by_status(self) -> Dict[str, int]:
+        """
+        Conta todos os status de uma vez (um GROUP BY), em vez de uma
+        chamada de count_by_status por status.
+        
+        Returns:
+            {status: quantidade}, apenas status com ao menos 1 ticket
+        """
+        ...
+    
+    def get_estatisticas(self) -> Dict[str, Any]:
+        """
+        Estatísticas gerais em uma única consulta.
+        
+        Returns:
+            Dict com total, por_status, por_prioridade, atrasados e
+            taxa_atraso (status/prioridade sem tickets podem ser omitidos)
+        """
+        ...
+    
+    def list_with_status_counts(
+        self,
+        status: Optional[TicketStatus] = None,
+        criador_id: Optional[str] = None,
+        tecnico_id: Optional[str] = None,
+        prioridade: Optional[TicketPriority] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        completo: bool = False,
+    ) -> Tuple[List[TicketEntity], Dict[str, Any]]:
+        """
+        Lista tickets filtrados junto com a contagem por status.
+        
+        As contagens respeitam criador/técnico, mas não os filtros de
+        status e prioridade (para que todos os status continuem visíveis).
+        
+        Args:
+            status: Filtrar lista por status
+            criador_id: Filtrar por criador
+            tecnico_id: Filtrar por técnico
+            prioridade: Filtrar lista por prioridade
+            offset: Itens a pular (com limit)
+            limit: Máximo de itens na lista (None = todos); a paginação
+                acontece no armazenamento, não no chamador
+            completo: Carregar todos os campos (com descricao/tags); por
+                padrão a lista pode trazer só os campos de listagem
+            
+        Returns:
+            Tupla (entidades, {"total": int, "filtrados": int,
+            "por_status": {status: int}}); "filtrados" conta os itens
+            que passam em todos os filtros, antes do limit
+        """
+        ...
 
 
 class TicketQueryRepository(Protocol):
@@ -270,6 +375,10 @@ class InMemoryTicketRepository:
         """Busca ticket por ID."""
         return self._tickets.get(ticket_id)
     
+    async def aget_by_id(self, ticket_id: str) -> Optional[TicketEntity]:
+        """Busca ticket por ID (async)."""
+        return self._tickets.get(ticket_id)
+    
     def delete(self, ticket_id: str) -> None:
         """Remove ticket."""
         if ticket_id in self._tickets:
@@ -279,9 +388,34 @@ class InMemoryTicketRepository:
         """Lista todos os tickets."""
         return list(self._tickets.values())
     
-    def list_by_status(self, status: TicketStatus) -> List[TicketEntity]:
+    def iter_all(self) -> Iterator[TicketEntity]:
+        """Itera todos os tickets."""
+        return iter(list(self._tickets.values()))
+    
+    def list_by_status(
+        self,
+        status: TicketStatus,
+        limit: Optional[int] = None,
+    ) -> List[TicketEntity]:
         """Filtra por status."""
-        return [t for t in self._tickets.values() if t.status == status]
+        tickets = [t for t in self._tickets.values() if t.status == status]
+        if limit is None:
+            return tickets
+        return sorted(tickets, key=lambda t: t.criado_em, reverse=True)[:limit]
+    
+    def list_recentes(self, limit: int) -> List[TicketEntity]:
+        """Mais recentes primeiro."""
+        return sorted(
+            self._tickets.values(), key=lambda t: t.criado_em, reverse=True
+        )[:limit]
+    
+    def list_atrasados(self, limit: Optional[int] = None) -> List[TicketEntity]:
+        """Atrasados, do SLA mais antigo ao mais novo."""
+        tickets = sorted(
+            (t for t in self._tickets.values() if t.esta_atrasado),
+            key=lambda t: t.sla_prazo,
+        )
+        return tickets if limit is None else tickets[:limit]
     
     def list_by_criador(self, criador_id: str) -> List[TicketEntity]:
         """Filtra por criador."""
@@ -306,6 +440,65 @@ class InMemoryTicketRepository:
         """Conta por status."""
         return len([t for t in self._tickets.values() if t.status == status])
     
+    def count_grouped_by_status(self) -> Dict[str, int]:
+        """Conta por status, agrupado."""
+        counts: Dict[str, int] = {}
+        for t in self._tickets.values():
+            counts[t.status.value] = counts.get(t.status.value, 0) + 1
+        return counts
+    
+    def get_estatisticas(self) -> Dict[str, Any]:
+        """Estatísticas gerais."""
+        tickets = list(self._tickets.values())
+        total = len(tickets)
+        atrasados = len([t for t in tickets if t.esta_atrasado])
+        por_status = {}
+        por_prioridade = {}
+        for t in tickets:
+            por_status[t.status.value] = por_status.get(t.status.value, 0) + 1
+            por_prioridade[t.prioridade.value] = por_prioridade.get(t.prioridade.value, 0) + 1
+        return {
+            "total": total,
+            "por_status": por_status,
+            "por_prioridade": por_prioridade,
+            "atrasados": atrasados,
+            "taxa_atraso": (atrasados / total * 100) if total > 0 else 0,
+        }
+    
+    def list_with_status_counts(
+        self,
+        status: Optional[TicketStatus] = None,
+        criador_id: Optional[str] = None,
+        tecnico_id: Optional[str] = None,
+        prioridade: Optional[TicketPriority] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        completo: bool = False,
+    ) -> Tuple[List[TicketEntity], Dict[str, Any]]:
+        """Lista filtrada + contagem por status."""
+        base = [
+            t for t in self._tickets.values()
+            if (criador_id is None or t.criador_id == criador_id)
+            and (tecnico_id is None or t.atribuido_a_id == tecnico_id)
+        ]
+        counts = {
+            "total": len(base),
+            "por_status": {
+                s.value: len([t for t in base if t.status == s])
+                for s in TicketStatus
+            },
+        }
+        tickets = [
+            t for t in base
+            if (status is None or t.status == status)
+            and (prioridade is None or t.prioridade == prioridade)
+        ]
+        counts["filtrados"] = len(tickets)
+        if limit is not None:
+            tickets = sorted(tickets, key=lambda t: t.criado_em, reverse=True)
+            tickets = tickets[offset:offset + limit]
+        return tickets, counts
+    
     def clear(self) -> None:
         """Limpa todos os dados (útil para testes)."""
         self._tickets.clear()
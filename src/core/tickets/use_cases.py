@@ -26,7 +26,7 @@ Princípios:
 - Sem lógica de infraestrutura
 """
 
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import datetime
 
 from src.core.shared.interfaces import UnitOfWork
@@ -423,9 +423,144 @@ class ListarTicketsService:
         elif tecnico_id:
             tickets = self.ticket_repo.list_by_tecnico(tecnico_id)
         else:
-            tickets = self.ticket_repo.list_all()
+            tickets = self.ticket_repo.iter_all()
         
         return [TicketOutputDTO.from_entity(t) for t in tickets]
+    
+    def execute_com_estatisticas(
+        self,
+        status: Optional[str] = None,
+        criador_id: Optional[str] = None,
+        tecnico_id: Optional[str] = None,
+        prioridade: Optional[str] = None,
+        pagina: Optional[int] = None,
+        por_pagina: Optional[int] = None,
+        limitar_pagina: bool = True,
+        completo: bool = False,
+    ) -> Tuple[List[TicketOutputDTO], dict]:
+        """
+        Lista tickets e retorna a contagem por status na mesma consulta.
+        
+        Com por_pagina, só a página pedida é carregada (LIMIT/OFFSET no
+        repositório); páginas além da última caem na última, a menos que
+        limitar_pagina seja False (aí a página sai vazia).
+        
+        Args:
+            status: Filtrar por status (nome do enum)
+            criador_id: Filtrar por criador
+            tecnico_id: Filtrar por técnico
+            prioridade: Filtrar por prioridade (valor ou nome do enum)
+            pagina: Página (1-indexed; default 1)
+            por_pagina: Itens por página (None = lista completa)
+            limitar_pagina: Trocar página além da última pela última
+            completo: Carregar todos os campos; sem ele os DTOs saem das
+                entidades de listagem (descricao vazia, tags [])
+            
+        Returns:
+            Tupla (DTOs, {"total": int, "filtrados": int,
+            "por_status": {status: int}})
+            
+        Raises:
+            ValidationError: Se status ou prioridade forem inválidos
+        """
+        ticket_status = None
+        if status:
+            try:
+                ticket_status = TicketStatus[status.upper().replace(" ", "_")]
+            except KeyError:
+                raise ValidationError(f"Status inválido: {status}", field="status")
+        
+        ticket_prioridade = None
+        if prioridade:
+            try:
+                ticket_prioridade = TicketPriority(prioridade)
+            except ValueError:
+                try:
+                    ticket_prioridade = TicketPriority[prioridade.upper()]
+                except KeyError:
+                    raise ValidationError(
+                        f"Prioridade inválida: {prioridade}", field="prioridade"
+                    )
+        
+        filtros = {
+            "status": ticket_status,
+            "criador_id": criador_id,
+            "tecnico_id": tecnico_id,
+            "prioridade": ticket_prioridade,
+        }
+        
+        if por_pagina is None:
+            tickets, estatisticas = self.ticket_repo.list_with_status_counts(
+                **filtros, completo=completo,
+            )
+        else:
+            pagina = max(pagina or 1, 1)
+            tickets, estatisticas = self.ticket_repo.list_with_status_counts(
+                **filtros, completo=completo,
+                offset=(pagina - 1) * por_pagina, limit=por_pagina,
+            )
+            ultima = max((estatisticas["filtrados"] + por_pagina - 1) // por_pagina, 1)
+            if limitar_pagina and pagina > ultima:
+                tickets, estatisticas = self.ticket_repo.list_with_status_counts(
+                    **filtros, completo=completo,
+                    offset=(ultima - 1) * por_pagina, limit=por_pagina,
+                )
+        
+        return [TicketOutputDTO.from_entity(t) for t in tickets], estatisticas
+    
+    def listar_recentes(self, limit: int = 5) -> List[TicketOutputDTO]:
+        """
+        Lista os tickets mais recentes.
+        
+        Args:
+            limit: Máximo de tickets
+            
+        Returns:
+            Lista de DTOs, mais recentes primeiro
+        """
+        return [
+            TicketOutputDTO.from_entity(t)
+            for t in self.ticket_repo.list_recentes(limit)
+        ]
+    
+    def listar_atrasados(self, limit: int = 5) -> List[TicketOutputDTO]:
+        """
+        Lista tickets com SLA vencido.
+        
+        Args:
+            limit: Máximo de tickets
+            
+        Returns:
+            Lista de DTOs, mais atrasados primeiro
+        """
+        return [
+            TicketOutputDTO.from_entity(t)
+            for t in self.ticket_repo.list_atrasados(limit=limit)
+        ]
+    
+    def listar_por_status(self, status: str, limit: int = 5) -> List[TicketOutputDTO]:
+        """
+        Lista os tickets mais recentes de um status.
+        
+        Args:
+            status: Status a filtrar (nome do enum)
+            limit: Máximo de tickets
+            
+        Returns:
+            Lista de DTOs, mais recentes primeiro
+            
+        Raises:
+            ValidationError: Se status for inválido
+        """
+        try:
+            ticket_status = TicketStatus[status.upper().replace(" ", "_")]
+        except KeyError:
+            raise ValidationError(f"Status inválido: {status}", field="status")
+        
+        return [
+            TicketOutputDTO.from_entity(t)
+            for t in self.ticket_repo.list_by_status(ticket_status, limit=limit)
+        ]
 
 
 class ObterTicketService:
@@ -459,6 +594,30 @@ class ObterTicketService:
             )
         
         return TicketOutputDTO.from_entity(ticket)
+    
+    async def aexecute(self, ticket_id: str) -> TicketOutputDTO:
+        """
+        Versão assíncrona de execute (usa aget_by_id do repositório).
+        
+        Args:
+            ticket_id: ID do ticket
+            
+        Returns:
+            DTO com dados completos
+            
+        Raises:
+            EntityNotFoundError: Se ticket não existe
+        """
+        ticket = await self.ticket_repo.aget_by_id(ticket_id)
+        
+        if not ticket:
+            raise EntityNotFoundError(
+                f"Ticket {ticket_id} não encontrado",
+                entity_type="Ticket",
+                entity_id=ticket_id
+            )
+        
+        return TicketOutputDTO.from_entity(ticket)
 
 
 class ContarTicketsService:
@@ -473,13 +632,19 @@ class ContarTicketsService:
         """
         Retorna contagem de tickets por status.
         
+        Uma única consulta no repositório (get_estatisticas), em vez de
+        um count() mais um count_by_status() por status.
+        
         Returns:
-            Dict com estatísticas
+            Dict com estatísticas (todos os status presentes, mesmo zerados)
         """
+        estatisticas = self.ticket_repo.get_estatisticas()
+        por_status = estatisticas["por_status"]
+        
         return {
-            "total": self.ticket_repo.count(),
+            **estatisticas,
             "por_status": {
-                status.value: self.ticket_repo.count_by_status(status)
+                status.value: por_status.get(status.value, 0)
                 for status in TicketStatus
-            }
+            },
         }
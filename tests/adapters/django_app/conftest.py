@@ -42,10 +42,11 @@ def pytest_configure(config):
 
 
 @pytest.fixture(scope='session')
-def django_db_setup():
+def django_db_setup(django_db_blocker):
     """Setup do banco de dados para sessão de testes."""
     from django.core.management import call_command
-    call_command('migrate', '--run-syncdb', verbosity=0)
+    with django_db_blocker.unblock():
+        call_command('migrate', '--run-syncdb', verbosity=0)
 
 
 @pytest.fixture
@@ -57,7 +58,11 @@ def db_session(django_db_setup, db):
 @pytest.fixture
 def ticket_model_factory():
     """Factory para criar TicketModel para testes."""
-    from src.adapters.django_app.tickets.models import TicketModel
+    from src.adapters.django_app.tickets.models import (
+        TicketModel,
+        TicketStatusChoices,
+        TicketPriorityChoices,
+    )
     from django.utils import timezone
     import uuid
     
@@ -66,8 +71,8 @@ def ticket_model_factory():
             'id': str(uuid.uuid4()),
             'titulo': 'Ticket de Teste',
             'descricao': 'Descrição do ticket de teste',
-            'status': 'Aberto',
-            'prioridade': 'Média',
+            'status': TicketStatusChoices.ABERTO,
+            'prioridade': TicketPriorityChoices.MEDIA,
             'criador_id': 'user-123',
             'categoria': 'Geral',
             'criado_em': timezone.now(),
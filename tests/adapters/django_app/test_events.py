@@ -0,0 +1,180 @@
+"""
+Testes da publicação de eventos em lote por request.
+
+Cobre:
+- RequestBufferedEventPublisher dentro e fora de um request
+- publish_buffered (um publish_batch por publisher)
+- EventBatchMiddleware nos caminhos sync e async
+"""
+
+import pytest
+from unittest.mock import Mock
+
+from asgiref.sync import async_to_sync, iscoroutinefunction, sync_to_async
+from django.http import HttpResponse
+
+from src.core.tickets.events import TicketCriadoEvent, TicketFechadoEvent
+from src.adapters.django_app.events.middleware import EventBatchMiddleware
+from src.adapters.django_app.events.publishers import (
+    InMemoryEventPublisher,
+    RequestBufferedEventPublisher,
+    begin_request_buffer,
+    end_request_buffer,
+    publish_buffered,
+)
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+@pytest.fixture
+def inner():
+    """Publisher interno; publish_batch espionado para contar lotes."""
+    publisher = InMemoryEventPublisher()
+    publisher.publish_batch = Mock(wraps=publisher.publish_batch)
+    return publisher
+
+
+@pytest.fixture
+def publisher(inner):
+    """Publisher bufferizado sobre o publisher em memória."""
+    return RequestBufferedEventPublisher(inner)
+
+
+@pytest.fixture
+def eventos():
+    """Dois eventos de agregados diferentes."""
+    return [
+        TicketCriadoEvent(aggregate_id="ticket-1", criador_id="user-1"),
+        TicketFechadoEvent(aggregate_id="ticket-2"),
+    ]
+
+
+# =============================================================================
+# RequestBufferedEventPublisher / publish_buffered
+# =============================================================================
+
+class TestRequestBufferedEventPublisher:
+    """Testes para RequestBufferedEventPublisher."""
+    
+    def test_publica_direto_fora_de_request(self, publisher, inner, eventos):
+        """Sem buffer aberto, publish e publish_batch vão direto ao interno."""
+        publisher.publish(eventos[0])
+        publisher.publish_batch(eventos[1:])
+        
+        assert inner.published_events == eventos
+        inner.publish_batch.assert_called_once_with(eventos[1:])
+    
+    def test_acumula_dentro_do_buffer(self, publisher, inner, eventos):
+        """Com buffer aberto, nada é publicado até o fechamento."""
+        token = begin_request_buffer()
+        publisher.publish(eventos[0])
+        publisher.publish_batch(eventos[1:])
+        buffered = end_request_buffer(token)
+        
+        assert inner.published_events == []
+        assert buffered == [(inner, eventos[0]), (inner, eventos[1])]
+    
+    def test_buffer_fechado_volta_a_publicar_direto(self, publisher, inner, eventos):
+        """Após end_request_buffer, a publicação volta a ser imediata."""
+        end_request_buffer(begin_request_buffer())
+        
+        publisher.publish(eventos[0])
+        
+        assert inner.published_events == [eventos[0]]
+    
+    def test_publish_buffered_um_lote_por_publisher(self, inner, eventos):
+        """Deve agrupar por publisher e manter a ordem dos eventos."""
+        outro = InMemoryEventPublisher()
+        
+        publish_buffered([
+            (inner, eventos[0]),
+            (outro, eventos[1]),
+            (inner, eventos[1]),
+        ])
+        
+        inner.publish_batch.assert_called_once_with([eventos[0], eventos[1]])
+        assert outro.published_events == [eventos[1]]
+    
+    def test_publish_buffered_isola_falhas(self, inner, eventos):
+        """Falha em um publisher não impede os demais."""
+        quebrado = Mock()
+        quebrado.publish_batch.side_effect = RuntimeError("broker fora")
+        
+        publish_buffered([(quebrado, eventos[0]), (inner, eventos[1])])
+        
+        assert inner.published_events == [eventos[1]]
+
+
+# =============================================================================
+# EventBatchMiddleware
+# =============================================================================
+
+class TestEventBatchMiddleware:
+    """Testes para EventBatchMiddleware."""
+    
+    def test_sync_publica_lote_apos_resposta(self, rf, publisher, inner, eventos):
+        """Eventos da view saem em um único publish_batch após a resposta."""
+        def view(request):
+            for evento in eventos:
+                publisher.publish(evento)
+            assert inner.published_events == []
+            return HttpResponse('ok')
+        
+        middleware = EventBatchMiddleware(view)
+        response = middleware(rf.get('/'))
+        
+        assert response.status_code == 200
+        inner.publish_batch.assert_called_once_with(eventos)
+    
+    def test_sync_publica_mesmo_com_excecao(self, rf, publisher, inner, eventos):
+        """Se a view levanta, os eventos já commitados ainda são publicados."""
+        def view(request):
+            publisher.publish(eventos[0])
+            raise RuntimeError("falha na view")
+        
+        middleware = EventBatchMiddleware(view)
+        with pytest.raises(RuntimeError):
+            middleware(rf.get('/'))
+        
+        inner.publish_batch.assert_called_once_with([eventos[0]])
+        
+        # Buffer fechado: publicação seguinte é imediata
+        publisher.publish(eventos[1])
+        assert inner.published_events == eventos
+    
+    def test_async_publica_lote_apos_resposta(self, rf, publisher, inner, eventos):
+        """No caminho async, eventos publicados em thread entram no lote."""
+        async def view(request):
+            await sync_to_async(publisher.publish)(eventos[0])
+            publisher.publish(eventos[1])
+            return HttpResponse('ok')
+        
+        middleware = EventBatchMiddleware(view)
+        assert iscoroutinefunction(middleware)
+        
+        response = async_to_sync(middleware)(rf.get('/'))
+        
+        assert response.status_code == 200
+        inner.publish_batch.assert_called_once_with(eventos)
+    
+    def test_async_sem_eventos_nao_publica(self, rf, inner):
+        """Request sem eventos não chama publish_batch."""
+        async def view(request):
+            return HttpResponse('ok')
+        
+        async_to_sync(EventBatchMiddleware(view))(rf.get('/'))
+        
+        inner.publish_batch.assert_not_called()
+    
+    def test_async_publica_mesmo_com_excecao(self, rf, publisher, inner, eventos):
+        """Exceção na view async também não descarta o buffer."""
+        async def view(request):
+            publisher.publish(eventos[0])
+            raise RuntimeError("falha na view")
+        
+        with pytest.raises(RuntimeError):
+            async_to_sync(EventBatchMiddleware(view))(rf.get('/'))
+        
+        inner.publish_batch.assert_called_once_with([eventos[0]])
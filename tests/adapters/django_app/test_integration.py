@@ -19,6 +19,7 @@ Fixtures:
 
 import pytest
 from datetime import datetime, timedelta
+from unittest.mock import Mock
 
 # Configurar Django antes de importar models
 import django
@@ -98,8 +99,8 @@ class TestTicketMapper:
         assert model.id == sample_ticket_entity.id
         assert model.titulo == sample_ticket_entity.titulo
         assert model.descricao == sample_ticket_entity.descricao
-        assert model.status == sample_ticket_entity.status.value
-        assert model.prioridade == sample_ticket_entity.prioridade.value
+        assert model.get_status_display() == sample_ticket_entity.status.value
+        assert model.get_prioridade_display() == sample_ticket_entity.prioridade.value
         assert model.criador_id == sample_ticket_entity.criador_id
         assert model.categoria == sample_ticket_entity.categoria
         assert model.sla_prazo == sample_ticket_entity.sla_prazo
@@ -264,10 +265,244 @@ class TestInMemoryRepository:
             repo.save(ticket)
         
         # Contar
-        counts = repo.count_by_status()
+        counts = repo.count_grouped_by_status()
         
         assert counts.get('Aberto', 0) == 3
         assert counts.get('Em Progresso', 0) == 2
+        assert repo.count_by_status(TicketStatus.ABERTO) == 3
+
+
+# =============================================================================
+# Testes de Repository (Django)
+# =============================================================================
+
+@pytest.fixture
+def django_repo(db_session):
+    """DjangoTicketRepository sobre o banco de teste, com cache limpo."""
+    from django.core.cache import cache
+    
+    cache.clear()
+    return DjangoTicketRepository()
+
+
+def _criar_tickets(repo, quantidade):
+    """Salva `quantidade` tickets e retorna as entidades."""
+    tickets = [
+        TicketEntity.criar(
+            titulo=f"Ticket {i}",
+            descricao=f"Descrição do ticket número {i}",
+            criador_id="user-123",
+        )
+        for i in range(quantidade)
+    ]
+    for ticket in tickets:
+        repo.save(ticket)
+    return tickets
+
+
+class TestDjangoTicketRepositoryUpsert:
+    """Testes de save/save_many (INSERT ... ON CONFLICT (id) DO UPDATE)."""
+    
+    def test_save_atualiza_sem_tocar_campos_de_criacao(self, django_repo):
+        """Update deve preservar criado_em e criador_id da linha existente."""
+        ticket = _criar_tickets(django_repo, 1)[0]
+        original = TicketModel.objects.get(id=ticket.id)
+        
+        ticket.titulo = "Título alterado"
+        ticket.atribuir_a("tecnico-1")
+        ticket.criador_id = "outro-usuario"
+        ticket.criado_em = ticket.criado_em - timedelta(days=30)
+        django_repo.save(ticket)
+        
+        atualizado = TicketModel.objects.get(id=ticket.id)
+        assert TicketModel.objects.count() == 1
+        assert atualizado.titulo == "Título alterado"
+        assert atualizado.atribuido_a_id == "tecnico-1"
+        assert atualizado.get_status_display() == TicketStatus.EM_PROGRESSO.value
+        assert atualizado.criador_id == original.criador_id
+        assert atualizado.criado_em == original.criado_em
+    
+    def test_save_many_em_lotes(self, django_repo, django_assert_num_queries, monkeypatch):
+        """save_many deve gravar em um INSERT por UPSERT_BATCH_SIZE linhas."""
+        monkeypatch.setattr(DjangoTicketRepository, 'UPSERT_BATCH_SIZE', 2)
+        tickets = [
+            TicketEntity.criar(
+                titulo=f"Ticket {i}",
+                descricao=f"Descrição do ticket número {i}",
+                criador_id="user-123",
+            )
+            for i in range(5)
+        ]
+        
+        with django_assert_num_queries(3):
+            django_repo.save_many(tickets)
+        
+        assert TicketModel.objects.count() == 5
+    
+    def test_save_many_mistura_insert_e_update(self, django_repo):
+        """Lote com ids novos e existentes deve inserir e atualizar."""
+        existente = _criar_tickets(django_repo, 1)[0]
+        existente.titulo = "Título do lote"
+        novo = TicketEntity.criar(
+            titulo="Ticket novo",
+            descricao="Descrição do ticket novo do lote",
+            criador_id="user-456",
+        )
+        
+        django_repo.save_many([existente, novo])
+        
+        assert TicketModel.objects.count() == 2
+        assert TicketModel.objects.get(id=existente.id).titulo == "Título do lote"
+        assert TicketModel.objects.get(id=novo.id).criador_id == "user-456"
+    
+    def test_save_many_vazio(self, django_repo, django_assert_num_queries):
+        """Lista vazia não deve ir ao banco."""
+        with django_assert_num_queries(0):
+            django_repo.save_many([])
+
+
+class TestDjangoTicketRepositoryListagem:
+    """Testes de list_with_status_counts (projeção de listagem x completa)."""
+    
+    def test_lista_parcial_por_padrao(self, django_repo, sample_ticket_entity):
+        """Sem completo, a lista traz só LIST_FIELDS (sem descricao)."""
+        django_repo.save(sample_ticket_entity)
+        
+        tickets, counts = django_repo.list_with_status_counts(limit=10)
+        
+        assert tickets[0].descricao == ""
+        assert counts['filtrados'] == 1
+    
+    def test_lista_completa(self, django_repo, sample_ticket_entity):
+        """completo=True deve carregar descricao e tags."""
+        sample_ticket_entity.adicionar_tag("login")
+        django_repo.save(sample_ticket_entity)
+        
+        tickets, _ = django_repo.list_with_status_counts(limit=10, completo=True)
+        
+        assert tickets[0].descricao == sample_ticket_entity.descricao
+        assert tickets[0].tags == ["login"]
+
+
+class TestDjangoTicketRepositoryPaginacao:
+    """Testes de list_paginated (keyset por cursor e OFFSET)."""
+    
+    def test_cursor_round_trip(self):
+        """_decode_cursor deve devolver o que _encode_cursor recebeu."""
+        from django.utils import timezone
+        
+        criado_em = timezone.now()
+        cursor = DjangoTicketRepository._encode_cursor(criado_em, "ticket-1")
+        
+        assert DjangoTicketRepository._decode_cursor(cursor) == (criado_em, "ticket-1")
+    
+    @pytest.mark.parametrize("cursor", ["%%%", "c2VtLXNlcGFyYWRvcg==", "fHRpY2tldC0x"])
+    def test_cursor_malformado(self, cursor):
+        """Cursor malformado deve virar ValidationError no campo cursor."""
+        with pytest.raises(ValidationError) as exc_info:
+            DjangoTicketRepository._decode_cursor(cursor)
+        
+        assert exc_info.value.field == "cursor"
+    
+    def test_navegacao_por_cursor(self, django_repo):
+        """Páginas por cursor devem cobrir todos os tickets, sem repetir."""
+        _criar_tickets(django_repo, 5)
+        esperado = [
+            t.id for t in django_repo.list_paginated(per_page=10)['items']
+        ]
+        
+        vistos = []
+        cursor = None
+        while True:
+            pagina = django_repo.list_paginated(per_page=2, cursor=cursor)
+            vistos.extend(t.id for t in pagina['items'])
+            cursor = pagina['next_cursor']
+            if cursor is None:
+                break
+            assert pagina['tem_proxima']
+        
+        assert vistos == esperado
+        assert pagina['total'] == 5
+    
+    def test_navegacao_por_cursor_as_dicts_asc(self, django_repo):
+        """Cursor gerado a partir de dicts deve funcionar em ordem asc."""
+        _criar_tickets(django_repo, 3)
+        
+        primeira = django_repo.list_paginated(per_page=2, ordem='asc', as_dicts=True)
+        segunda = django_repo.list_paginated(
+            per_page=2, ordem='asc', as_dicts=True, cursor=primeira['next_cursor']
+        )
+        
+        assert len(primeira['items']) == 2
+        assert len(segunda['items']) == 1
+        assert segunda['next_cursor'] is None
+        assert segunda['tem_anterior']
+    
+    def test_cursor_exige_ordenacao_por_criado_em(self, django_repo):
+        """Cursor com outra ordenação deve ser rejeitado."""
+        cursor = DjangoTicketRepository._encode_cursor(datetime.now(), "ticket-1")
+        
+        with pytest.raises(ValidationError) as exc_info:
+            django_repo.list_paginated(ordenar_por='prioridade', cursor=cursor)
+        
+        assert exc_info.value.field == "cursor"
+    
+    def test_ordenacao_desconhecida(self, django_repo):
+        """Campo de ordenação fora da whitelist deve ser rejeitado."""
+        with pytest.raises(ValidationError) as exc_info:
+            django_repo.list_paginated(ordenar_por='descricao')
+        
+        assert exc_info.value.field == "ordenar_por"
+
+
+class TestDjangoTicketRepositoryCache:
+    """Testes do cache de agregados por versão (TICKETS_VERSION_KEY)."""
+    
+    def test_versao_so_muda_apos_commit(self, django_repo, django_capture_on_commit_callbacks):
+        """save() deve incrementar a versão no on_commit, não antes."""
+        from src.adapters.django_app.tickets.repositories import tickets_cache_version
+        
+        versao = tickets_cache_version()
+        
+        with django_capture_on_commit_callbacks() as callbacks:
+            _criar_tickets(django_repo, 1)
+            assert tickets_cache_version() == versao
+        
+        assert len(callbacks) == 1
+        callbacks[0]()
+        assert tickets_cache_version() == versao + 1
+    
+    def test_estatisticas_cacheadas_ate_nova_versao(
+        self, django_repo, django_capture_on_commit_callbacks
+    ):
+        """get_estatisticas deve servir o cache até a versão mudar."""
+        with django_capture_on_commit_callbacks(execute=True):
+            _criar_tickets(django_repo, 2)
+        assert django_repo.get_estatisticas()['total'] == 2
+        
+        # Escrita fora do repositório não muda a versão: cache mantido
+        TicketModel.objects.filter(
+            id=django_repo.list_paginated(per_page=1)['items'][0].id
+        ).delete()
+        assert django_repo.get_estatisticas()['total'] == 2
+        
+        # Nova versão: o total recalculado (1 apagado + 2 criados) difere
+        # do valor cacheado
+        with django_capture_on_commit_callbacks(execute=True):
+            _criar_tickets(django_repo, 2)
+        assert django_repo.get_estatisticas()['total'] == 3
+    
+    def test_contagem_da_listagem_invalidada_por_versao(
+        self, django_repo, django_capture_on_commit_callbacks
+    ):
+        """O total de list_paginated também segue a versão."""
+        with django_capture_on_commit_callbacks(execute=True):
+            tickets = _criar_tickets(django_repo, 3)
+        assert django_repo.list_paginated(criador_id="user-123")['total'] == 3
+        
+        with django_capture_on_commit_callbacks(execute=True):
+            django_repo.delete(tickets[0].id)
+        assert django_repo.list_paginated(criador_id="user-123")['total'] == 2
 
 
 # =============================================================================
@@ -338,6 +573,98 @@ class TestInMemoryUnitOfWork:
         assert len(uow.published_events) == 0
 
 
+class TestDjangoUnitOfWork:
+    """
+    Testes para DjangoUnitOfWork sobre o banco real.
+    
+    transactional_db: sem o atomic do teste em volta, o UoW abre o bloco
+    mais externo (COMMIT/ROLLBACK de verdade).
+    """
+    
+    @pytest.fixture
+    def publisher(self):
+        from src.adapters.django_app.events.publishers import InMemoryEventPublisher
+        
+        return InMemoryEventPublisher()
+    
+    def test_commit_persiste_e_publica(self, transactional_db, publisher, sample_ticket_entity):
+        """Commit deve gravar, publicar eventos e rodar os on_commit."""
+        from django.db import connection, transaction
+        from src.core.tickets.events import TicketCriadoEvent
+        
+        after_commit = []
+        uow = DjangoUnitOfWork(event_publisher=publisher)
+        
+        with uow:
+            DjangoTicketRepository().save(sample_ticket_entity)
+            uow.publish_event(TicketCriadoEvent(aggregate_id=sample_ticket_entity.id))
+            transaction.on_commit(lambda: after_commit.append(True))
+            assert after_commit == []
+        
+        assert uow.is_committed
+        assert TicketModel.objects.filter(id=sample_ticket_entity.id).exists()
+        assert len(publisher.published_events) == 1
+        assert after_commit == [True]
+        assert not connection.in_atomic_block
+    
+    def test_rollback_em_excecao(self, transactional_db, publisher, sample_ticket_entity):
+        """Exceção no bloco deve desfazer a escrita e descartar eventos."""
+        from django.db import connection
+        from src.core.tickets.events import TicketCriadoEvent
+        
+        uow = DjangoUnitOfWork(event_publisher=publisher)
+        
+        with pytest.raises(ValueError):
+            with uow:
+                DjangoTicketRepository().save(sample_ticket_entity)
+                uow.publish_event(TicketCriadoEvent(aggregate_id=sample_ticket_entity.id))
+                raise ValueError("Erro simulado")
+        
+        assert uow.is_rolled_back
+        assert not TicketModel.objects.filter(id=sample_ticket_entity.id).exists()
+        assert publisher.published_events == []
+        assert not connection.in_atomic_block
+    
+    def test_uow_aninhado_vira_savepoint(self, transactional_db, sample_ticket_entity):
+        """Rollback do UoW interno não desfaz o trabalho do externo."""
+        interno = TicketEntity.criar(
+            titulo="Ticket interno",
+            descricao="Descrição do ticket do UoW interno",
+            criador_id="user-789",
+        )
+        repo = DjangoTicketRepository()
+        
+        with DjangoUnitOfWork():
+            repo.save(sample_ticket_entity)
+            with pytest.raises(ValueError):
+                with DjangoUnitOfWork():
+                    repo.save(interno)
+                    raise ValueError("Erro simulado")
+        
+        assert TicketModel.objects.filter(id=sample_ticket_entity.id).exists()
+        assert not TicketModel.objects.filter(id=interno.id).exists()
+    
+    def test_falha_no_commit_desfaz(self, transactional_db, publisher, sample_ticket_entity):
+        """Falha ao gravar eventos no commit deve desfazer tudo e propagar."""
+        from django.db import connection
+        from src.core.tickets.events import TicketCriadoEvent
+        
+        event_store = Mock()
+        event_store.append_batch.side_effect = RuntimeError("store fora")
+        uow = DjangoUnitOfWork(event_publisher=publisher, event_store=event_store)
+        
+        with pytest.raises(RuntimeError):
+            with uow:
+                DjangoTicketRepository().save(sample_ticket_entity)
+                uow.publish_event(TicketCriadoEvent(aggregate_id=sample_ticket_entity.id))
+        
+        assert uow.is_rolled_back
+        assert not uow.is_committed
+        assert not TicketModel.objects.filter(id=sample_ticket_entity.id).exists()
+        assert publisher.published_events == []
+        assert not connection.in_atomic_block
+
+
 # =============================================================================
 # Testes de Integração com Use Cases
 # =============================================================================
@@ -9,7 +9,7 @@ Testa:
 
 import pytest
 import json
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
 
 # Configurar Django para testes
 import django
@@ -53,6 +53,7 @@ if not settings.configured:
     )
     django.setup()
 
+from asgiref.sync import async_to_sync
 from django.test import RequestFactory, Client
 from django.http import JsonResponse
 
@@ -119,7 +120,9 @@ class TestTicketAPIListView:
         
         # Mock do service
         mock_service = Mock()
-        mock_service.execute.return_value = [mock_ticket_output]
+        mock_service.execute_com_estatisticas.return_value = (
+            [mock_ticket_output], {'filtrados': 1}
+        )
         
         # Mock do container
         with patch('src.adapters.django_app.tickets.api_views.get_container') as mock_container:
@@ -127,14 +130,97 @@ class TestTicketAPIListView:
             
             request = rf.get('/tickets/api/')
             view = TicketAPIListView()
-            response = view.get(request)
+            response = async_to_sync(view.get)(request)
         
         assert response.status_code == 200
+        assert not response.streaming
+        assert response['Content-Type'] == 'application/json'
         data = json.loads(response.content)
         assert data['success'] is True
         assert len(data['data']) == 1
         assert data['meta']['total'] == 1
     
+    def test_get_repassa_paginacao_e_filtros(self, rf, mock_ticket_output):
+        """GET deve repassar page/per_page/prioridade e calcular o meta."""
+        from src.adapters.django_app.tickets.api_views import TicketAPIListView
+        
+        mock_service = Mock()
+        mock_service.execute_com_estatisticas.return_value = (
+            [mock_ticket_output], {'filtrados': 21}
+        )
+        
+        with patch('src.adapters.django_app.tickets.api_views.get_container') as mock_container:
+            mock_container.return_value.services.listar_tickets_service.return_value = mock_service
+            
+            request = rf.get('/tickets/api/', {'page': 3, 'per_page': 10, 'prioridade': 'Alta'})
+            view = TicketAPIListView()
+            response = async_to_sync(view.get)(request)
+        
+        mock_service.execute_com_estatisticas.assert_called_once_with(
+            status=None, prioridade='Alta', criador_id=None, tecnico_id=None,
+            pagina=3, por_pagina=10, limitar_pagina=False, completo=True,
+        )
+        data = json.loads(response.content)
+        assert data['meta'] == {'total': 21, 'page': 3, 'per_page': 10, 'total_pages': 3}
+    
+    def test_get_pagina_alem_da_ultima_vazia(self, rf):
+        """Página além da última deve voltar vazia, sem reescrever meta.page."""
+        from src.adapters.django_app.tickets.api_views import TicketAPIListView
+        
+        mock_service = Mock()
+        mock_service.execute_com_estatisticas.return_value = ([], {'filtrados': 5})
+        
+        with patch('src.adapters.django_app.tickets.api_views.get_container') as mock_container:
+            mock_container.return_value.services.listar_tickets_service.return_value = mock_service
+            
+            request = rf.get('/tickets/api/', {'page': 9})
+            view = TicketAPIListView()
+            response = async_to_sync(view.get)(request)
+        
+        assert response.status_code == 200
+        data = json.loads(response.content)
+        assert data['data'] == []
+        assert data['meta'] == {'total': 5, 'page': 9, 'per_page': 20, 'total_pages': 1}
+    
+    def test_get_prioridade_desconhecida_lista_vazia(self, rf):
+        """Prioridade desconhecida deve retornar lista vazia, não 400."""
+        from src.adapters.django_app.tickets.api_views import TicketAPIListView
+        
+        mock_service = Mock()
+        mock_service.execute_com_estatisticas.side_effect = ValidationError(
+            "Prioridade inválida: Urgente", field="prioridade"
+        )
+        
+        with patch('src.adapters.django_app.tickets.api_views.get_container') as mock_container:
+            mock_container.return_value.services.listar_tickets_service.return_value = mock_service
+            
+            request = rf.get('/tickets/api/', {'prioridade': 'Urgente'})
+            view = TicketAPIListView()
+            response = async_to_sync(view.get)(request)
+        
+        assert response.status_code == 200
+        data = json.loads(response.content)
+        assert data['data'] == []
+        assert data['meta'] == {'total': 0, 'page': 1, 'per_page': 20, 'total_pages': 0}
+    
+    def test_get_status_invalido_erro(self, rf):
+        """Status inválido continua retornando 400."""
+        from src.adapters.django_app.tickets.api_views import TicketAPIListView
+        
+        mock_service = Mock()
+        mock_service.execute_com_estatisticas.side_effect = ValidationError(
+            "Status inválido: X", field="status"
+        )
+        
+        with patch('src.adapters.django_app.tickets.api_views.get_container') as mock_container:
+            mock_container.return_value.services.listar_tickets_service.return_value = mock_service
+            
+            request = rf.get('/tickets/api/', {'status': 'X'})
+            view = TicketAPIListView()
+            response = async_to_sync(view.get)(request)
+        
+        assert response.status_code == 400
+    
     def test_post_cria_ticket(self, rf, mock_ticket_output):
         """POST deve criar novo ticket."""
         from src.adapters.django_app.tickets.api_views import TicketAPIListView
@@ -154,7 +240,7 @@ class TestTicketAPIListView:
                 content_type='application/json'
             )
             view = TicketAPIListView()
-            response = view.post(request)
+            response = async_to_sync(view.post)(request)
         
         assert response.status_code == 201
         data = json.loads(response.content)
@@ -179,7 +265,7 @@ class TestTicketAPIListView:
                 content_type='application/json'
             )
             view = TicketAPIListView()
-            response = view.post(request)
+            response = async_to_sync(view.post)(request)
         
         assert response.status_code == 400
         data = json.loads(response.content)
@@ -195,14 +281,14 @@ class TestTicketAPIDetailView:
         from src.adapters.django_app.tickets.api_views import TicketAPIDetailView
         
         mock_service = Mock()
-        mock_service.execute.return_value = mock_ticket_output
+        mock_service.aexecute = AsyncMock(return_value=mock_ticket_output)
         
         with patch('src.adapters.django_app.tickets.api_views.get_container') as mock_container:
             mock_container.return_value.services.obter_ticket_service.return_value = mock_service
             
             request = rf.get('/tickets/api/12345/')
             view = TicketAPIDetailView()
-            response = view.get(request, pk='12345678-1234-1234-1234-123456789012')
+            response = async_to_sync(view.get)(request, pk='12345678-1234-1234-1234-123456789012')
         
         assert response.status_code == 200
         data = json.loads(response.content)
@@ -214,14 +300,14 @@ class TestTicketAPIDetailView:
         from src.adapters.django_app.tickets.api_views import TicketAPIDetailView
         
         mock_service = Mock()
-        mock_service.execute.side_effect = EntityNotFoundError("Ticket", "nonexistent")
+        mock_service.aexecute = AsyncMock(side_effect=EntityNotFoundError("Ticket", "nonexistent"))
         
         with patch('src.adapters.django_app.tickets.api_views.get_container') as mock_container:
             mock_container.return_value.services.obter_ticket_service.return_value = mock_service
             
             request = rf.get('/tickets/api/nonexistent/')
             view = TicketAPIDetailView()
-            response = view.get(request, pk='nonexistent')
+            response = async_to_sync(view.get)(request, pk='nonexistent')
         
         assert response.status_code == 404
         data = json.loads(response.content)
@@ -274,6 +360,65 @@ class TestTicketAPIAtribuirView:
         assert 'tecnico_id' in data['error'].lower()
 
 
+# =============================================================================
+# Testes de Views HTML
+# =============================================================================
+
+class TestDashboardView:
+    """Testes para DashboardView (async, consultas em paralelo)."""
+
+    def test_get_renderiza_com_as_cinco_consultas(self, rf, mock_ticket_output):
+        """GET deve chamar os cinco services e renderizar o dashboard."""
+        from django.http import HttpResponse
+        from src.adapters.django_app.tickets.views import DashboardView
+
+        estatisticas = {'total': 1, 'por_status': {'Aberto': 1}}
+        listar_service = Mock()
+        listar_service.listar_recentes.return_value = [mock_ticket_output]
+        listar_service.listar_atrasados.return_value = []
+        listar_service.listar_por_status.side_effect = (
+            lambda status, limit: [mock_ticket_output] if status == 'Aberto' else []
+        )
+        contar_service = Mock()
+        contar_service.execute.return_value = estatisticas
+
+        with patch('src.adapters.django_app.tickets.views.get_container') as mock_container, \
+                patch('src.adapters.django_app.tickets.views.render') as mock_render, \
+                patch('src.adapters.django_app.tickets.views.connection') as mock_connection:
+            services = mock_container.return_value.services
+            services.listar_tickets_service.return_value = listar_service
+            services.contar_tickets_service.return_value = contar_service
+            mock_render.return_value = HttpResponse('ok')
+
+            request = rf.get('/tickets/dashboard/')
+            response = async_to_sync(DashboardView().get)(request)
+
+        assert response.status_code == 200
+        cache_control = response['Cache-Control']
+        assert 'private' in cache_control
+        assert 'max-age=0' in cache_control
+        assert 'must-revalidate' in cache_control
+
+        contar_service.execute.assert_called_once_with()
+        listar_service.listar_recentes.assert_called_once_with(limit=5)
+        listar_service.listar_atrasados.assert_called_once_with(limit=5)
+        assert sorted(c.args for c in listar_service.listar_por_status.call_args_list) == [
+            ('Aberto',), ('Em Progresso',),
+        ]
+        # Conexão da thread fechada ao fim de cada uma das cinco consultas
+        assert mock_connection.close.call_count == 5
+
+        _, template_name, context = mock_render.call_args.args
+        assert template_name == 'tickets/dashboard.html'
+        assert context == {
+            'estatisticas': estatisticas,
+            'tickets_recentes': [mock_ticket_output],
+            'tickets_atrasados': [],
+            'tickets_abertos': [mock_ticket_output],
+            'tickets_em_progresso': [],
+        }
+
+
 # =============================================================================
 # Testes de Container DI
 # =============================================================================
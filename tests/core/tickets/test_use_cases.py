@@ -436,6 +436,70 @@ class TestListarTicketsService:
         
         assert len(tickets_user1) == 1
         assert tickets_user1[0].criador_id == "user-001"
+    
+    def test_listar_com_estatisticas(self, ticket_repo):
+        """Deve listar filtrado e contar por status em uma chamada."""
+        for i in range(3):
+            ticket = TicketEntity.criar(
+                titulo=f"Ticket {i}",
+                descricao=f"Descrição do ticket número {i}",
+                criador_id="user-123",
+            )
+            ticket_repo.save(ticket)
+        
+        service = ListarTicketsService(ticket_repo)
+        
+        tickets, estatisticas = service.execute_com_estatisticas(status="Fechado")
+        
+        assert tickets == []
+        assert estatisticas["total"] == 3
+        assert estatisticas["por_status"]["Aberto"] == 3
+        assert estatisticas["por_status"]["Fechado"] == 0
+    
+    def test_listar_com_estatisticas_por_prioridade(self, ticket_repo):
+        """Deve filtrar por prioridade no repositório, sem afetar contagens."""
+        for prioridade in (TicketPriority.ALTA, TicketPriority.BAIXA):
+            ticket = TicketEntity.criar(
+                titulo=f"Ticket {prioridade.name}",
+                descricao="Descrição do ticket de teste",
+                criador_id="user-123",
+                prioridade=prioridade,
+            )
+            ticket_repo.save(ticket)
+        
+        service = ListarTicketsService(ticket_repo)
+        
+        tickets, estatisticas = service.execute_com_estatisticas(prioridade="Alta")
+        
+        assert [t.prioridade for t in tickets] == ["Alta"]
+        assert estatisticas["total"] == 2
+    
+    def test_listar_com_estatisticas_paginado(self, ticket_repo):
+        """Deve carregar só a página pedida e contar todos os filtrados."""
+        for i in range(5):
+            ticket = TicketEntity.criar(
+                titulo=f"Ticket {i}",
+                descricao=f"Descrição do ticket número {i}",
+                criador_id="user-123",
+            )
+            ticket_repo.save(ticket)
+        
+        service = ListarTicketsService(ticket_repo)
+        
+        tickets, estatisticas = service.execute_com_estatisticas(pagina=3, por_pagina=2)
+        assert len(tickets) == 1
+        assert estatisticas["filtrados"] == 5
+        
+        # Página além da última cai na última
+        tickets, _ = service.execute_com_estatisticas(pagina=10, por_pagina=2)
+        assert len(tickets) == 1
+        
+        # Sem ajuste, página além da última sai vazia
+        tickets, estatisticas = service.execute_com_estatisticas(
+            pagina=10, por_pagina=2, limitar_pagina=False
+        )
+        assert tickets == []
+        assert estatisticas["filtrados"] == 5
 
 
 class TestObterTicketService:
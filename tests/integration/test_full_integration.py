@@ -422,9 +422,9 @@ class TestEventPublisher:
         
         publisher = InMemoryEventPublisher()
         
-        event1 = TicketCriadoEvent('ticket-1', 'user-1', 'Titulo 1')
-        event2 = TicketAtribuidoEvent('ticket-2', 'tech-1')
-        event3 = TicketCriadoEvent('ticket-3', 'user-2', 'Titulo 3')
+        event1 = TicketCriadoEvent(aggregate_id='ticket-1', criador_id='user-1', titulo='Titulo 1')
+        event2 = TicketAtribuidoEvent(aggregate_id='ticket-2', tecnico_id='tech-1')
+        event3 = TicketCriadoEvent(aggregate_id='ticket-3', criador_id='user-2', titulo='Titulo 3')
         
         publisher.publish(event1)
         publisher.publish(event2)
@@ -449,7 +449,7 @@ class TestEventPublisher:
         
         publisher.register_handler('TicketCriadoEvent', test_handler)
         
-        event = TicketCriadoEvent('ticket-123', 'user-456', 'Teste')
+        event = TicketCriadoEvent(aggregate_id='ticket-123', criador_id='user-456', titulo='Teste')
         publisher.publish(event)
         
         assert len(handler_called) == 1
@@ -467,11 +467,19 @@ class TestEventPublisher:
         
         composite = CompositeEventPublisher([pub1, pub2])
         
-        event = TicketCriadoEvent('ticket-123', 'user-456', 'Teste')
+        event = TicketCriadoEvent(aggregate_id='ticket-123', criador_id='user-456', titulo='Teste')
         composite.publish(event)
         
         assert len(pub1.published_events) == 1
         assert len(pub2.published_events) == 1
+    
+    def test_evento_exige_aggregate_id(self):
+        """Evento sem aggregate_id (ausente ou vazio) deve ser rejeitado."""
+        with pytest.raises(TypeError):
+            TicketCriadoEvent(criador_id='user-1')
+        
+        with pytest.raises(ValueError):
+            TicketCriadoEvent(aggregate_id='', criador_id='user-1')
 
 
 # =============================================================================
@@ -485,7 +493,7 @@ class TestUnitOfWork:
         """UoW deve publicar eventos após commit."""
         uow = InMemoryUnitOfWork(event_publisher=event_publisher)
         
-        event = TicketCriadoEvent('ticket-123', 'user-456', 'Teste')
+        event = TicketCriadoEvent(aggregate_id='ticket-123', criador_id='user-456', titulo='Teste')
         
         with uow:
             uow.publish_event(event)
@@ -497,7 +505,7 @@ class TestUnitOfWork:
         """UoW deve descartar eventos em rollback."""
         uow = InMemoryUnitOfWork(event_publisher=event_publisher)
         
-        event = TicketCriadoEvent('ticket-123', 'user-456', 'Teste')
+        event = TicketCriadoEvent(aggregate_id='ticket-123', criador_id='user-456', titulo='Teste')
         
         try:
             with uow: